@@ -1,4 +1,4 @@
-from itertools import groupby
+import shutil
 import sys
 import textwrap
 from termcolor import colored
@@ -8,44 +8,11 @@ import re
 
 import hs.__init__ as hs
 from hs.Globals import *
+import dhs
 
 Types = hs.Symbols.Types
 
-class Operands:
-    def XADD(a: hs.Symbols.Types.Primitive, b: hs.Symbols.Types.Primitive) -> hs.Symbols.Types.Primitive:
-        """
-        `+` operator
-        """
-
-        ans = None
-        if all([type(x) is Types.Number for x in (a, b)]):
-            a: Types.Number
-            b: Types.Number
-
-            ans = Types.Number.new(a.as_number + a.as_number)
-        else:
-            a = a.toString()
-            b = b.toString()
-
-            ans = Types.String(a + b)
-
-        assert ans
-        return ans
-
-    def XSUBTRACT(a: hs.Symbols.Types.Primitive, b: hs.Symbols.Types.Primitive) -> hs.Symbols.Types.Primitive:
-        """
-        `-` operator
-        """
-
-        ans = None
-        if all([type(x) is Types.Number for x in (a, b)]):
-            a: Types.Number
-            b: Types.Number
-
-            ans = Types.Number.new(a.as_number - a.as_number)
-
-        assert ans
-        return ans
+Operands = hs.Operands
 
 # ASSIGNMENT_OPERATORS = ["=", "+=", "-=", "/=", "*=", "**=", "%="]
 # COMPARISON_OPERATORS = ["==", "!=", "===", "!==", "<", ">", "<=", ">="]
@@ -61,7 +28,7 @@ def raise_error(_message: str = "", error_type: str = "", *, reference: str = No
     def wrap_error(message: str, pre_tab: int) -> str:
         tab = " " * pre_tab
         lines = [tab]
-        width = os.get_terminal_size().columns
+        width = shutil.get_terminal_size().columns
         for i,char in enumerate(message):
             if len(lines[-1]) == width or char == "\n":
                 lines.append(tab + ("" if re.findall(r"\s", char) else char))
@@ -94,515 +61,375 @@ def raise_error(_message: str = "", error_type: str = "", *, reference: str = No
     message = "".join(message)
     message = colored(f"\n\nTraceback, most recent call:\n", "red") + tab + message
 
-    print(message)
+    context = hs.InterpreterContext.current()
+    print(message, file=context.stdout if context else sys.stdout)
 
     hs.ExecutionControl.END_CODE()
 
-class LineRange:
-    def __init__(self, line_number: int, column_start: int, column_end: int):
+LineRange = hs.Symbols.Tokens.LineRange
+
+ENGINES = ("tree", "vm")
+
+class Interpret:
+    def __init__(self, code: str, context: hs.InterpreterContext = None, safe_environment: bool = False, engine: str = "vm", *, bytecode: hs.Bytecode = None, execute: bool = True):
         """
-        Represents a range of line and column numbers in the source code.
-        Used for tracking where a token is found in the source code.
+        Parses and runs `code`
 
         Args:
-            line_number (int): The line number in the source code.
-            column_start (int): The starting column number.
-            column_end (int): The ending column number.
+            engine (str): "vm" compiles the program to bytecode for `hs.VirtualMachine`; "tree" walks the syntax
+                tree directly.
+            bytecode (Bytecode): An already-compiled program (e.g. read from a `.hsc` file) to run instead of `code`.
+            execute (bool): Run the program right away; otherwise only parse/compile it and leave `run` to the caller.
         """
-        self.line_number = line_number
-        self.column_start = column_start
-        self.column_end = column_end
+        assert engine in ENGINES, f"Invalid engine: \"{engine}\""
 
-class Interpret:
-    def __init__(self, code: str, globals: hs.Common.GlobalList = hs.Common.GlobalList(), safe_environment: bool = False):
-        self.globals: hs.Common.GlobalList = globals
+        self.context: hs.InterpreterContext = context if context is not None else hs.InterpreterContext()
+        self.globals: hs.Common.GlobalList = self.context.globals
         self.code: str = code
         self.safe_environment = safe_environment # Inside a try/catch statement
         self.status = False
+        self.engine: str = engine
+        self.program: hs.Syntax.Program = None
+        self.frame: list[hs.Common.GlobalEntry] = [] # Variables of the tree engine, by slot (see `hs.Resolver`)
+        self.transactions: hs.Transactions = hs.Transactions(self.globals) # Open `transaction` blocks of the tree engine
+        self.bytecode: hs.Bytecode = bytecode
+
+        self.handlers: dict = {
+            hs.Syntax.Declaration: self.execute_declaration,
+            hs.Syntax.Assignment: self.execute_assignment,
+            hs.Syntax.Stdout: self.execute_stdout,
+            hs.Syntax.Stdflush: lambda statement : self.stdflush(),
+            hs.Syntax.If: self.execute_if,
+            hs.Syntax.While: self.execute_while,
+            hs.Syntax.Try: self.execute_try,
+            hs.Syntax.Transaction: self.execute_transaction,
+            hs.Syntax.EndTransaction: self.execute_end_transaction,
+            hs.Syntax.FunctionDeclaration: self.execute_function,
+            hs.Syntax.ExpressionStatement: lambda statement : self.evaluate(statement.expression),
+            hs.Syntax.Pass: lambda statement : None,
+        }
+
+        self.evaluators: dict = {
+            hs.Syntax.Literal: lambda expression : expression.value,
+            hs.Syntax.Name: self.evaluate_name,
+            hs.Syntax.Unary: lambda expression : expression.function(self.evaluate(expression.operand)),
+            hs.Syntax.Binary: lambda expression : expression.function(self.evaluate(expression.left), self.evaluate(expression.right)),
+            hs.Syntax.Logical: self.evaluate_logical,
+            hs.Syntax.Conditional: self.evaluate_conditional,
+            hs.Syntax.ArrayLiteral: lambda expression : hs.Symbols.Types.Array.from_primitives([self.evaluate(x) for x in expression.elements]),
+        }
+
+        with self.context.activate():
+            try:
+                if self.bytecode is None:
+                    self.program = self.parse(self.code)
+
+                if engine == "vm" and self.bytecode is None:
+                    self.bytecode = self.compile(self.program)
+            except hs.ScriptError as error:
+                self.fail(error)
+
+        if execute and not self.status:
+            self.run()
+
+    def run(self) -> None:
+        """
+        Runs the parsed (or compiled) program
+        """
+        with self.context.activate():
+            try:
+                if self.engine == "vm":
+                    hs.VirtualMachine(self.context).run(self.bytecode)
+                else:
+                    self.execute(self.program)
+            except hs.ScriptError as error:
+                self.fail(error)
 
-        self.tokens = self.tokenize(self.code)
-        if not self.status:
-            self.execute_code(self.tokens)
-
-    def execute_code(self, _tokens: list):
-        tokens = _tokens
-        for i,line in enumerate(_tokens):
-            if any([not isinstance(x, hs.Symbols.Tokens.Token) for x in line]):
-                line = [x for x in line[0] if x]
-
-                for term_index,term in enumerate(line):
-                    if re.findall(r"^\{.*\}$", term):
-                        continue
-
-                    content = line[term_index+1][1:-1]
-
-                    # Match function:
-                    if re.findall(r"^function\W", term):
-                        fn = hs.Symbols.Tokens.Function()
-                        match = re.match(hs.Symbols.Tokens.Function.regex, term)
-                        kwd,name,args = match.group(1, 2, 3)
-                        fn.name = name
-                        fn.arguments = fn.parse_arguments(args)
-
-                        if i != 0 and _tokens[i-1] and len(_tokens[i-1]) != 0 and type(_tokens[i-1][0]) is hs.Symbols.Tokens.Decorator:
-                            decorator = _tokens[i-1][0]
-                            decorator: hs.Symbols.Tokens.Decorator
-
-                        fn.decorators.append(decorator)
-
-                    # Match if-statement:
-                    elif re.findall(r"^if\W", term):
-                        match = re.match(r"^(if).*(\(.*\))", term)
-                        kwd,condition = match.group(1, 2)
-
-                        if condition:
-                            Interpret(content, self.globals)
-
-                    # Match elif-statement:
-                    elif re.findall(r"^elif\W", term):
-                        match = re.match(r"^(elif).*(\(.*\))", term)
-                        kwd,condition = match.group(1, 2)
-
-                        if not re.findall(r"^if\W", line[0]):
-                            if self.safe_environment: self.status = "ControlFlowError";return
-                            raise_error("`elif` statements cannot be independent to a condition tree; ensure you have an `if` statement", "ControlFlowError")
-
-                        if condition:
-                            Interpret(content, self.globals)
-
-                    # Match else-statement:
-                    elif re.findall(r"^else", term):
-                        # Automatically execute the next code as if any of the statements above were true, the loop would break and never reach here
-
-                        if not re.findall(r"^if\W", line[0]):
-                            if self.safe_environment: self.status = "ControlFlowError";return
-                            raise_error("`elif` statements cannot be independent to a condition tree; ensure you have an `if` statement", "ControlFlowError")
-
-                        Interpret(content, self.globals)
-
-                    # Match try-statement:
-                    elif re.findall(r"^(try)", term):
-                        # We should do nothing here as the code is interpreted inside the `catch` condition
-                        pass
-
-                    # Match catch-statement:
-                    elif re.findall(r"^(catch)", term):
-                        if line[0] != "try":
-                            if self.safe_environment: self.status = "MisplacedCatchError";return
-                            raise_error(reference = "x0010")
-
-                        m = Interpret(content, self.globals, safe_environment=True)
-                        if m.status:
-                            pass
-
-                    # Unknown:
-                    else:
-                        print("ERROR: " + term)
-
-                continue
-
-            tokens = line
-            line = ":".join([x.string_identifier for x in line])
-
-            if not line:
-                continue
-
-            if re.findall(r"^((const|let):.*)", line):
-                if len(tokens) <= 3:
-                    if self.safe_environment: self.status = "SyntaxError";return
-                    raise_error("Not enough terms", "SyntaxError")
-                if isinstance(tokens[1], hs.Symbols.Tokens.Keyword):
-                    if self.safe_environment: self.status = "x0003";return
-                    raise_error(reference="x0003", kwd = tokens[1].token_name.lower())
-                elif type(tokens[1]) is not hs.Symbols.Tokens.Variable:
-                    if self.safe_environment: self.status = "x0008";return
-                    raise_error(reference="x0008", variable_name = tokens[1].toString())
-
-                declare,variable,operator,*value = tokens[0:3] + tokens[3:]
-                value = self.evaluate_values(value)
-                declare: hs.Symbols.Tokens.Keywords.KLet if declare == "let" else hs.Symbols.Tokens.Keywords.KConst
-                variable: hs.Symbols.Tokens.Variable
-                operator: hs.Symbols.Operators.Operator
-                if operator.classification != hs.Symbols.Operators.Classifications.match("="):
-                    if self.safe_environment: self.status = "x0001";return
-                    raise_error(reference="x0001")
-                elif self.globals.contains(variable.name):
-                    if self.safe_environment: self.status = "x0002";return
-                    raise_error(reference="x0002")
-                elif variable.name in hs.Symbols.Tokens.ReservedKeywords:
-                    if self.safe_environment: self.status = "x0003";return
-                    raise_error(reference="x0003", kwd = variable.name)
-
-                self.globals.set(variable.name, key = variable, value = value.value, type = type(value), scope = declare.token_name.upper())
-
-            elif re.findall(r"^stdout", line):
-                if len(tokens) != 2:
-                    if self.safe_environment: self.status = "x0004";return
-                    raise_error(reference="x0004")
-
-                kwd,value = tokens[0],tokens[1]
-                value = self.evaluate_values([value])
-                if value: self.stdout(value)
-
-            elif re.findall(r"^variable:operator:.*", line):
-                variable,operator,value = tokens[0],tokens[1],tokens[2:]
-                variable: hs.Symbols.Tokens.Variable
-                operator: hs.Symbols.Operators.Operator
-                value = self.evaluate_values(value)
-                if operator.classification != hs.Symbols.Operators.Classifications.match("="):
-                    if self.safe_environment: self.status = "x0001";return
-                    raise_error(reference="x0001")
-                if not self.globals.contains(variable.name):
-                    if self.safe_environment: self.status = "x0005";return
-                    raise_error(reference="x0005", variable_name = variable.name)
-
-                entry = self.globals.get(variable.name)
-                entry: hs.Common.GlobalEntry
-                if entry.scope == "CONST":
-                    if self.safe_environment: self.status = "x0006";return
-                    raise_error(reference="x0006", variable_name = variable.name)
-
-                if entry.strict and not isinstance(value, entry.type):
-                    if self.safe_environment: self.status = "x0007";return
-                    raise_error(
-                        reference="x0007",
-                        variable_name = variable.name,
-                        variable_type = value.string_identifier,
-                        target_type = entry.type.string_identifier
-                    )
-
-                self.globals.set(variable.name, value = value)
-            
-            elif line == "decorator":
-                continue
+    def fail(self, error: hs.ScriptError) -> None:
+        if self.safe_environment: self.status = error.status;return
+        raise_error(error.message, error.error_type, reference = error.reference, **error.kwargs)
 
-            else:
-                print(line)
-                pass
+    def tokenize(self, code: str) -> list[hs.Lexer.Lexeme]:
+        scanner = hs.Lexer.Scanner.get(self.context.pragmas.get("__ML_COMMENTS__"), self.context.pragmas.get("__SL_COMMENTS__"))
 
-        hs.ExecutionControl.END_CODE()
+        return list(scanner.scan(code))
+
+    def parse(self, code: str) -> hs.Syntax.Program:
+        """
+        Lexes and parses `code` once, and resolves its variables to frame slots; blocks hold their already-parsed
+        statements
+        """
+        return hs.Resolver().resolve_program(hs.Parser(self.tokenize(code)).parse_program())
 
-    def stdout(self, value: Types.String) -> None:
-        sys.stdout.write("Main.hs >> " + value.value)
-        if value.value.endswith("\n"):
+    def compile(self, program: hs.Syntax.Program) -> hs.Bytecode:
+        return hs.Compiler().compile(program)
+
+    def execute(self, block: hs.Syntax.Block) -> None:
+        if type(block) is hs.Syntax.Program: # A whole (resolved) program gets a new frame
+            self.frame = [None] * block.frame_size
+
+        handlers = self.handlers
+        for statement in block.statements:
+            handlers[type(statement)](statement)
+
+        if block.slot_count:
+            self.drop(block.first_slot)
+
+    def drop(self, first_slot: int) -> None:
+        """
+        Clears the variables of a block that has exited (and of any block inside it)
+        """
+        self.frame[first_slot:] = [None] * (len(self.frame) - first_slot)
+
+    def execute_declaration(self, statement: hs.Syntax.Declaration) -> None:
+        value = self.evaluate(statement.value)
+        if statement.depth != 0:
+            self.frame[statement.slot] = hs.Common.GlobalEntry(statement.name, value, type(value), statement.scope)
+            return
+
+        if self.globals.contains(statement.name):
+            raise hs.ScriptError(reference = "x0002")
+
+        self.globals.set(statement.name, key = statement.name, value = value, type = type(value), scope = statement.scope)
+        self.frame[statement.slot] = self.globals.get(statement.name)
+
+    def execute_assignment(self, statement: hs.Syntax.Assignment) -> None:
+        value = self.evaluate(statement.value)
+        entry = self.frame[statement.slot] if statement.slot is not None else self.globals.get(statement.name)
+        if entry is None:
+            raise hs.ScriptError(reference = "x0005", variable_name = statement.name)
+
+        entry: hs.Common.GlobalEntry
+        if entry.scope == "CONST":
+            raise hs.ScriptError(reference = "x0006", variable_name = statement.name)
+
+        if entry.strict and not isinstance(value, entry.type):
+            raise hs.ScriptError(
+                reference = "x0007",
+                variable_name = statement.name,
+                variable_type = value.string_identifier,
+                target_type = entry.type.string_identifier
+            )
+
+        if self.transactions.epoch:
+            if statement.slot is not None:
+                entry = self.transactions.writable(self.frame, statement.slot)
+            else:
+                entry = self.transactions.writable_global(statement.name)
+
+        entry.assign(value)
+
+    def execute_stdout(self, statement: hs.Syntax.Stdout) -> None:
+        value = self.evaluate(statement.value)
+        if value: self.stdout(value)
+
+    def execute_if(self, statement: hs.Syntax.If) -> None:
+        for condition,block in statement.branches:
+            if self.evaluate(condition).boolean():
+                self.execute(block)
+                return
+
+        if statement.otherwise:
+            self.execute(statement.otherwise)
+
+    def execute_while(self, statement: hs.Syntax.While) -> None:
+        while self.evaluate(statement.condition).boolean():
+            self.execute(statement.body)
+
+    def execute_try(self, statement: hs.Syntax.Try) -> None:
+        try:
+            self.execute(statement.body)
+        except hs.ScriptError:
+            self.drop(statement.body.first_slot)
+            if statement.handler:
+                self.execute(statement.handler)
+
+    def execute_transaction(self, statement: hs.Syntax.Transaction) -> None:
+        self.transactions.begin(statement.body.first_slot)
+        try:
+            self.execute(statement.body)
+        except hs.TransactionExit as exit: # `commit;` or `rollback;`
+            self.drop(statement.body.first_slot)
+            if exit.rollback:
+                self.transactions.rollback(self.frame)
+                return
+        except hs.ScriptError:
+            self.drop(statement.body.first_slot)
+            self.transactions.rollback(self.frame)
+            raise
+
+        self.transactions.commit()
+
+    def execute_end_transaction(self, statement: hs.Syntax.EndTransaction) -> None:
+        raise hs.TransactionExit(statement.rollback)
+
+    def execute_function(self, statement: hs.Syntax.FunctionDeclaration) -> None:
+        # Functions cannot be called yet; declaring one has no effect
+        pass
+
+    def stdout(self, value: Types.Primitive) -> None:
+        value = value.toString()
+        self.context.stdout.write(f"{self.context.name} >> " + value)
+        if value.endswith("\n"):
             self.stdflush()
 
     def stdflush(self) -> None:
-        sys.stdout.flush()
+        self.context.stdout.flush()
 
-    def evaluate_values(self, values: list) -> hs.Symbols.Types.Primitive:
+    def evaluate(self, expression: hs.Syntax.Node) -> hs.Symbols.Types.Primitive:
         """
-        Evaluates `values` to a single, primitively-parsed value
+        Evaluates `expression` to a single, primitively-parsed value
         """
+        return self.evaluators[type(expression)](expression)
+
+    def evaluate_name(self, expression: hs.Syntax.Name) -> hs.Symbols.Types.Primitive:
+        entry = self.frame[expression.slot] if expression.slot is not None else self.globals.get(expression.name)
+        if not entry:
+            raise hs.ScriptError(reference = "x0009", variable_name = expression.name)
+
+        entry: hs.Common.GlobalEntry
+        return entry.value
+
+    def evaluate_logical(self, expression: hs.Syntax.Logical) -> hs.Symbols.Types.Primitive:
+        left = self.evaluate(expression.left)
+        if left.boolean() == (expression.operator == "||"):
+            return left
+
+        return self.evaluate(expression.right)
+
+    def evaluate_conditional(self, expression: hs.Syntax.Conditional) -> hs.Symbols.Types.Primitive:
+        if self.evaluate(expression.condition).boolean():
+            return self.evaluate(expression.consequent)
+
+        return self.evaluate(expression.alternative)
+
+def collect_pragmas(code: str, context: hs.InterpreterContext) -> str:
+    """
+    Reads the leading `#PRAGMA` declarations of `code` into `context.pragmas`
+
+    Returns the remaining code, with a blank line in place of each declaration so that line numbers are unchanged
+    """
+    with context.activate():
+        match_pragma = r"^(#PRAGMA)\s*::\s*([a-zA-Z_]+[a-zA-Z_0-9]*)\s*>>\s*(.*);$"
+        code = code.split("\n")
+        for i,line in enumerate(code):
+            line = line.strip()
+            if not re.findall(match_pragma, line):
+                code = [""] * i + code[i:]
+                break
+
+            pragma,key,value = re.findall(match_pragma, line)[0]
+            if key not in context.pragmas:
+                raise_error(f"Invalid syntax for pragma declaration; the specified key `{key}` does not exist.", "IllegalPragmaDeclaration")
+
+                hs.ExecutionControl.END_CODE()
+
+            if hs.Symbols.Types.String.test(value):
+                value = hs.Symbols.Types.String.new(value).value
+            elif hs.Symbols.Types.Number.test(value):
+                value = hs.Symbols.Types.Number.new(value).as_number
+            elif hs.Symbols.Types.Boolean.test(value):
+                value = hs.Symbols.Types.Boolean.new(value).as_bool
+            else:
+                raise_error(f"Invalid syntax for pragma declaration; the specified value should be a string, number, or boolean", "IllegalPragmaDeclaration")
+                hs.ExecutionControl.END_CODE()
 
-        if len(values) == 1:
-            value = values[0]
-            if isinstance(value, hs.Symbols.Tokens.Variable):
-                value: hs.Symbols.Tokens.Variable
-                if not self.globals.get(value.name):
-                    if self.safe_environment: self.status = "x0009";return
-                    raise_error(reference="x0009", variable_name = value.name)
-                value = self.globals.get(value.name)
-                value: hs.Common.GlobalEntry
-                value = value.type.new(value.value)
-
-            return value
-
-        raise NotImplementedError
-
-    def tokenize(self, code: str):
-        string_pattern = hs.Symbols.Types.String.match_regex
-
-        depth = { "(": 0, "[": 0, "{": 0 }
-        depth_size = lambda d : d["("] + d["["] + d["{"]
-        flip_operator = lambda op : "{" if op == "}" else ("[" if op == "]" else ("(" if op == ")" else None))
-
-        parts = re.split(string_pattern, code)
-
-        tokenized_lines = [""]
-        for part in parts:
-            if not part:
-                continue
-
-            if hs.Symbols.Types.String.test(part) and depth["{"] == 0 and depth["("] == 0:
-                tokenized_lines.append([tokenized_lines[-1], hs.Symbols.Types.String.new(part)])
-                del tokenized_lines[-2]
-                tokenized_lines.append("")
-
-                continue
-
-            part = re.sub(r"(?<=[-!$%^&*()_+|~=`{}\[\]:\";'<>?,.\/])(\s+)(?=\w)|(?!\w)(\s+)(?!\w)", "", part)
-            for i,char in enumerate(part):
-                if char == "\n":
-                    if re.findall(r"[a-zA-Z0-9]$", part[:i].strip()) and re.findall(r"^[a-zA-Z0-9]", part[i:].strip()):
-                        tokenized_lines.append("")
-
-                    continue
-
-                if char in "()[]":
-                    f_char = flip_operator(char)
-                    if f_char:
-                        depth[f_char] += 1
-                    else:
-                        depth[char] -= 1
-
-                if char == "{":
-                    depth["{"] += 1
-                elif char == "}":
-                    depth["{"] -= 1
-
-                    if depth["{"] == 0:
-                        tokenized_lines[-1] += char
-                        continue
-
-                if depth_size(depth) == 0 and char == ";":
-                    tokenized_lines.append("")
-                    continue
-
-                tokenized_lines[-1] += char
-
-        tokenized_lines = [x for x in tokenized_lines if x]
-
-        def includes_depth(_code: str) -> bool:
-            _code = re.split(hs.Symbols.Types.String.match_regex, _code)
-            _code = [x for x in _code if x]
-            for term in _code:
-                if not hs.Symbols.Types.String.test(term):
-                    if "{" in term:
-                        return True
-            return False
-
-        for line_index,line in enumerate(tokenized_lines):
-            # TODO: Implement remove comments
-            if type(line) is str: line = [line]
-            line = [x.strip() if type(x) is str else x for x in line]
-
-            new_line = []
-            for term in line:
-                if isinstance(term, hs.Symbols.Types.String):
-                    new_line.append(term)
-                    continue
-
-                # Remove comments:
-                term = re.sub(getGlobal("__ML_COMMENTS__"), "", term)
-                term = re.sub(getGlobal("__SL_COMMENTS__"), "", term)
-
-                if includes_depth(term):
-                    _terms = []
-                    terms = re.split(Types.String.match_regex, term)
-                    for term in terms:
-                        if term.startswith("`") and term.endswith("`"):
-                            _terms.append(term)
-                            continue
-
-                        term: str
-                        _terms += re.split(r"(\{|\})", term)
-                    terms = _terms
-                    _terms = []
-                    _depth = 0
-                    for term in terms:
-                        if term == "{":
-                            _depth += 1
-
-                            if _depth == 1:
-                                _terms.append("")
-                        elif term == "}":
-                            _depth -= 1
-                            _terms[-1] += term
-                            continue
-
-                        if _depth == 0:
-                            _terms.append(term)
-                        else:
-                            _terms[-1] += term
-                    terms = _terms
-                    new_line.append(terms)
-                else:
-                    new_line += re.split(r"(?![_a-zA-Z0-9])(\S)|\s", term)
-
-            new_line = [x for x in new_line if x]
-            line = new_line
-
-            # Line includes decorator:
-            if line[0] == "@":
-                if len(line) != 2:
-                    if self.safe_environment: self.status = "DecorationError";return
-                    raise_error(f"Invalid syntax for decorator: \"{line}\"", "DecoratorError")
-
-                line = ["".join(line)]
-
-            # Line includes "...":
-            elif any(line[i:i+len(list("..."))] == list("...") for i in range(len(line) - len(list("...")) + 1)):
-                line = ["..." if k == "." else k for k, g in groupby(line)]
-
-            # Tokenize line:
-            for i,token in enumerate(line):
-                if type(token) is str:
-                    token = token.strip()
-
-                    # Match keyword:
-                    if token in hs.Symbols.Tokens.ReservedKeywords:
-                        token = hs.Symbols.Tokens.MatchKeyword(token)()
-
-                    # Match boolean:
-                    elif hs.Symbols.Types.Boolean.test(token):
-                        token = hs.Symbols.Types.Boolean.new(token)
-
-                    # Match number:
-                    elif hs.Symbols.Types.Number.test(token):
-                        token = hs.Symbols.Types.Number.new(token)
-
-                    # Match decorator:
-                    elif hs.Symbols.Tokens.Decorator.test(token):
-                        token = hs.Symbols.Tokens.Decorator(re.match(hs.Symbols.Tokens.Decorator.regex, token).group(0))
-
-                    # Match variable:
-                    elif re.findall(r"[a-zA-Z_][a-zA-Z_0-9]*", token):
-                        if not re.findall(r"^([a-zA-Z_]+)([a-zA-Z_0-9]*)$", token):
-                            if self.safe_environment: self.status = "x0008";return
-                            raise_error(reference="x0008", variable_name = token)
-
-                        token = hs.Symbols.Tokens.Variable(token)
-
-                    # Match operator:
-                    elif hs.Symbols.Operators.Classifications.match(token) or token in ["?", ":", ","]:
-                        token = hs.Symbols.Operators.Operator(token)
-
-                    else:
-                        # Match depth:
-                        if includes_depth("".join([x.__str__() for x in line])):
-                            continue
-
-                        if self.safe_environment: self.status = "SyntaxError";return
-                        raise_error(f"Invalid token: \"{token}\"", "SyntaxError")
-
-                elif type(token) is list:
-                    for term_index in range(0, len(token), 2):
-                        if len(token) <= term_index + 1: break
-                        raw_term,content = token[term_index],token[term_index+1]
-                        term = re.sub(r"[^a-zA-Z]+", ":", raw_term)
-                        term = term.strip(":")
-                        match = term.startswith
-                        Keywords = hs.Symbols.Tokens.Keywords
-
-                        keyword = None
-                        if match("if"): keyword = Keywords.KIf
-                        elif match("elif"): keyword = Keywords.KElif
-                        elif match("else"): keyword = Keywords.KElse
-                        elif match("try"): keyword = Keywords.KTry
-                        elif match("catch"): keyword = Keywords.KCatch
-                        elif match("case"): keyword = Keywords.KCase
-                        elif match("class"): keyword = Keywords.KClass
-                        elif match("constructor"): keyword = Keywords.KConstructor
-                        elif match("defer"): keyword = Keywords.KDefer
-                        elif match("do"): keyword = Keywords.KDo
-                        elif match("enum"): keyword = Keywords.KEnum
-                        elif match("finally"): keyword = Keywords.KFinally
-                        elif match("for"): keyword = Keywords.KFor
-                        elif match("function"): keyword = Keywords.KFunction
-                        elif match("interface"): keyword = Keywords.KInterface
-                        elif match("match"): keyword = Keywords.KMatch
-                        elif match("namespace"): keyword = Keywords.KNamespace
-                        elif match("switch"): keyword = Keywords.KSwitch
-                        elif match("throw"): keyword = Keywords.KThrow
-                        elif match("watch"): keyword = Keywords.KWatch
-                        elif match("with"): keyword = Keywords.KWith
-                        elif match("while"): keyword = Keywords.KWhile
-                        else:
-                            if self.safe_environment: self.status = "SyntaxError";return
-                            raise_error(f"Misuse of `{term}` keyword; {line}", "SyntaxError")
-
-                        keyword: hs.Symbols.Tokens.Keyword
-                        keyword = keyword.parse(token)
-
-                line[i] = token
-
-            tokenized_lines[line_index] = line
-
-        # Merge operators (e.g. ["+", "="] -> ["+="])
-        for line_index,line in enumerate(tokenized_lines):
-            operator_stack = []
-            is_operator = False
-            new_line = []
-            i = 0
-
-            # Go through each token in the line
-            while i < len(line):
-                token = line[i]
-
-                # The iter token is an operator
-                if isinstance(token, hs.Symbols.Operators.Operator) and token.classification != hs.Symbols.Operators.Classifications.GroupOperators.value:
-                    if is_operator:
-                        operator_stack.append(token)
-                    else:
-                        operator_stack = [token]
-                        is_operator = True
-
-                # The last token was an operator; this checks whether the current token is not an operator as if it is not, it should not be merged
-                if (len(operator_stack) != 0 and i + 1 >= len(line)) or (is_operator and not isinstance(token, hs.Symbols.Operators.Operator)):
-                    is_operator = False
-                    operator = hs.Symbols.Operators.Operator("".join([x.operator for x in operator_stack]))
-                    operator_stack = []
-                    i -= len(operator_stack)
-
-                    if type(token) is not hs.Symbols.Operators.Operator:
-                        new_line.append(token)
-                    else:
-                        new_line.append(operator)
+            context.pragmas.set(key, value)
+        else:
+            code = [""] * len(code) # Nothing but declarations
 
-                else:
-                    new_line.append(token)
+    return "\n".join(code)
+
+def run(code: str, context: hs.InterpreterContext = None, engine: str = "vm") -> hs.InterpreterContext:
+    """
+    Interprets `code` in its own (or the given) context and returns the context
 
-                i += 1
+    Runs share nothing, so this can be submitted to a thread or process pool:
+    ```python
+    with ThreadPoolExecutor() as pool:
+        contexts = pool.map(run, scripts)
+    ```
+    """
+    context = context if context is not None else hs.InterpreterContext()
+    code = collect_pragmas(code, context)
 
-            tokenized_lines[line_index] = new_line
+    Interpret(code, context, engine = engine)
 
-        return tokenized_lines
+    return context
+
+def run_file(path: str, context: hs.InterpreterContext = None, engine: str = "vm", cache: bool = True) -> hs.InterpreterContext:
+    """
+    Interprets the script at `path`
+
+    With the "vm" engine the compiled program is cached next to the script (`Main.hs` -> `Main.hsc`); while the
+    script, the interpreter version and the pragmas are unchanged, later runs skip the `#PRAGMA` scan, lexing and
+    parsing
+    """
+    context = context if context is not None else hs.InterpreterContext()
+    with open(path) as file:
+        code = file.read()
+
+    if engine != "vm" or not cache:
+        return run(code, context, engine)
+
+    key = hs.Cache.cache_key(code, context.pragmas, hs.__version__)
+    compiled = hs.Cache.read(hs.Cache.cache_path(path), key)
+    if compiled is not None:
+        bytecode,pragmas = compiled
+        for name,value in pragmas.items():
+            context.pragmas.set(name, value)
+
+        Interpret("", context, bytecode = bytecode)
+        return context
+
+    code = collect_pragmas(code, context)
+    instance = Interpret(code, context, execute = False)
+    if instance.bytecode is not None:
+        hs.Cache.write(hs.Cache.cache_path(path), instance.bytecode, key, context.pragmas.items())
+        instance.run()
+
+    return context
 
 if __name__ == "__main__":
-    # Get, and read input file
-    code: str = None
+    # `--engine=tree|vm` selects the execution engine
+    # `--memstats` reports the runtime memory statistics at the end of the run (to stderr); `--memstats=<seconds>`
+    # also emits them as a line of JSON every <seconds>
+    engine: str = "vm"
+    memstats: float = None
+    for argument in sys.argv[1:]:
+        if argument.startswith("--engine="):
+            engine = argument.split("=", 1)[1]
+            if engine not in ENGINES:
+                sys.exit(f"Invalid engine: \"{engine}\"; expected one of: {', '.join(ENGINES)}")
+        elif argument == "--memstats":
+            memstats = 0.0
+        elif argument.startswith("--memstats="):
+            try:
+                memstats = float(argument.split("=", 1)[1])
+                assert memstats > 0
+            except (ValueError, AssertionError):
+                sys.exit(f"Invalid interval: \"{argument.split('=', 1)[1]}\"; expected a number of seconds")
+
     input_file: str = r"prototype\Main.hs"
-    with open(input_file) as file:
-        code = file.read()
-    assert code, f"Error fetching the code..."
-
-    # Log code interpretation
-    # This has to start before `#PRAGMA` collection as it will reset all globals
-    hs.ExecutionControl.START_CODE()
-
-    # Search for #PRAGMA definitions:
-    match_pragma = r"^(#PRAGMA)\s*::\s*([a-zA-Z_]+[a-zA-Z_0-9]*)\s*>>\s*(.*);$"
-    code = code.split("\n")
-    for i,line in enumerate(code):
-        line = line.strip()
-        if not re.findall(match_pragma, line):
-            code = code[i:]
-            break
-
-        pragma,key,value = re.findall(match_pragma, line)[0]
-        if not getGlobal(key):
-            raise_error(f"Invalid syntax for pragma declaration; the specified key `{key}` does not exist.", "IllegalPragmaDeclaration")
-
-            hs.ExecutionControl.END_CODE()
-
-        if hs.Symbols.Types.String.test(value):
-            value = hs.Symbols.Types.String.new(value).real
-        elif hs.Symbols.Types.Number.test(value):
-            value = hs.Symbols.Types.Number.new(value).as_number
-        elif hs.Symbols.Types.Boolean.test(value):
-            value = hs.Symbols.Types.Boolean.new(value).as_bool
-        else:
-            raise_error(f"Invalid syntax for pragma declaration; the specified value should be a string, number, or boolean", "IllegalPragmaDeclaration")
-            hs.ExecutionControl.END_CODE()
 
-        setGlobal(key, value)
+    context = hs.InterpreterContext()
+    monitor = dhs.MemoryMonitor(context.runtime, sys.stderr, memstats) if memstats is not None else None
+    if memstats:
+        monitor.start()
 
-    code = "\n".join(code)
+    with context.activate():
+        # Log code interpretation
+        hs.ExecutionControl.START_CODE()
 
-    _globals = hs.Common.GlobalList()
+        try:
+            run_file(input_file, context, engine)
+        finally:
+            # Also when the script fails, as errors exit (through `END_CODE`) from within the run
+            if monitor is not None:
+                monitor.stop()
+                print(dhs.formatStats(monitor.sample()), file = sys.stderr)
 
-    Interpret(code, _globals)
+        hs.ExecutionControl.END_CODE()
 
 """
 Ideas:
@@ -0,0 +1,49 @@
+"""
+Measures parsing and evaluating arithmetic-heavy scripts, with and without constant folding
+
+Usage: python benchmarks/arithmetic.py [statements]
+"""
+
+import io
+import sys
+
+from common import load_interpreter, timeit
+
+def constants(statements: int) -> str:
+    return "\n".join(f"let k{i} = ({i} + 2) * 3 ** 2 - 4 / 2 + {i} % 5 * (1 + 1);" for i in range(statements))
+
+def variables(statements: int) -> str:
+    lines = ["let a = 3;", "let b = 8;", "let x = 0;"]
+    lines += [f"x = (x + a * 2 - b / 4 + {i}) % 1000;" for i in range(statements)]
+
+    return "\n".join(lines)
+
+def loop(iterations: int) -> str:
+    return f"let i = 0;\nlet s = 0;\nwhile (i < {iterations}) {{\n    s += i * 2 - (i % 3 == 0 ? 1 : 0)\n    i++\n}}"
+
+def main(statements: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    instance = interpreter.Interpret("", hs.InterpreterContext(stdout = io.StringIO()))
+
+    for name,code,count in [
+        ("constants", constants(statements), statements),
+        ("variables", variables(statements), statements),
+        ("while loop", loop(statements), statements),
+    ]:
+        lexemes = instance.tokenize(code)
+        for fold in (False, True):
+            parse = timeit(lambda : hs.Resolver().resolve_program(hs.Parser(lexemes, fold_constants = fold).parse_program()))
+            program = hs.Resolver().resolve_program(hs.Parser(lexemes, fold_constants = fold).parse_program())
+
+            def execute():
+                context = hs.InterpreterContext(stdout = io.StringIO())
+                instance = interpreter.Interpret("", context)
+                with context.activate():
+                    instance.execute(program)
+
+            seconds = timeit(execute)
+            print(f"{name:<11} fold={str(fold):<5}  parse {parse * 1000:>8.1f} ms  execute {seconds * 1000:>8.1f} ms  {count / seconds:>10,.0f} statements/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,56 @@
+"""
+Measures cold (no `.hsc` file) and warm (cached bytecode) start-up of a large script
+
+Usage: python benchmarks/bytecode_cache.py [statements]
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+from common import load_interpreter, timeit, generate_source
+from arithmetic import variables
+
+def main(statements: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "Main.hs")
+        with open(path, "w") as file:
+            file.write("#PRAGMA :: __TAB_SIZE__ >> 2;\n" + generate_source(statements // 6) + "\n" + variables(statements // 2))
+
+        cached = hs.Cache.cache_path(path)
+
+        def cold():
+            if os.path.exists(cached):
+                os.remove(cached)
+
+            interpreter.run_file(path, hs.InterpreterContext(stdout = io.StringIO()))
+
+        def warm():
+            interpreter.run_file(path, hs.InterpreterContext(stdout = io.StringIO()))
+
+        def execute_only():
+            context = hs.InterpreterContext(stdout = io.StringIO())
+            with context.activate():
+                hs.VirtualMachine(context).run(bytecode)
+
+        cold_seconds = timeit(cold)
+        warm_seconds = timeit(warm)
+
+        key = hs.Cache.cache_key(open(path).read(), hs.InterpreterContext().pragmas, hs.__version__)
+        bytecode,_ = hs.Cache.read(cached, key)
+        load_seconds = timeit(hs.Cache.read, cached, key)
+        execute_seconds = timeit(execute_only)
+
+        print(f"source {os.path.getsize(path) / 1024:,.0f} KiB  bytecode {os.path.getsize(cached) / 1024:,.0f} KiB")
+        print(f"cold   {cold_seconds * 1000:>9.1f} ms  (lex + parse + compile + write + execute)")
+        print(f"warm   {warm_seconds * 1000:>9.1f} ms  (read + execute)")
+        print(f"  read {load_seconds * 1000:>9.1f} ms")
+        print(f"  execute {execute_seconds * 1000:>6.1f} ms")
+        print(f"start-up excluding execution: cold {(cold_seconds - execute_seconds) * 1000:.1f} ms, warm {(warm_seconds - execute_seconds) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60_000)
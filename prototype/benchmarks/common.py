@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+import importlib.util
+
+PROTOTYPE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROTOTYPE not in sys.path:
+    sys.path.insert(0, PROTOTYPE)
+
+def load_interpreter():
+    """
+    Loads `prototype/__init__.py` (the interpreter) as a module without running its `__main__` block
+    """
+    spec = importlib.util.spec_from_file_location("hamenscript", os.path.join(PROTOTYPE, "__init__.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+def timeit(fn, *args, repeat: int = 3, **kwargs) -> float:
+    """
+    Returns the best wall-clock time (in seconds) of `repeat` calls to `fn`
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def generate_source(statements: int) -> str:
+    """
+    Generates a HamenScript program of roughly `statements` statements
+    """
+    lines = []
+    for i in range(statements):
+        lines.append(f"let x{i} = {i}; /* comment {i} */")
+        lines.append(f"stdout `line\\t{i}\\n`;")
+        lines.append(f"/* block {i} */ x{i} = x{i};")
+
+    return "\n".join(lines)
@@ -0,0 +1,40 @@
+"""
+Measures loops that build a string by repeated concatenation
+
+Usage: python benchmarks/concatenation.py [iterations ...] [--engine=tree|vm]
+"""
+
+import io
+import sys
+import time
+
+from common import load_interpreter
+
+def append_loop(iterations: int) -> str:
+    return "\n".join([
+        "let s = ``;", "let i = 0;",
+        f"while (i < {iterations}) {{",
+        "    s = s + `x` + i",
+        "    i = i + 1",
+        "}",
+        "stdout s;",
+    ])
+
+def main(sizes: list[int], engine: str) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    print(f"{'iterations':>10} {'seconds':>9} {'iterations/s':>13} {'output':>11}")
+    for iterations in sizes:
+        context = hs.InterpreterContext(stdout = io.StringIO())
+        start = time.perf_counter()
+        interpreter.Interpret(append_loop(iterations), context, engine = engine)
+        seconds = time.perf_counter() - start
+
+        output = len(context.stdout.getvalue())
+        print(f"{iterations:>10} {seconds:>9.2f} {iterations / seconds:>13,.0f} {output:>9,} B")
+
+if __name__ == "__main__":
+    engine = next((x.split("=", 1)[1] for x in sys.argv[1:] if x.startswith("--engine=")), "vm")
+    sizes = [int(x) for x in sys.argv[1:] if not x.startswith("--")]
+    main(sizes or [10_000, 100_000, 1_000_000], engine)
@@ -0,0 +1,45 @@
+"""
+Runs many scripts with different pragmas concurrently and checks that no run sees another's state
+
+Usage: python benchmarks/concurrency.py [scripts] [workers]
+"""
+
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from common import load_interpreter
+
+interpreter = load_interpreter()
+import hs.__init__ as hs
+
+def script(index: int) -> str:
+    return "\n".join([
+        f"#PRAGMA :: __TAB_SIZE__ >> {index % 8 + 1};",
+        f"const x{index} = `\\t{index}\\n`;",
+        f"stdout x{index};",
+    ])
+
+def expected(index: int) -> str:
+    return f"Main.hs >> {' ' * (index % 8 + 1)}{index}\n"
+
+def execute(index: int) -> str:
+    context = hs.InterpreterContext(stdout = io.StringIO())
+    interpreter.run(script(index), context)
+
+    return context.stdout.getvalue()
+
+def main(scripts: int, workers: int) -> None:
+    for Pool in (ThreadPoolExecutor, ProcessPoolExecutor):
+        start = time.perf_counter()
+        with Pool(max_workers = workers) as pool:
+            outputs = list(pool.map(execute, range(scripts)))
+        seconds = time.perf_counter() - start
+
+        mismatches = sum(output != expected(i) for i,output in enumerate(outputs))
+        print(f"{Pool.__name__:<20} {scripts} scripts  {seconds * 1000:>8.1f} ms  mismatches: {mismatches}")
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main(*(args + [1000, 8][len(args):]))
@@ -0,0 +1,41 @@
+"""
+Compares the statements per second of the tree-walking and bytecode engines
+
+Usage: python benchmarks/engines.py [statements] [--engine=tree|vm]
+"""
+
+import io
+import sys
+
+from common import load_interpreter, timeit, generate_source
+from arithmetic import variables, loop
+
+def main(statements: int, engines: list[str]) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    instance = interpreter.Interpret("", hs.InterpreterContext(stdout = io.StringIO()))
+
+    for name,code,count in [
+        ("declarations", generate_source(statements // 3), statements // 3 * 3),
+        ("variables", variables(statements), statements),
+        ("while loop", loop(statements), statements * 2),
+    ]:
+        program = instance.parse(code)
+        bytecode = instance.compile(program)
+
+        for engine in engines:
+            def execute():
+                context = hs.InterpreterContext(stdout = io.StringIO())
+                with context.activate():
+                    if engine == "vm":
+                        hs.VirtualMachine(context).run(bytecode)
+                    else:
+                        interpreter.Interpret("", context).execute(program)
+
+            seconds = timeit(execute)
+            print(f"{name:<13} {engine:<5} {seconds * 1000:>9.1f} ms  {count / seconds:>10,.0f} statements/s")
+
+if __name__ == "__main__":
+    arguments = [x for x in sys.argv[1:] if not x.startswith("--engine=")]
+    engines = [x.split("=", 1)[1] for x in sys.argv[1:] if x.startswith("--engine=")] or ["tree", "vm"]
+    main(int(arguments[0]) if arguments else 30_000, engines)
@@ -0,0 +1,49 @@
+"""
+Runs a request loop against `dhs.Runtime` with and without the garbage collector: each request allocates a few
+temporary values in its own scope, and every 10th one replaces an entry of a long-lived cache (a fixed number of
+references in the global scope), so the live data stays constant while the allocations never stop
+
+Usage: python benchmarks/gc_steady_state.py [requests] [cache entries]
+"""
+
+import sys
+import time
+
+import common # Puts the interpreter on the path
+from dhs import Runtime,TInteger,TString
+from hs.Globals import Pragmas
+
+def run(requests: int, entries: int, threshold: int) -> None:
+    pragmas = Pragmas()
+    pragmas.set("__GC_THRESHOLD__", threshold)
+    runtime = Runtime(pragmas)
+    memory = runtime.memory
+
+    cache = [runtime.reference(runtime.allocate(f"entry {i}", TString)) for i in range(entries)]
+    samples = []
+
+    start = time.perf_counter()
+    for i in range(requests):
+        with runtime.scope():
+            name = runtime.allocate(f"request {i}", TString)
+            runtime.allocate(str(i), TInteger)
+            runtime.allocate(str(i * 2), TInteger)
+            if i % 10 == 0:
+                memory.writeValue(cache[i % entries], str(runtime.reference(name).__int__()))
+
+        if (i + 1) % (requests // 5) == 0:
+            samples.append(f"{memory.size / 1024:>8,.0f}K/{memory.capacity / 1024:,.0f}K")
+    seconds = time.perf_counter() - start
+
+    stats = runtime.gcStats
+    label = f"threshold {threshold:,}" if threshold else "no collector"
+    print(f"{label:<18} {seconds:>6.2f}s  live {len(memory):>9,}  size/capacity at 20% steps: {'  '.join(samples)}")
+    if stats.collections:
+        print(f"{'':<18} {stats.collections:,} collections, {stats.valuesFreed:,} values / {stats.bytesFreed / 2 ** 20:,.1f} MB freed, pause avg {stats.totalPause / stats.collections * 1000:.2f} ms max {stats.maxPause * 1000:.2f} ms ({stats.totalPause / seconds:.0%} of the time)")
+
+def main(requests: int, entries: int) -> None:
+    for threshold in (0, 1 << 16, 1 << 20):
+        run(requests, entries, threshold)
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3])) if len(sys.argv) > 2 else main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000, 1_000)
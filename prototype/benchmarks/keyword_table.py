@@ -0,0 +1,40 @@
+"""
+Measures `import hs` time and the cost of resolving a keyword
+
+Usage: python benchmarks/keyword_table.py
+"""
+
+import subprocess
+import sys
+import time
+
+from common import PROTOTYPE, timeit
+
+def import_time(module: str, runs: int = 15) -> float:
+    """
+    Best self time (in seconds) of importing `module` while running `import hs.__init__` in a fresh interpreter
+    """
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import hs.__init__"], cwd = PROTOTYPE, check = True, capture_output = True, text = True).stderr
+        for line in output.splitlines():
+            fields = [x.strip() for x in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                times.append(int(fields[1 if module == "hs.__init__" else 0].split(":")[-1]) / 1e6)
+
+    return min(times)
+
+def main() -> None:
+    import hs.__init__ as hs
+
+    print(f"import hs            {import_time('hs.__init__') * 1000:>8.2f} ms")
+    print(f"  Keywords module    {import_time('hs.lib.Symbols.Keywords') * 1000:>8.2f} ms")
+
+    # What the scanner does for every bare name (keyword tokens and `MatchKeyword` are gone with the switch to lexemes)
+    keywords = sorted(hs.Symbols.Tokens.ReservedKeywords) * 1000
+    kinds = hs.Lexer.WORD_KINDS
+    seconds = timeit(lambda : [kinds.get(x, "variable") for x in keywords])
+    print(f"WORD_KINDS lookup    {seconds / len(keywords) * 1e9:>8.1f} ns/keyword")
+
+if __name__ == "__main__":
+    main()
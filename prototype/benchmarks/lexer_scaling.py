@@ -0,0 +1,62 @@
+"""
+Measures how lexing time grows with the size of the source code
+
+Usage: python benchmarks/lexer_scaling.py [megabytes ...] [--tokenize-max=MB]
+"""
+
+import sys
+import time
+
+from common import load_interpreter
+
+def generate_bytes(megabytes: float) -> str:
+    """
+    Generates a program of roughly `megabytes` MB made of declarations and assignments
+
+    Declarations are terminated by line breaks rather than `;`, which the language also accepts
+    """
+    target = int(megabytes * 1024 * 1024)
+    chunk = "\n".join(
+        [f"let value{i} = {i} + {i * 3} * 2" for i in range(40)] +
+        [f"value{i} = value{i + 1}; /* note */" for i in range(10)]
+    ) + "\n"
+
+    return chunk * max(1, target // len(chunk)) + "stdout `done\\n`;"
+
+def main(sizes: list[float], tokenize_max: float) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    instance = interpreter.Interpret.__new__(interpreter.Interpret)
+    instance.context = hs.InterpreterContext()
+    instance.safe_environment = False
+    instance.status = False
+
+    print(f"{'MB':>6} {'scan (s)':>10} {'scan MB/s':>10} {'tokenize (s)':>13} {'tokenize MB/s':>14}")
+    for size in sizes:
+        code = generate_bytes(size)
+        megabytes = len(code) / 1024 / 1024
+
+        scan = "-"
+        if hasattr(hs, "Lexer"):
+            scanner = hs.Lexer.Scanner.get(instance.context.pragmas.get("__ML_COMMENTS__"), instance.context.pragmas.get("__SL_COMMENTS__"))
+            start = time.perf_counter()
+            for _ in scanner.scan(code): pass
+            scan = time.perf_counter() - start
+
+        tokenize = "-"
+        if size <= tokenize_max:
+            start = time.perf_counter()
+            instance.tokenize(code)
+            tokenize = time.perf_counter() - start
+
+        fmt = lambda seconds, width : f"{seconds:>{width}.2f}" if seconds != "-" else f"{'-':>{width}}"
+        rate = lambda seconds, width : f"{megabytes / seconds:>{width}.2f}" if seconds != "-" else f"{'-':>{width}}"
+        print(f"{megabytes:>6.2f} {fmt(scan, 10)} {rate(scan, 10)} {fmt(tokenize, 13)} {rate(tokenize, 14)}")
+
+if __name__ == "__main__":
+    options = [x for x in sys.argv[1:] if x.startswith("--")]
+    sizes = [float(x) for x in sys.argv[1:] if not x.startswith("--")] or [1, 10, 100]
+    tokenize_max = float(([x.split("=")[1] for x in options if x.startswith("--tokenize-max=")] or [10])[0])
+
+    main(sizes, tokenize_max)
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of lexer throughput in tokens per second
+
+Usage: python benchmarks/lexer_throughput.py [statements]
+"""
+
+import sys
+
+from common import load_interpreter, timeit
+
+def generate(statements: int) -> str:
+    words = ["let", "const", "stdout", "true", "false", "value", "_name1", "42", "3.14", "1e9"]
+    lines = []
+    for i in range(statements):
+        lines.append(f"let v{i} = {i} + v{i} * 2 - 3.5;")
+        lines.append(f"const c{i} = true;")
+        lines.append(f"stdout `s{i}`;")
+        lines.append(" ".join(words[(i + k) % len(words)] for k in range(6)) + ";")
+
+    return "\n".join(lines)
+
+def cascade(hs, token: str) -> str:
+    """
+    The `test()` cascade `Interpret.tokenize` used before the master-regex classifier
+    """
+    import re
+
+    if token in hs.Symbols.Tokens.ReservedKeywords: return "keyword"
+    elif hs.Symbols.Types.Boolean.test(token): return "boolean"
+    elif hs.Symbols.Types.Number.test(token): return "number"
+    elif re.findall(r"^@([a-zA-Z_]+[a-zA-Z_0-9]*)$", token): return "decorator"
+    elif re.findall(r"[a-zA-Z_][a-zA-Z_0-9]*", token):
+        if not re.findall(r"^([a-zA-Z_]+)([a-zA-Z_0-9]*)$", token): return "invalid_word"
+        return "variable"
+    elif hs.Symbols.Operators.Classifications.match(token): return "operator"
+
+    return "invalid"
+
+def main(statements: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    instance = interpreter.Interpret.__new__(interpreter.Interpret)
+    instance.context = hs.InterpreterContext()
+    instance.safe_environment = False
+    instance.status = False
+
+    code = generate(statements)
+    tokens = sum(x.kind != "newline" for x in instance.tokenize(code))
+    seconds = timeit(instance.tokenize, code)
+    print(f"tokenize        {tokens:>9} tokens  {seconds * 1000:>9.1f} ms  {tokens / seconds:>12,.0f} tokens/s")
+
+    words = [x for line in code.split("\n") for x in line.rstrip(";").split(" ") if x and x[0] not in "`=+-*"]
+    seconds = timeit(lambda : [cascade(hs, x) for x in words])
+    print(f"test() cascade  {len(words):>9} words   {seconds * 1000:>9.1f} ms  {len(words) / seconds:>12,.0f} words/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,72 @@
+"""
+Counts the objects allocated for the literals of a literal-heavy script, and times a loop that compares and
+counts with small numbers
+
+Usage: python benchmarks/literal_pool.py [statements] [iterations]
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+
+from common import load_interpreter
+
+def literal_heavy(statements: int) -> str:
+    lines = ["let n = 0;", "let t = true;"]
+    for i in range(statements):
+        lines.append(f"if (n == 0 || t == false) {{ n = n + 1; }} else {{ n = n - 1; }}")
+        lines.append(f"let s{i} = `tick` + `-` + `tock`; let u{i} = n * 2 + {i % 10};")
+
+    return "\n".join(lines)
+
+def literals(node, found: list) -> list:
+    """
+    Appends the value of every `Literal` below `node` to `found`
+    """
+    Syntax = sys.modules["hs.lib.Syntax"]
+    if isinstance(node, Syntax.Literal):
+        found.append(node.value)
+    elif isinstance(node, Syntax.Node):
+        for cls in type(node).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                literals(getattr(node, name, None), found)
+    elif isinstance(node, (list, tuple)):
+        for x in node:
+            literals(x, found)
+
+    return found
+
+def main(statements: int, iterations: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    code = literal_heavy(statements)
+    occurrences = sum(x.kind in ("string", "number", "boolean") for x in interpreter.Interpret("", execute = False).tokenize(code))
+
+    tracemalloc.start()
+    instance = interpreter.Interpret(code, hs.InterpreterContext(stdout = io.StringIO()), execute = False)
+    traced,_ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    values = literals(instance.program, [])
+    constants = instance.bytecode.constants
+    print(f"literal occurrences in the source   {occurrences:>9,}")
+    print(f"literal objects in the syntax tree  {len({id(x) for x in values}):>9,}  (of {len(values):,} literal nodes)")
+    print(f"constants in the bytecode           {len(constants):>9,}  ({len({id(x) for x in constants}):,} distinct objects)")
+    print(f"memory after parsing and compiling  {traced / 2 ** 20:>9.2f} MB")
+
+    code = "\n".join([
+        "let i = 0;", "let n = 0;",
+        f"while (i < {iterations}) {{",
+        "    if (i % 2 == 0 && n >= 0) { n = n + 1; } else { n = n - 1; }",
+        "    i = i + 1",
+        "}",
+    ])
+    start = time.perf_counter()
+    interpreter.Interpret(code, hs.InterpreterContext(stdout = io.StringIO()))
+    seconds = time.perf_counter() - start
+    print(f"loop of {iterations:,} iterations       {seconds * 1000:>9.1f} ms")
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3])) if len(sys.argv) > 2 else main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000, 200_000)
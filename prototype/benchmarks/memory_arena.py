@@ -0,0 +1,52 @@
+"""
+Fills `dhs.Memory` with integers and strings and measures the time, the process memory and the reported `size`;
+pointers are not kept (values are read back by plain address) so that only the memory itself is measured
+
+Usage: python benchmarks/memory_arena.py [values]
+"""
+
+import gc
+import resource
+import sys
+import time
+
+import common # Puts the interpreter on the path
+from dhs import Memory,TInteger,TString
+
+def rss() -> int:
+    """
+    Peak resident memory of the process, in bytes
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def main(values: int) -> None:
+    gc.disable()
+    memory = Memory()
+    before = rss()
+
+    start = time.perf_counter()
+    append = memory.append
+    for i in range(values):
+        if i % 4:
+            append(str(i), TInteger)
+        else:
+            append(f"value {i}", TString)
+    seconds = time.perf_counter() - start
+    used = rss() - before
+
+    text = sum(len(str(i)) if i % 4 else len(f"value {i}") for i in range(values))
+    print(f"{values:,} values appended in {seconds:.2f} s ({seconds / values * 1e6:.2f} us each)")
+    print(f"process memory  +{used / 2 ** 20:,.1f} MB ({used / values:.1f} bytes per value)")
+    print(f"memory.size      {memory.size / 2 ** 20:,.1f} MB ({memory.size / values:.1f} bytes per value; the values have {text / values:.1f} characters on average)")
+
+    reads = min(values, 1_000_000)
+    step = max(1, values // reads)
+    start = time.perf_counter()
+    for i in range(0, step * reads, step):
+        memory.valueAt(i)
+        memory.typeAt(i)
+    seconds = time.perf_counter() - start
+    print(f"{reads:,} valueAt + typeAt in {seconds:.2f} s ({seconds / reads * 1e6:.2f} us each)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
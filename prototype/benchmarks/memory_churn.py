@@ -0,0 +1,45 @@
+"""
+Measures `dhs.Memory` under churn: a steady population of live values, and cycles that each free a random value and
+append a new one, then read a random value
+
+Usage: python benchmarks/memory_churn.py [cycles] [live values]
+"""
+
+import random
+import sys
+import time
+
+import common # Puts the interpreter on the path
+from dhs import Memory,TInteger,MemoryAddressError
+
+def main(cycles: int, live: int) -> None:
+    random.seed(0)
+    memory = Memory()
+
+    start = time.perf_counter()
+    pointers = [memory.append(str(i), TInteger) for i in range(live)]
+    fill = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(cycles):
+        index = random.randrange(live)
+        memory.delete(pointers[index])
+        pointers[index] = memory.append(str(i), TInteger)
+        memory.valueAt(pointers[random.randrange(live)])
+    seconds = time.perf_counter() - start
+
+    print(f"{live:,} live values appended in {fill * 1000:.1f} ms")
+    print(f"{cycles:,} free/append/read cycles in {seconds:.2f} s, {seconds / cycles * 1e6:.2f} us per cycle")
+
+    # A pointer to a deleted value must not read the value that reused its slot
+    stale = memory.append("1", TInteger)
+    memory.delete(stale)
+    reused = memory.append("2", TInteger)
+    try:
+        memory.valueAt(stale)
+        print("stale pointer: NOT detected")
+    except MemoryAddressError as error:
+        print(f"stale pointer (slot {int(stale)}, reused by a value of generation {reused.generation}): {error}")
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3])) if len(sys.argv) > 2 else main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, 10_000)
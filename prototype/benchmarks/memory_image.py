@@ -0,0 +1,86 @@
+"""
+Builds a heap of `dhs.Runtime` values (1 KB strings in a lookup table), writes it to an image with `snapshot` and
+measures `restore` in a fresh process: the time to resume, to the first lookup and to random reads, and the process
+memory, which only grows by the pages actually read
+
+Usage: python benchmarks/memory_image.py [heap MB] [image path]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import common # Puts the interpreter on the path
+from dhs import Runtime,TString
+from hs.Globals import Pragmas
+
+VALUE: str = "x" * 1000
+
+def rss() -> int:
+    """
+    Current resident memory of the process, in bytes
+    """
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize()
+
+def build(megabytes: int, path: str) -> None:
+    pragmas = Pragmas()
+    pragmas.set("__GC_THRESHOLD__", 0)
+    runtime = Runtime(pragmas)
+
+    start = time.perf_counter()
+    values = megabytes * 2 ** 20 // (len(VALUE) + 5)
+    for i in range(values):
+        runtime.allocate(f"{i:>10}{VALUE}"[:len(VALUE)], TString)
+    runtime.define("first", runtime.allocate("first entry", TString))
+    seconds = time.perf_counter() - start
+    print(f"build    {values:,} values, {runtime.memory.size / 2 ** 20:,.0f} MB in {seconds:.2f} s")
+
+    start = time.perf_counter()
+    written = runtime.snapshot(path)
+    seconds = time.perf_counter() - start
+    print(f"snapshot {written / 2 ** 20:,.0f} MB written in {seconds:.2f} s")
+
+def restore(path: str) -> None:
+    before = rss()
+    start = time.perf_counter()
+    runtime = Runtime.restore(path)
+    resumed = time.perf_counter() - start
+    first = runtime.memory.valueAt(runtime.lookup("first"))
+    lookup = time.perf_counter() - start
+    print(f"restore  {resumed * 1000:.1f} ms, first lookup ({first!r}) after {lookup * 1000:.1f} ms, process memory +{(rss() - before) / 2 ** 20:,.1f} MB")
+
+    memory = runtime.memory
+    values = len(memory)
+    start = time.perf_counter()
+    for i in range(0, values, max(1, values // 100)):
+        memory.valueAt(i)
+    seconds = time.perf_counter() - start
+    print(f"100 reads spread over the heap in {seconds * 1000:.1f} ms, process memory +{(rss() - before) / 2 ** 20:,.1f} MB")
+
+    start = time.perf_counter()
+    for i in range(values):
+        memory.valueAt(i)
+    seconds = time.perf_counter() - start
+    print(f"all {values:,} values read in {seconds:.2f} s, process memory +{(rss() - before) / 2 ** 20:,.1f} MB")
+    runtime.close()
+
+def main(megabytes: int, path: str) -> None:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, __file__, "build", str(megabytes), path], check = True)
+    print(f"cold start (new process, build and snapshot) {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, __file__, "restore", path], check = True)
+    print(f"warm start (new process, restore and reads) {time.perf_counter() - start:.2f} s")
+    os.remove(path)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["build"]:
+        build(int(sys.argv[2]), sys.argv[3])
+    elif sys.argv[1:2] == ["restore"]:
+        restore(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1024, sys.argv[2] if len(sys.argv) > 2 else "memory.image")
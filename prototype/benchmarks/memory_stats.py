@@ -0,0 +1,73 @@
+"""
+Measures what the statistics of `dhs.Memory` cost: appending and churning values (which keep the counters up to
+date), `stats` itself against formatting the memory with `str` (until now the only way to inspect it), and a
+`MemoryMonitor` emitting JSON while values are appended
+
+Usage: python benchmarks/memory_stats.py [values]
+"""
+
+import io
+import random
+import sys
+import time
+
+import common # Puts the interpreter on the path
+from dhs import Runtime,MemoryMonitor,TInteger,TString,formatStats
+
+def per_call(fn, calls: int) -> float:
+    """
+    Returns the time of one call to `fn()`, in microseconds
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+
+    return (time.perf_counter() - start) / calls * 1e6
+
+def main(values: int) -> None:
+    random.seed(0)
+    runtime = Runtime()
+    memory = runtime.memory
+
+    start = time.perf_counter()
+    pointers = [memory.append(str(i), TInteger) if i % 4 else memory.append(f"value {i}", TString) for i in range(values)]
+    seconds = time.perf_counter() - start
+    print(f"{values:,} values appended in {seconds:.2f} s ({seconds / values * 1e6:.2f} us each)")
+
+    start = time.perf_counter()
+    for i in range(values):
+        index = random.randrange(values)
+        if i % 3:
+            memory.writeValue(pointers[index], "y" * (i % 20)) if memory.typeAt(pointers[index]) is TString else memory.clearValue(pointers[index])
+        else:
+            memory.delete(pointers[index])
+            pointers[index] = memory.append(str(i), TInteger)
+    seconds = time.perf_counter() - start
+    print(f"{values:,} writes, clears and delete/append pairs in {seconds:.2f} s ({seconds / values * 1e6:.2f} us each)")
+
+    print(f"memory.stats()   {per_call(memory.stats, 10_000):,.1f} us")
+    print(f"runtime.stats()  {per_call(runtime.stats, 10_000):,.1f} us")
+    print(f"str(memory)      {per_call(memory.__str__, 3) / 1000:,.1f} ms")
+
+    print()
+    print(formatStats(runtime.stats()))
+    print()
+
+    for interval in (None, 0.01):
+        runtime = Runtime()
+        stream = io.StringIO()
+        monitor = MemoryMonitor(runtime, stream, interval or 1.0)
+        if interval:
+            monitor.start()
+
+        start = time.perf_counter()
+        for i in range(values):
+            runtime.memory.append(str(i), TInteger)
+        seconds = time.perf_counter() - start
+        monitor.stop()
+
+        emitting = f"while emitting JSON every {interval * 1000:.0f} ms ({stream.getvalue().count(chr(10))} samples)" if interval else "without a monitor"
+        print(f"{values:,} values appended to a new runtime {emitting} in {seconds:.2f} s ({seconds / values * 1e6:.2f} us each)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
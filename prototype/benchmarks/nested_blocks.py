@@ -0,0 +1,31 @@
+"""
+Measures how executing nested `if` blocks scales with nesting depth
+
+Usage: python benchmarks/nested_blocks.py [depth ...]
+"""
+
+import io
+import sys
+
+from common import load_interpreter, timeit
+
+def generate(depth: int, statements: int = 20) -> str:
+    # Blocks are kept on one line, which is what the statement splitter of older interpreters expects
+    body = " ".join(f"let v{depth}_{i} = {i};" for i in range(statements))
+    for level in range(depth):
+        inner = " ".join(f"let v{level}_{i} = {i};" for i in range(statements))
+        body = f"if (true) {{ {inner} {body} }}"
+
+    return body
+
+def main(depths: list[int]) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    for depth in depths:
+        code = generate(depth)
+        seconds = timeit(lambda : interpreter.Interpret(code, hs.InterpreterContext(stdout = io.StringIO())))
+        print(f"depth {depth:>3}  {seconds * 1000:>9.2f} ms  {seconds * 1e6 / (depth + 1):>9.1f} us/level")
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [1, 2, 4, 8, 16, 32])
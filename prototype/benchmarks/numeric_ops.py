@@ -0,0 +1,57 @@
+"""
+Micro-benchmarks of every arithmetic operator on int/int, int/float and float/float operands, plus a loop on the
+virtual machine
+
+Usage: python benchmarks/numeric_ops.py [calls]
+"""
+
+import io
+import sys
+import time
+
+from common import load_interpreter, timeit
+
+def per_call(fn, a, b, calls: int, repeat: int = 3) -> float:
+    """
+    Returns the best time of one call to `fn(a, b)` (in nanoseconds) over `repeat` runs of `calls` calls
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(a, b)
+        best = min(best, time.perf_counter() - start)
+
+    return best / calls * 1e9
+
+def main(calls: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    Number = hs.Symbols.Types.Number
+    operators = hs.Symbols.Operators.Classifications.ArithmeticOperators.value
+
+    operands = [
+        ("int/int", Number.new("7"), Number.new("3")),
+        ("int/float", Number.new("7"), Number.new("1.5")),
+        ("float/float", Number.new("7.25"), Number.new("1.5")),
+    ]
+
+    print(f"{'ns per operation':<16}" + "".join(f"{x:>8}" for x in operators))
+    for name,a,b in operands:
+        times = [per_call(hs.Operands.Binary[x], a, b, calls) for x in operators]
+        print(f"{name:<16}" + "".join(f"{x:>8.0f}" for x in times))
+
+    iterations = calls * 2
+    code = "\n".join([
+        "let i = 0;", "let s = 0;", "let f = 0.5;",
+        f"while (i < {iterations}) {{",
+        "    s = s + i * 3 - i % 7",
+        "    f = f * 1.0001 + i / 4",
+        "    i = i + 1",
+        "}",
+    ])
+    seconds = timeit(lambda : interpreter.Interpret(code, hs.InterpreterContext(stdout = io.StringIO())), repeat = 1)
+    print(f"vm loop, {iterations:,} iterations: {seconds:.2f} s, {iterations * 9 / seconds:,.0f} operations/s")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
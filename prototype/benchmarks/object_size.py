@@ -0,0 +1,61 @@
+"""
+Measures the size and allocation rate of primitives and lexemes
+
+Usage: python benchmarks/object_size.py [count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from common import load_interpreter
+
+def deep_size(obj) -> int:
+    """
+    Size of `obj` plus what it owns alone: its `__dict__`, and the dicts and closures stored in it
+    """
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+        for value in attributes.values():
+            if isinstance(value, dict):
+                size += sys.getsizeof(value) + sum(sys.getsizeof(x) for x in value.values())
+
+    return size
+
+def main(count: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    Types = hs.Symbols.Types
+
+    factories = [
+        ("Number", lambda i : Types.Number.of(i)),
+        ("String", lambda i : Types.String.of("x")),
+        ("Boolean", lambda i : Types.Boolean.of(True)),
+        ("Lexeme", lambda i : hs.Lexer.Lexeme("variable", "x", i, None)), # Operators and names are lexemes since the switch to an AST
+        ("LineRange", lambda i : hs.Symbols.Tokens.LineRange(1, i, i + 1)),
+    ]
+
+    print(f"{'':<10} {'bytes/object':>12} {'MB per 1M (traced)':>19} {'allocations/s':>14}")
+    for name,factory in factories:
+        gc.collect()
+        tracemalloc.start()
+        objects = [factory(i) for i in range(count)]
+        traced,_ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        size = deep_size(objects[-1])
+        del objects
+        gc.collect()
+
+        start = time.perf_counter()
+        for i in range(count):
+            factory(i)
+        seconds = time.perf_counter() - start
+
+        print(f"{name:<10} {size:>12} {traced / count * 1e6 / 2 ** 20:>19.1f} {count / seconds:>14,.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,37 @@
+"""
+Measures how fast string literals are decoded, in MB of source per second
+
+Usage: python benchmarks/string_literals.py [megabytes]
+"""
+
+import sys
+
+from common import load_interpreter, timeit
+
+def literals(size: int) -> list[tuple[str, str]]:
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit ".split(" ")
+    plain = " ".join(words[i % len(words)] for i in range(size // 6))[:size]
+    escaped = "".join(f"{words[i % len(words)]}\\t{i}\\n" for i in range(size // 12))[:size].rstrip("\\")
+
+    return [
+        ("no escapes", f"`{plain}`"),
+        ("escape every ~12 chars", f"`{escaped}`"),
+    ]
+
+def main(megabytes: float) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    String = hs.Symbols.Types.String
+
+    for name,literal in literals(int(megabytes * 2 ** 20)):
+        size = len(literal) / 2 ** 20
+        seconds = timeit(String.new, literal)
+        print(f"String.new  {name:<24} {size:>6.1f} MB  {seconds * 1000:>9.1f} ms  {size / seconds:>8.1f} MB/s")
+
+        # The whole front end: one declaration holding the literal
+        instance = interpreter.Interpret("", execute = False)
+        seconds = timeit(lambda : instance.parse(f"let s = {literal};"), repeat = 1)
+        print(f"parse       {name:<24} {size:>6.1f} MB  {seconds * 1000:>9.1f} ms  {size / seconds:>8.1f} MB/s")
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 4)
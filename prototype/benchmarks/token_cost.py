@@ -0,0 +1,60 @@
+"""
+Measures the per-token cost of type tests, token construction and `string_identifier` lookups
+
+Usage: python benchmarks/token_cost.py [calls]
+"""
+
+import sys
+import time
+
+from common import load_interpreter
+
+def per_call(fn, calls: int, repeat: int = 3) -> float:
+    """
+    Returns the best time of one call to `fn` (in nanoseconds) over `repeat` runs of `calls` calls
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best / calls * 1e9
+
+def main(calls: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    Types = hs.Symbols.Types
+    number = Types.Number.new("42")
+
+    cases = [
+        ("Number.string_identifier", lambda : Types.Number.string_identifier),
+        ("number.string_identifier", lambda : number.string_identifier),
+        ("Number.test", lambda : Types.Number.test("3.14")),
+        ("String.test", lambda : Types.String.test("`text`")),
+        ("Boolean.test", lambda : Types.Boolean.test("true")),
+        ("Number.new", lambda : Types.Number.new("3.14")),
+        ("String.new", lambda : Types.String.new("`text`")),
+        ("Boolean.new", lambda : Types.Boolean.new("true")),
+    ]
+
+    baseline = per_call(lambda : None, calls)
+    for name,fn in cases:
+        print(f"{name:<26} {per_call(fn, calls) - baseline:>9.0f} ns")
+
+    # The whole front end, per token; every literal goes through one of the constructors above
+    instance = interpreter.Interpret.__new__(interpreter.Interpret)
+    instance.context = hs.InterpreterContext()
+    instance.safe_environment = False
+    instance.status = False
+
+    code = "\n".join(f"let v{i} = {i} + 2.5 * v{i}; stdout `s{i}` + true;" for i in range(calls // 100))
+    tokens = len(instance.tokenize(code))
+    start = time.perf_counter()
+    instance.tokenize(code)
+    seconds = time.perf_counter() - start
+    print(f"{'tokenize, per token':<26} {seconds / tokens * 1e9:>9.0f} ns")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
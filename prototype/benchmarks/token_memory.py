@@ -0,0 +1,55 @@
+"""
+Reports tracemalloc numbers for the lexemes and the syntax tree of a keyword-heavy script, and how many keyword
+strings they hold
+
+Usage: python benchmarks/token_memory.py [statements]
+"""
+
+import sys
+import tracemalloc
+
+from common import load_interpreter
+
+def generate(statements: int) -> str:
+    keywords = ["let", "const", "stdout"]
+    lines = []
+    for i in range(statements):
+        keyword = keywords[i % len(keywords)]
+        lines.append(f"stdout x;" if keyword == "stdout" else f"{keyword} x{i} = {i % 10};")
+
+    return "\n".join(lines)
+
+def main(statements: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    instance = interpreter.Interpret.__new__(interpreter.Interpret)
+    instance.context = hs.InterpreterContext()
+    instance.safe_environment = False
+    instance.status = False
+
+    code = generate(statements)
+    instance.parse(generate(10)) # Warm up caches (compiled patterns, scanner)
+    print(f"{statements} statements")
+
+    for stage in ("tokenize", "parse"):
+        tracemalloc.start()
+        result = getattr(instance, stage)(code)
+        current,peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{stage:<9} retained: {current / 1024 / 1024:>8.2f} MB   peak: {peak / 1024 / 1024:>8.2f} MB")
+        del result
+
+    # The keyword numbers this benchmark reported when keywords were tokens: keywords should cost memory per
+    # distinct keyword, not per occurrence
+    lexemes = instance.tokenize(code)
+    keywords = [x.text for x in lexemes if x.kind == "keyword"]
+    print(f"{len(keywords)} keyword lexemes, {len({id(x) for x in keywords})} distinct keyword strings")
+
+    program = instance.parse(code)
+    scopes = [x.scope for x in program.statements if type(x) is hs.Syntax.Declaration]
+    print(f"{len(scopes)} declarations, {len({id(x) for x in scopes})} distinct scope strings in the syntax tree")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
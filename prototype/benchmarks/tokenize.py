@@ -0,0 +1,26 @@
+"""
+Benchmarks `Interpret.tokenize` on generated sources
+
+Usage: python benchmarks/tokenize.py [statements ...]
+"""
+
+import sys
+
+from common import load_interpreter, timeit, generate_source
+
+def main(sizes: list[int]) -> None:
+    interpreter = load_interpreter()
+
+    # Bypass `__init__` so nothing is executed; only the lexer is measured
+    instance = interpreter.Interpret.__new__(interpreter.Interpret)
+    instance.context = interpreter.hs.InterpreterContext()
+    instance.safe_environment = False
+    instance.status = False
+
+    for size in sizes:
+        code = generate_source(size)
+        seconds = timeit(instance.tokenize, code)
+        print(f"{size:>8} statements  {len(code):>10} bytes  {seconds * 1000:>10.2f} ms")
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [100, 1000, 3000])
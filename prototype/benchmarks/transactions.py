@@ -0,0 +1,116 @@
+"""
+Measures snapshots of the variables (`transaction { ... }`) against environments of a growing number of bindings;
+like `timeit`, the cyclic garbage collector is disabled while measuring
+
+Usage: python benchmarks/transactions.py [bindings ...]
+"""
+
+import gc
+import io
+import sys
+import time
+
+from common import load_interpreter
+
+def per_call(fn, calls: int) -> float:
+    """
+    Returns the time of one call to `fn()`, in microseconds
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+
+    return (time.perf_counter() - start) / calls * 1e6
+
+def loop(iterations: int, transaction: bool) -> str:
+    body = "v0 = v0 + i; if (i % 2 == 0) { rollback; }" if transaction else "v0 = v0 + i;"
+    return "\n".join([
+        "i = 0;",
+        f"while (i < {iterations}) {{",
+        f"    transaction {{ {body} }}" if transaction else f"    {body}",
+        "    i = i + 1",
+        "}",
+    ])
+
+def check(interpreter) -> None:
+    """
+    Changing a declared variable by name (`GlobalList.set`, `add_watcher`) must leave a snapshot's entry as it was
+    """
+    hs = interpreter.hs
+    Number = hs.Symbols.Types.Number
+    context = hs.InterpreterContext(stdout = io.StringIO())
+    globals = context.globals
+    globals.set("a", key = "a", value = Number.of(1), scope = "LET")
+
+    transactions = hs.Transactions(globals)
+    for rollback in (True, False):
+        changes = []
+        transactions.begin(0)
+        globals.set("a", value = Number.of(2))
+        globals.add_watcher("a", lambda old,new : changes.append((old.value, new.value)))
+        globals.set("a", value = Number.of(3))
+        transactions.rollback([]) if rollback else transactions.commit()
+
+        entry = globals.get("a")
+        expected = ("1", 0) if rollback else ("3", 1)
+        assert (entry.value.value, len(entry.onChange)) == expected, f"{'rollback' if rollback else 'commit'}: {(entry.value.value, len(entry.onChange))} != {expected}"
+        assert changes == [("2", "3")], changes
+
+    # Scripts then see the variable the host updated, and transactions over it still roll back
+    for engine in ("tree", "vm"):
+        globals.set("a", value = Number.of(4))
+        interpreter.Interpret("transaction { a = a + 1; rollback; } transaction { a = a * 10; }", context, engine = engine)
+        assert globals.get("a").value.value == "40", f"{engine}: {globals.get('a').value.value}"
+
+def main(sizes: list[int]) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    Number = hs.Symbols.Types.Number
+    check(interpreter)
+
+    print(f"{'bindings':>9} {'declare':>9} {'copy all':>10} {'begin+rollback':>15} {'first write':>12} {'lookup':>8} {'dict lookup':>12} {'script tx':>10}")
+    for bindings in sizes:
+        context = hs.InterpreterContext(stdout = io.StringIO())
+        globals = context.globals
+        start = time.perf_counter()
+        for i in range(bindings):
+            globals.set(f"v{i}", key = f"v{i}", value = Number.of(i), scope = "LET")
+        declare = time.perf_counter() - start
+
+        # What a snapshot costs without structural sharing: a copy of every (mutable) entry
+        entries = dict(globals.snapshot().items())
+        start = time.perf_counter()
+        copied = {name: entry.copy(0) for name,entry in entries.items()}
+        copy = time.perf_counter() - start
+        del copied
+
+        transactions = hs.Transactions(globals)
+        def begin_rollback():
+            transactions.begin(0)
+            transactions.rollback([])
+        def begin_write_rollback():
+            transactions.begin(0)
+            transactions.writable_global("v1").assign(Number.of(-1))
+            transactions.rollback([])
+        snapshot = per_call(begin_rollback, 100_000)
+        write = per_call(begin_write_rollback, 100_000) - snapshot
+
+        name = f"v{bindings // 2}"
+        lookup = per_call(lambda : globals.get(name), 200_000) * 1000
+        dict_lookup = per_call(lambda : entries.get(name), 200_000) * 1000
+
+        # Per iteration cost of a `transaction` block in a script (half of them rolled back)
+        iterations = 100_000
+        globals.set("i", key = "i", value = Number.of(0), scope = "LET")
+        times = []
+        for transaction in (False, True):
+            start = time.perf_counter()
+            interpreter.Interpret(loop(iterations, transaction), context)
+            times.append(time.perf_counter() - start)
+        script = (times[1] - times[0]) / iterations * 1e6
+
+        print(f"{bindings:>9,} {declare:>8.2f}s {copy * 1000:>8.1f}ms {snapshot:>13.2f}us {write:>10.2f}us {lookup:>6.0f}ns {dict_lookup:>10.0f}ns {script:>8.2f}us")
+
+if __name__ == "__main__":
+    gc.disable()
+    main([int(x) for x in sys.argv[1:]] or [1_000, 100_000, 1_000_000])
@@ -0,0 +1,71 @@
+"""
+Measures element-wise arithmetic on typed arrays against the same arithmetic as a scalar loop
+
+Usage: python benchmarks/typed_arrays.py [elements]
+"""
+
+import io
+import sys
+import time
+
+from common import load_interpreter
+
+EXPRESSION = "(a * 3 + b) / 2 - a % 7"
+
+def run(interpreter, code: str, arrays: dict) -> tuple[float, object]:
+    """
+    Runs `code` with `arrays` declared as program variables; returns the time taken and the context
+    """
+    hs = interpreter.hs
+    context = hs.InterpreterContext(stdout = io.StringIO())
+    for name,value in arrays.items():
+        context.globals.set(name, key = name, value = value, type = type(value), scope = "LET")
+
+    start = time.perf_counter()
+    interpreter.Interpret(code, context)
+
+    return time.perf_counter() - start,context
+
+def main(elements: int) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+    Array = hs.Symbols.Types.Array
+    ArrayModule = sys.modules[Array.__module__]
+
+    import numpy
+    a = Array.of(numpy.arange(elements, dtype = "int64"), "int64")
+    b = Array.of(numpy.linspace(0, 1, elements), "float64")
+
+    seconds,context = run(interpreter, f"let c = {EXPRESSION}; let d = c > 100;", {"a": a, "b": b})
+    print(f"numpy         {elements:>12,} elements  {seconds * 1000:>9.1f} ms  `{EXPRESSION}` and `c > 100`")
+
+    c = context.globals.get("c").value
+    for name in ("sum", "min", "max", "mean"):
+        start = time.perf_counter()
+        result = Array.prototype[name](c)
+        print(f"  {name:<6} {(time.perf_counter() - start) * 1000:>9.2f} ms  = {result.toString()}")
+
+    # Without NumPy (`array.array`, element by element), on fewer elements
+    small = min(elements, 1_000_000)
+    ArrayModule._numpy = False
+    a = Array(list(range(small)))
+    b = Array([x / small for x in range(small)])
+    seconds,_ = run(interpreter, f"let c = {EXPRESSION}; let d = c > 100;", {"a": a, "b": b})
+    ArrayModule._numpy = None
+    print(f"array.array   {small:>12,} elements  {seconds * 1000:>9.1f} ms  ({seconds * elements / small:.1f} s for {elements:,})")
+
+    # The same arithmetic on scalars, one element per loop iteration
+    iterations = min(elements, 100_000)
+    code = "\n".join([
+        "let i = 0;", "let s = 0;",
+        f"while (i < {iterations}) {{",
+        "    let c = (i * 3 + i / 1000) / 2 - i % 7",
+        "    s = s + c",
+        "    i = i + 1",
+        "}",
+    ])
+    seconds,_ = run(interpreter, code, {})
+    print(f"scalar loop   {iterations:>12,} iterations {seconds * 1000:>8.1f} ms  ({seconds * elements / iterations:.1f} s for {elements:,})")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
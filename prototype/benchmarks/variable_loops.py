@@ -0,0 +1,59 @@
+"""
+Measures loops that read and write many variables, with both engines
+
+Usage: python benchmarks/variable_loops.py [iterations] [--engine=tree|vm]
+"""
+
+import io
+import sys
+
+from common import load_interpreter, timeit
+
+def program_variables(iterations: int) -> str:
+    # Only variables declared by the program itself; runs on interpreters without block scopes
+    return "\n".join([
+        "let i = 0;", "let a = 1;", "let b = 2;", "let c = 3;", "let s = 0;",
+        f"while (i < {iterations}) {{",
+        "    a = b + c",
+        "    b = c - a",
+        "    c = a + i",
+        "    s = s + a - b",
+        "    i = i + 1",
+        "}",
+    ])
+
+def block_variables(iterations: int) -> str:
+    # Variables declared inside the loop body; dropped at the end of every iteration
+    return "\n".join([
+        "let i = 0;", "let s = 0;",
+        f"while (i < {iterations}) {{",
+        "    let a = i + 1",
+        "    let b = a - 2",
+        "    const c = a + b",
+        "    s = s + c - a",
+        "    i = i + 1",
+        "}",
+    ])
+
+def main(iterations: int, engines: list[str]) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    for name,code in [("program variables", program_variables(iterations)), ("block variables", block_variables(iterations))]:
+        for engine in engines:
+            def execute():
+                interpreter.Interpret(code, hs.InterpreterContext(stdout = io.StringIO()), engine = engine)
+
+            try:
+                seconds = timeit(execute)
+            except SystemExit:
+                print(f"{name:<18} {engine:<5} not supported")
+                continue
+
+            # Five statements per iteration, plus the loop condition
+            print(f"{name:<18} {engine:<5} {seconds * 1000:>9.1f} ms  {iterations * 6 / seconds:>10,.0f} statements/s")
+
+if __name__ == "__main__":
+    arguments = [x for x in sys.argv[1:] if not x.startswith("--engine=")]
+    engines = [x.split("=", 1)[1] for x in sys.argv[1:] if x.startswith("--engine=")] or ["tree", "vm"]
+    main(int(arguments[0]) if arguments else 20_000, engines)
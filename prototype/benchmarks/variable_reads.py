@@ -0,0 +1,32 @@
+"""
+Measures the cost of reading a variable holding a 1 MB string
+
+Usage: python benchmarks/variable_reads.py [reads] [--engine=tree|vm]
+"""
+
+import io
+import sys
+
+from common import load_interpreter, timeit
+
+def program(reads: int, read: bool, size: int = 1024 * 1024) -> str:
+    body = "let t = s;" if read else "...;"
+    return f"let s = `{'x' * size}`;\nlet i = 0;\nwhile (i < {reads}) {{ {body} i++ }}"
+
+def main(reads: int, engines: list[str]) -> None:
+    interpreter = load_interpreter()
+    hs = interpreter.hs
+
+    for engine in engines:
+        seconds = dict()
+        for read in (False, True):
+            instance = interpreter.Interpret(program(reads, read), hs.InterpreterContext(stdout = io.StringIO()), engine = engine, execute = False)
+            seconds[read] = timeit(instance.run, repeat = 1)
+
+        per_read = (seconds[True] - seconds[False]) / reads
+        print(f"{engine:<5} {reads:>6} reads  {seconds[True] * 1000:>10.1f} ms  ({seconds[False] * 1000:.1f} ms without the read)  {per_read * 1e6:>10.2f} us/read")
+
+if __name__ == "__main__":
+    arguments = [x for x in sys.argv[1:] if not x.startswith("--engine=")]
+    engines = [x.split("=", 1)[1] for x in sys.argv[1:] if x.startswith("--engine=")] or ["tree", "vm"]
+    main(int(arguments[0]) if arguments else 10_000, engines)
@@ -4,9 +4,15 @@
 ###                                                                           ###
 #################################################################################
 
-from typing import Type,Literal
+from typing import Type,Literal,Iterable,TextIO
+from array import array
+import json
+import mmap
 import re
 import random
+import struct
+import threading
+import time
 
 #################################################################################
 ###                                                                           ###
@@ -42,6 +48,11 @@ class MemoryAddressError(HamenScriptError):
     Error occurred regarding memory address
     """
 
+class MemoryImageError(HamenScriptError):
+    """
+    File is not a memory image, or one of another version
+    """
+
 
 ################################################################################
 ###                                                                          ###
@@ -82,6 +93,9 @@ class TMemoryType:
     typeSignature = "type"
     """ Primitive type signature """
 
+    typeTag: int = -1
+    """ Byte preceding every value of this type in `Memory` """
+
     typeClassIdentifier = "Type"
     """
     Associated prototype class
@@ -113,15 +127,27 @@ class TMemoryType:
 class TInteger(TMemoryType):
     typeSignature = "integer"
     typeClassIdentifier = "Integer"
+    typeTag: int = 1
     defaultValue: str = "0"
 
     @staticmethod
     def testValue(_value: str) -> bool:
         return True if re.findall(r"^(\d+)$", _value) else False
 
+class TFloat(TMemoryType):
+    typeSignature = "float"
+    typeClassIdentifier = "Float"
+    typeTag: int = 2
+    defaultValue: str = "0.0"
+
+    @staticmethod
+    def testValue(_value: str) -> bool:
+        return True if re.findall(r"^(-?\d+(\.\d+)?([eE][-+]?\d+)?)$", _value) else False
+
 class TEmptyValue(TMemoryType):
     typeSignature = "empty"
     typeClassIdentifier = "Empty"
+    typeTag: int = 0
     defaultValue: str = ""
 
     @staticmethod
@@ -131,6 +157,7 @@ class TEmptyValue(TMemoryType):
 class TString(TMemoryType):
     typeSignature = "string"
     typeClassIdentifier = "String"
+    typeTag: int = 3
     defaultValue: str = ""
 
     @staticmethod
@@ -140,6 +167,7 @@ class TString(TMemoryType):
 class TNull(TMemoryType):
     typeSignature: str = "null"
     typeClassIdentifier: str = "Null"
+    typeTag: int = 4
     defaultValue: str = "null"
 
     @staticmethod
@@ -148,26 +176,37 @@ class TNull(TMemoryType):
         #   though there is no reason for "_value" to not be "", even if it is, it will still be null
         return True
 
+class TReference(TMemoryType):
+    typeSignature: str = "reference"
+    typeClassIdentifier: str = "Reference"
+    typeTag: int = 5
+    defaultValue: str = "0"
+
+    @staticmethod
+    def testValue(_value: str) -> bool:
+        # The address of another value; keeps that value alive (see `Memory.collect`)
+        return True if re.findall(r"^(\d+)$", _value) else False
 
 class MemoryAddress:
-    def __init__(self, address: int = -1) -> None:
+    __slots__ = ("_address", "_generation")
+
+    def __init__(self, address: int = -1, generation: int = 0) -> None:
         """
-        Represents a pointer to a memory address
+        Represents a pointer to a memory address;
+
+        `generation` tells which use of the slot at `address` the pointer was handed out for, so that a pointer to
+        a deleted value is detected instead of reading whatever was stored in the slot afterwards
         """
         self._address: int = address
+        self._generation: int = generation
 
     @property
     def address(self) -> int:
         return self._address
 
-    @address.setter
-    def address(self, address: Type['MemoryAddress'] | int) -> None:
-        """
-        Relocates this address to the given address;
-
-        this should ONLY be used internally within the `Memory` class
-        """
-        self._address = address.__int__()
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def __int__(self) -> int:
         return self._address
@@ -175,34 +214,261 @@ class MemoryAddress:
     def __str__(self) -> str:
         return self._address.__str__()
 
+MEMORY_TYPES: dict[int, Type[TMemoryType]] = {x.typeTag: x for x in (TEmptyValue, TInteger, TFloat, TString, TNull, TReference)}
+""" Memory type of each type tag """
+
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+_REFERENCE = struct.Struct("<qI") # Address and generation of the value referred to
+
 class Memory:
-    def __init__(self):
+    def __init__(self, path: str = None, capacity: int = 1 << 16):
         """
-        Represents a dynamic, modern, RAM-like data structure
+        Represents a dynamic, modern, RAM-like data structure;
+
+        values are encoded in one arena of bytes, a growable `bytearray` or, given a `path`, a memory-mapped file.
+        Every value is a type tag byte followed by its encoding: an int64 or float64 (8 bytes), a UTF-8 string
+        (its length in 4 bytes, then its bytes), a reference to another value (its address and generation, 12
+        bytes), or nothing for `null` and empty values. Only the arena and a few
+        typed arrays are Python objects, however many values are stored
+
+        Values live in numbered slots that never move. Deleting a value frees its slot for the next `append`, and
+        bumps the slot's generation so that the pointers to the deleted value become invalid; appending, deleting
+        and reading are all O(1). The bytes of deleted (or resized) values are reclaimed by compacting the arena
+        when it would otherwise grow
         """
-        self._memory: list[list[Memory.MemoryValue, MemoryAddress]] = list()
+        self._file = open(path, "w+b") if path else None
+        if self._file:
+            self._file.truncate(capacity)
+            self._arena: bytearray | mmap.mmap = mmap.mmap(self._file.fileno(), capacity)
+        else:
+            self._arena: bytearray | mmap.mmap = bytearray(capacity)
+
+        self._end: int = 0 # Bytes of the arena in use, by values and garbage
+        self._garbage: int = 0 # Bytes of the arena left by deleted or moved values
+        self._offsets: array = array("q") # Offset of the value in each slot; -1 if the slot is free
+        self._generations: array = array("I") # Current generation of each slot
+        self._free: array = array("q") # Free slots, reused last-freed first
         self._size: int = 0 # Byte-size of entire memory
         self._length: int = 0 # Items in list
 
+        # Counters behind `stats`, kept up to date by every change rather than computed by scanning the memory
+        self._typeCounts: list[int] = [0] * len(MEMORY_TYPES) # Values of each type, by type tag
+        self._typeBytes: list[int] = [0] * len(MEMORY_TYPES) # Bytes of the values of each type, by type tag
+        self._typePeakCounts: list[int] = [0] * len(MEMORY_TYPES)
+        self._typePeakBytes: list[int] = [0] * len(MEMORY_TYPES)
+        self._peakSize: int = 0
+        self._peakLength: int = 0
+        self._allocations: int = 0 # Values appended
+        self._allocatedBytes: int = 0 # Bytes encoded, by appends and writes
+        self._deletions: int = 0
+        self._compactions: int = 0
+
     @property
     def size(self) -> int:
         """
-        Returns the size of the memory in bytes
+        Returns the size of the memory in bytes; the encoded size of every value, tags included
         """
 
         return self._size
 
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the size of the arena in bytes, used or not
+        """
+        return len(self._arena)
+
+    def __len__(self) -> int:
+        return self._length
+
     def __str__(self) -> str:
-        return "{\n" + "\n".join([f"    {x[0]} -> {x[1].value.__str__()} : {x[1].type.__name__}" for x in self._memory]) + "\n}"
+        return "{\n" + "\n".join([f"    {i} -> {self._decode(x)} : {MEMORY_TYPES[self._arena[x]].__name__}" for i,x in enumerate(self._offsets) if x >= 0]) + "\n}"
 
-    def _read(self, address: MemoryAddress | int) -> 'Memory.MemoryValue':
+    def close(self) -> None:
+        """
+        Releases the memory-mapped file or image, if any
+        """
+        if type(self._arena) is mmap.mmap:
+            self._arena.close()
+            self._arena = bytearray()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _read(self, address: MemoryAddress | int) -> int:
+        """
+        Returns the offset in the arena of the value a pointer refers to; plain integer addresses carry no
+        generation, so they can only be checked against free slots
+
+        Raises `MemoryAddressError` if there is no value at the address, or if the pointer's value was deleted (and
+        the slot reused)
+        """
         addressIndex = address.__int__()
+        offset = self._offsets[addressIndex] if 0 <= addressIndex < len(self._offsets) else -1
+
+        if offset < 0:
+            raise MemoryAddressError(f"No value at memory address: {addressIndex}")
+
+        if type(address) is MemoryAddress and address._generation != self._generations[addressIndex]:
+            raise MemoryAddressError(f"Stale memory address: {addressIndex} (its value was deleted)")
+
+        return offset
+
+    def _recordSize(self, offset: int) -> int:
+        tag = self._arena[offset]
+        if tag == TString.typeTag:
+            return 5 + _LENGTH.unpack_from(self._arena, offset + 1)[0]
+
+        elif tag == TReference.typeTag:
+            return 13
+
+        return 9 if tag == TInteger.typeTag or tag == TFloat.typeTag else 1
+
+    def _decode(self, offset: int) -> str:
+        """
+        Decodes the value at `offset` in place; strings are decoded through a `memoryview` of the arena rather
+        than a copy of their bytes
+        """
+        arena = self._arena
+        tag = arena[offset]
+        if tag == TInteger.typeTag:
+            return str(_INT64.unpack_from(arena, offset + 1)[0])
+        elif tag == TFloat.typeTag:
+            return str(_FLOAT64.unpack_from(arena, offset + 1)[0])
+        elif tag == TString.typeTag:
+            length = _LENGTH.unpack_from(arena, offset + 1)[0]
+            with memoryview(arena) as view:
+                return str(view[offset + 5:offset + 5 + length], "utf-8")
+        elif tag == TReference.typeTag:
+            return str(_REFERENCE.unpack_from(arena, offset + 1)[0])
+
+        return MEMORY_TYPES[tag].defaultValue
+
+    def _store(self, _value: str, _type: Type[TMemoryType], addressIndex: int = -1) -> int:
+        """
+        Encodes a value for the slot `addressIndex` (a new value if -1): over the slot's current value if it has the
+        same encoded size, at the end of the arena otherwise
 
-        assert 0 <= addressIndex < self._length
+        Returns the offset of the value
+        """
+        if _type is TString:
+            data = _value.encode("utf-8")
+            size = 5 + len(data)
+        elif _type is TInteger:
+            number = int(_value)
+            assert -(1 << 63) <= number < 1 << 63, f"Invalid value, '{_value}', for type: '{_type().typeClassIdentifier}' (does not fit in 64 bits)"
+            size = 9
+        elif _type is TFloat:
+            number = float(_value)
+            size = 9
+        elif _type is TReference:
+            number = int(_value)
+            assert number < len(self._offsets) and self._offsets[number] >= 0, f"Invalid value, '{_value}', for type: '{_type().typeClassIdentifier}' (no value at the address)"
+            size = 13
+        else:
+            size = 1
+
+        offset = self._offsets[addressIndex] if addressIndex >= 0 else -1
+        if offset >= 0 and self._recordSize(offset) != size:
+            self._release(offset)
+            offset = self._offsets[addressIndex] = -1 # Not moved by a compaction while making room below
+
+        tag = _type.typeTag
+        counts,sizes = self._typeCounts,self._typeBytes
+        if offset < 0:
+            if self._end + size > len(self._arena):
+                self._reserve(size)
+
+            offset = self._end
+            self._end += size
+            self._size += size
+            if self._size > self._peakSize:
+                self._peakSize = self._size
+        else:
+            # Overwritten in place, by a value of the same size
+            counts[self._arena[offset]] -= 1
+            sizes[self._arena[offset]] -= size
+
+        counts[tag] += 1
+        sizes[tag] += size
+        if sizes[tag] > self._typePeakBytes[tag]:
+            self._typePeakBytes[tag] = sizes[tag]
+        if counts[tag] > self._typePeakCounts[tag]:
+            self._typePeakCounts[tag] = counts[tag]
+        self._allocatedBytes += size
+
+        arena = self._arena
+        arena[offset] = tag
+        if _type is TString:
+            _LENGTH.pack_into(arena, offset + 1, len(data))
+            arena[offset + 5:offset + size] = data
+        elif _type is TInteger:
+            _INT64.pack_into(arena, offset + 1, number)
+        elif _type is TFloat:
+            _FLOAT64.pack_into(arena, offset + 1, number)
+        elif _type is TReference:
+            _REFERENCE.pack_into(arena, offset + 1, number, self._generations[number])
+
+        if addressIndex >= 0:
+            self._offsets[addressIndex] = offset
+
+        return offset
+
+    def _release(self, offset: int) -> None:
+        """
+        Turns the value at `offset` into garbage
+        """
+        size = self._recordSize(offset)
+        self._size -= size
+        self._garbage += size
 
-        assert len(self._memory[addressIndex]) == 2 and self._memory[addressIndex][0] == address, "Internal memory error."
+        tag = self._arena[offset]
+        self._typeCounts[tag] -= 1
+        self._typeBytes[tag] -= size
 
-        return self._memory[addressIndex][1]
+    def _reserve(self, size: int) -> None:
+        """
+        Makes room for `size` more bytes at the end of the arena; compacts it if at least half of it is garbage,
+        grows it (doubling its capacity) otherwise
+        """
+        if self._garbage >= self._end // 2:
+            self._compact()
+            if self._end + size <= len(self._arena):
+                return
+
+        capacity = max(2 * len(self._arena), self._end + size)
+        if self._file:
+            self._arena.resize(capacity)
+        elif type(self._arena) is mmap.mmap:
+            # A copy-on-write mapping of an image (see `Runtime.restore`) cannot grow; from now on it is read into
+            # a `bytearray`
+            image = self._arena
+            self._arena = bytearray(capacity)
+            self._arena[:self._end] = image[:self._end]
+            image.close()
+        else:
+            self._arena.extend(bytes(capacity - len(self._arena)))
+
+    def _compact(self) -> None:
+        """
+        Moves every value towards the start of the arena, in order, over the garbage; slots keep their values
+        """
+        arena,offsets = self._arena,self._offsets
+        end = 0
+        for slot in sorted((i for i in range(len(offsets)) if offsets[i] >= 0), key = offsets.__getitem__):
+            offset = offsets[slot]
+            size = self._recordSize(offset)
+            if offset != end:
+                arena[end:end + size] = arena[offset:offset + size]
+                offsets[slot] = end
+
+            end += size
+
+        self._end = end
+        self._garbage = 0
+        self._compactions += 1
 
     def valueAt(self, address: MemoryAddress | int) -> str:
         """
@@ -210,15 +476,15 @@ class Memory:
 
         Raises error if memory address does not exist
         """
-        return self._read(address).value
+        return self._decode(self._read(address))
 
     def sizeAt(self, address: MemoryAddress | int) -> int:
         """
-        Returns the size of the value at a given memory address
+        Returns the size of the value at a given memory address, in bytes
 
         Raises error if memory address does not exist
         """
-        return self._read(address).size
+        return self._recordSize(self._read(address))
 
     def typeAt(self, address: MemoryAddress | int) -> Type[TMemoryType]:
         """
@@ -226,23 +492,31 @@ class Memory:
 
         Raises error if memory address does not exist
         """
-        return self._read(address).type
+        return MEMORY_TYPES[self._arena[self._read(address)]]
 
     def append(self, _value: str, _type: TMemoryType) -> MemoryAddress:
         """
-        Appends a new value to memory
+        Appends a new value to memory, in the most recently freed slot if there is one
 
         Returns a pointer to the new address
         """
         assert _type.testValue(_value), f"Invalid value, '{_value}', for type: '{_type().typeClassIdentifier}'"
 
-        value = Memory.MemoryValue(_value, _type)
-        pointer = MemoryAddress(self._length) # Not `-1` because the size will +=1 after the value is added
-        self._memory.append([pointer, value])
-        self._size += value.size
+        offset = self._store(_value, _type)
+        if self._free:
+            addressIndex = self._free.pop()
+            self._offsets[addressIndex] = offset
+        else:
+            addressIndex = len(self._offsets)
+            self._offsets.append(offset)
+            self._generations.append(0)
+
         self._length += 1
+        self._allocations += 1
+        if self._length > self._peakLength:
+            self._peakLength = self._length
 
-        return pointer
+        return MemoryAddress(addressIndex, self._generations[addressIndex])
 
     def writeValue(self, address: MemoryAddress | int, value: str) -> None:
         """
@@ -250,144 +524,469 @@ class Memory:
 
         Raises error if memory address does not exist
         """
-        addressIndex = address.__int__()
-        assert 0 <= addressIndex < self._length
-
-        _type = self.typeAt(address)
+        offset = self._read(address)
+        _type = MEMORY_TYPES[self._arena[offset]]
         assert _type.testValue(value), f"Invalid value, '{value}', for type: '{_type().typeClassIdentifier}'"
 
-        self._size -= self.sizeAt(address)
-
-        self._memory[addressIndex][1].value = value
-
-        self._size += self.sizeAt(address)
+        self._store(value, _type, address.__int__())
 
     def writeType(self, address: MemoryAddress | int, type: Type[TMemoryType]) -> None:
         """
-        Writes the type at `address`
+        Writes the type at `address`; the value is kept (re-encoded for `type`), or set to the default value of
+        `type` if the address holds an empty value
 
         Raises error if memory address does not exist
         """
-        addressIndex = address.__int__()
-        assert 0 <= addressIndex < self._length
-        if self.typeAt(address) is not TEmptyValue:
-            assert type.testValue(self.valueAt(address)), f"Invalid value, '{self.valueAt(address)}', for type: '{type().typeClassIdentifier}'"
+        offset = self._read(address)
+        if MEMORY_TYPES[self._arena[offset]] is not TEmptyValue:
+            value = self._decode(offset)
+            assert type.testValue(value), f"Invalid value, '{value}', for type: '{type().typeClassIdentifier}'"
         else:
-            self._memory[addressIndex][1].type = type
-            self.writeValue(address, type.defaultValue)
-            return
+            value = type.defaultValue
 
-        self._memory[addressIndex][1].type = type
+        self._store(value, type, address.__int__())
 
     def delete(self, address: MemoryAddress | int) -> None:
         """
-        Removes something from memory
+        Removes something from memory; its slot is reused and every pointer to it becomes invalid
 
         Raises error if memory address does not exist
         """
-        addressIndex = address.__int__()
-        assert 0 <= addressIndex < self._length
+        self._read(address)
+        self._delete(address.__int__())
+
+    def _delete(self, addressIndex: int) -> None:
+        self._release(self._offsets[addressIndex])
+        self._length -= 1
+        self._deletions += 1
 
-        self._size -= self.sizeAt(address)
+        self._offsets[addressIndex] = -1
+        self._generations[addressIndex] += 1
+        self._free.append(addressIndex)
 
-        self._memory = [*self._memory[:addressIndex], *self._memory[1+addressIndex:]]
-        for i in range(addressIndex, self._length - 1):
-            self._memory[i][0].address -= 1
+    def stats(self) -> dict:
+        """
+        Returns the occupancy of the memory, from counters rather than a scan, so it is cheap enough to call at
+        any time; JSON-serializable
+
+        `values` counts every used slot, `clearedSlots` those emptied by `clearValue` (still holding an empty value),
+        `freeSlots` those waiting for the next `append`. `fragmentation` is the share of the arena in use that is
+        garbage (bytes of deleted or moved values, reclaimed by the next compaction)
+        """
+        empty = self._typeCounts[TEmptyValue.typeTag]
+
+        return {
+            "values": self._length,
+            "peakValues": self._peakLength,
+            "liveSlots": self._length - empty,
+            "clearedSlots": empty,
+            "freeSlots": len(self._free),
+            "size": self._size,
+            "peakSize": self._peakSize,
+            "used": self._end,
+            "garbage": self._garbage,
+            "capacity": len(self._arena),
+            "fragmentation": self._garbage / self._end if self._end else 0.0,
+            "allocations": self._allocations,
+            "allocatedBytes": self._allocatedBytes,
+            "deletions": self._deletions,
+            "compactions": self._compactions,
+            "types": {
+                _type.__name__: {
+                    "count": self._typeCounts[tag],
+                    "bytes": self._typeBytes[tag],
+                    "peakCount": self._typePeakCounts[tag],
+                    "peakBytes": self._typePeakBytes[tag],
+                } for tag,_type in MEMORY_TYPES.items()
+            },
+        }
+
+    def referenceAt(self, address: MemoryAddress | int) -> MemoryAddress:
+        """
+        Returns a pointer to the value a reference refers to; stale if that value was deleted since
+
+        Raises error if memory address does not exist or does not hold a reference
+        """
+        offset = self._read(address)
+        assert self._arena[offset] == TReference.typeTag, f"Not a reference: '{self._decode(offset)}'"
+
+        return MemoryAddress(*_REFERENCE.unpack_from(self._arena, offset + 1))
+
+    def collect(self, roots: Iterable[tuple[int, int]]) -> tuple[int, int]:
+        """
+        Mark-and-sweep garbage collection: keeps the values of `roots` (`(address, generation)` pairs; roots whose
+        value was deleted are ignored) and every value they refer to, directly or through other references, and
+        deletes every other value
+
+        Returns the number of values and of bytes freed
+        """
+        arena,offsets,generations = self._arena,self._offsets,self._generations
+        marked = bytearray(len(offsets))
+        stack = [slot for slot,generation in roots if offsets[slot] >= 0 and generations[slot] == generation]
+
+        # Mark
+        reference = TReference.typeTag
+        while stack:
+            slot = stack.pop()
+            if marked[slot]:
+                continue
+
+            marked[slot] = 1
+            offset = offsets[slot]
+            if arena[offset] == reference:
+                target,generation = _REFERENCE.unpack_from(arena, offset + 1)
+                if not marked[target] and offsets[target] >= 0 and generations[target] == generation:
+                    stack.append(target)
+
+        # Sweep
+        length,size = self._length,self._size
+        for slot in range(len(offsets)):
+            if not marked[slot] and offsets[slot] >= 0:
+                self._delete(slot)
+
+        return length - self._length,size - self._size
 
     def clearValue(self, address: MemoryAddress | int) -> None:
-        addressIndex = address.__int__()
-        assert 0 <= addressIndex < self._length
-        self._memory[addressIndex][1].setEmpty(True)
+        self._read(address)
+        self._store(TEmptyValue.defaultValue, TEmptyValue, address.__int__())
 
-    class MemoryValue:
-        def __init__(self, _value: str = None, _type: TMemoryType = None) -> None:
-            """
-            Represents an entry value in memory;
 
-            This should ONLY be used abstractly by the `Memory` class
+#################################################################################
+###                                                                           ###
+###                            [ Runtime Common: ]                            ###
+###                                                                           ###
+#################################################################################
+
+GC_THRESHOLD: int = 1 << 20
+""" Bytes allocated between two collections when no `__GC_THRESHOLD__` pragma is given """
 
-            string-value representation is "_value" then its type is "_type"
-            """
+_IMAGE = struct.Struct("<8sIIqqqqqqqqq")
+""" Header of a memory image: magic, version, number of statistics, then the counters and table lengths (see `Runtime.snapshot`) """
+_IMAGE_MAGIC: bytes = b"HSIMAGE\0"
+_IMAGE_VERSION: int = 2
 
-            # Ensure specified `_value` and `_type`
-            assert all((_value, _type, isinstance(_value, str), isinstance(_type, (TMemoryType, type(TMemoryType))))), "Must specify value [as `str`] and type [as `TMemoryType`] for memory value"
+_IMAGE_STATS: tuple[str, ...] = ("_peakSize", "_peakLength", "_allocations", "_allocatedBytes", "_deletions", "_compactions")
+""" Counters of `Memory.stats` kept in an image, after the per-type ones """
 
-            # Add value and type
-            self._empty: bool = False
-            self._value: str = _value
-            self._type: TMemoryType = _type
-            self._size: int = len(_value)
+class GCStats:
+    __slots__ = ("collections", "valuesFreed", "bytesFreed", "lastPause", "maxPause", "totalPause")
 
-        def setEmpty(self, value: bool) -> None:
-            assert type(value) is bool
-            if value:
-                self._value = ""
-                self._size = 0
-                self._type = TEmptyValue
+    def __init__(self) -> None:
+        """
+        Counters of the garbage collector of a runtime; pauses are in seconds
+        """
+        self.collections: int = 0
+        self.valuesFreed: int = 0
+        self.bytesFreed: int = 0
+        self.lastPause: float = 0.0
+        self.maxPause: float = 0.0
+        self.totalPause: float = 0.0
 
-            self._empty = value
+    def __repr__(self) -> str:
+        return f"GCStats(collections={self.collections}, valuesFreed={self.valuesFreed}, bytesFreed={self.bytesFreed}, lastPause={self.lastPause * 1000:.3f}ms, maxPause={self.maxPause * 1000:.3f}ms, totalPause={self.totalPause * 1000:.3f}ms)"
 
-        @property
-        def size(self) -> int:
-            return self._size
+class Runtime:
+    def __init__(self, pragmas = None) -> None:
+        """
+        Defines a global variable with attributes associated with the current runtime
 
-        @size.setter
-        def size(self, value: int) -> None:
-            assert type(value) is int
-            assert 0 <= value
+        Includes stuff like runtime memory, and the garbage collector of that memory: values allocated through
+        `allocate` belong to the innermost scope (see `scope`) and, once it is left, live on only while a value of
+        an active scope refers to them (`TReference`). A collection runs every `__GC_THRESHOLD__` bytes allocated
+        (read from `pragmas` if given; 0 disables automatic collections) or when `collect` is called
 
-            self._size = value
+        Attributes:
+            scopes (list[array]): Values allocated in each active scope, outermost (global) first, as flat
+                `address, generation` pairs.
+            symbols (dict[str, MemoryAddress]): Values bound to a name (see `define`); roots as well.
+            gcStats (GCStats): Counters of the collections so far.
+        """
 
-        @property
-        def type(self) -> Type[TMemoryType]:
-            if self._empty: return TEmptyValue
-            return self._type
-        
-        @type.setter
-        def type(self, value: TMemoryType) -> None:
-            self.setEmpty(False)
+        self.memory: Memory = Memory()
+        self.pragmas = pragmas
+        self.scopes: list[array] = [array("q")]
+        self.symbols: dict[str, MemoryAddress] = {}
+        self.gcStats: GCStats = GCStats()
+        self._allocated: int = 0
+
+    @property
+    def gcThreshold(self) -> int:
+        return self.pragmas.get("__GC_THRESHOLD__") if self.pragmas is not None else GC_THRESHOLD
 
-            assert isinstance(value, type(TMemoryType))
-            self._type = value
+    def enterScope(self) -> None:
+        self.scopes.append(array("q"))
 
-        @property
-        def value(self) -> str:
-            return self._value
+    def exitScope(self, *results: MemoryAddress) -> None:
+        """
+        Leaves the innermost scope; its values become garbage unless referred to, except `results`, which move to
+        the enclosing scope
+        """
+        assert len(self.scopes) > 1, "Cannot exit the global scope"
 
-        @value.setter
-        def value(self, value: str) -> None:
-            """
-            Sets the value associated to this MemoryClass instance;
+        self.scopes.pop()
+        for address in results:
+            self.scopes[-1].extend((address.__int__(), address.generation))
 
-            NOTE: Changing this value does not affect the value stored in memory:
-                it should only be changed internally within the `Memory` class
-            """
+    def scope(self) -> 'RuntimeScope':
+        """
+        `with runtime.scope(): ...` enters a scope for the duration of the block
+        """
+        return RuntimeScope(self)
 
-            # Ensure that the value is a string
-            assert isinstance(value, str) and self._type
+    def allocate(self, value: str, _type: Type[TMemoryType]) -> MemoryAddress:
+        """
+        Appends a value to memory as a root of the innermost scope; may collect garbage first
+        """
+        threshold = self.gcThreshold
+        if threshold and self._allocated >= threshold:
+            self.collect()
 
-            self._size = len(value)
-            self._value = value
+        memory = self.memory
+        size = memory.size
+        address = memory.append(value, _type)
+        self.scopes[-1].extend((address.__int__(), address.generation))
+        self._allocated += memory.size - size
 
-        def __str__(self) -> str:
-            return self._value
+        return address
 
+    def reference(self, target: MemoryAddress) -> MemoryAddress:
+        """
+        Allocates a reference to `target`, which then lives as long as the reference does
+        """
+        self.memory.typeAt(target) # Raises error if the pointer is stale
 
-#################################################################################
-###                                                                           ###
-###                            [ Runtime Common: ]                            ###
-###                                                                           ###
-#################################################################################
+        return self.allocate(str(target.__int__()), TReference)
 
-class Runtime:
-    def __init__(self) -> None:
+    def define(self, name: str, address: MemoryAddress) -> None:
         """
-        Defines a global variable with attributes associated with the current runtime
+        Binds a value to a name, which keeps it alive and lets it be found again after a `restore`
+        """
+        self.memory.typeAt(address) # Raises error if the pointer is stale
+        self.symbols[name] = address
+
+    def lookup(self, name: str) -> MemoryAddress:
+        return self.symbols[name]
 
-        Includes stuff like runtime memory so when the interpreter is terminated, a garbage collector is not necessary
+    def roots(self) -> Iterable[tuple[int, int]]:
+        for scope in self.scopes:
+            yield from zip(scope[::2], scope[1::2])
+
+        for address in self.symbols.values():
+            yield address.__int__(),address.generation
+
+    def collect(self) -> int:
+        """
+        Deletes every value unreachable from the active scopes; returns the number of bytes freed
         """
+        start = time.perf_counter()
+        values,size = self.memory.collect(self.roots())
+
+        # Roots whose values are gone (deleted explicitly) are dropped as well
+        offsets,generations = self.memory._offsets,self.memory._generations
+        for i,scope in enumerate(self.scopes):
+            live = array("q")
+            for slot,generation in zip(scope[::2], scope[1::2]):
+                if offsets[slot] >= 0 and generations[slot] == generation:
+                    live.extend((slot, generation))
+            self.scopes[i] = live
+
+        pause = time.perf_counter() - start
+        stats = self.gcStats
+        stats.collections += 1
+        stats.valuesFreed += values
+        stats.bytesFreed += size
+        stats.lastPause = pause
+        stats.maxPause = max(stats.maxPause, pause)
+        stats.totalPause += pause
+        self._allocated = 0
+
+        return size
+
+    def snapshot(self, path: str) -> int:
+        """
+        Writes the memory, the values of the global scope and the symbols to an image file that `restore` resumes
+        from; returns the number of bytes written
 
-        self.memory: Memory = Memory()
+        The file holds a header, the slot tables, the roots and the symbols, then the arena, starting on a page
+        boundary so that it can be mapped as is. The rest of the arena's capacity is left as a hole in the file
+        """
+        assert len(self.scopes) == 1, "Cannot snapshot a runtime inside a scope"
+
+        memory = self.memory
+        symbols = json.dumps({name: [address.__int__(), address.generation] for name,address in self.symbols.items()}).encode()
+        stats = array("q", memory._typeCounts + memory._typeBytes + memory._typePeakCounts + memory._typePeakBytes + [getattr(memory, x) for x in _IMAGE_STATS])
+        tables = (memory._offsets, memory._generations, memory._free, self.scopes[0], stats)
+        header = _IMAGE.size + sum(len(x) * x.itemsize for x in tables) + len(symbols)
+        arenaOffset = -(-header // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+        capacity = max(memory.capacity, 1)
+
+        with open(path, "wb") as file:
+            file.write(_IMAGE.pack(_IMAGE_MAGIC, _IMAGE_VERSION, len(stats), memory._end, memory._garbage, memory._size, memory._length, len(memory._offsets), len(memory._free), len(self.scopes[0]), len(symbols), arenaOffset))
+            for table in tables:
+                table.tofile(file)
+
+            file.write(symbols)
+            file.seek(arenaOffset)
+            with memoryview(memory._arena) as view:
+                file.write(view[:memory._end])
+
+            file.truncate(arenaOffset + capacity)
+
+        return arenaOffset + memory._end
+
+    @classmethod
+    def restore(cls, path: str, pragmas = None) -> 'Runtime':
+        """
+        Returns a runtime resumed from an image written by `snapshot`
+
+        The slot tables are read, but the arena is mapped copy-on-write: its pages are only read from the file
+        when a value on them is, and changes never reach the image. If the arena has to grow, it is read into
+        memory at that point
+
+        Raises `MemoryImageError` if the file is not an image of this version
+        """
+        runtime = cls(pragmas)
+        memory = runtime.memory = Memory(capacity = 0)
+
+        with open(path, "rb") as file:
+            header = file.read(_IMAGE.size)
+            if len(header) < _IMAGE.size or header[:8] != _IMAGE_MAGIC:
+                raise MemoryImageError(f"Not a memory image: '{path}'")
+
+            _,version,counters,end,garbage,size,length,slots,free,roots,symbols,arenaOffset = _IMAGE.unpack(header)
+            if version != _IMAGE_VERSION:
+                raise MemoryImageError(f"Memory image of unsupported version {version}: '{path}'")
+
+            stats = array("q")
+            for table,count in ((memory._offsets, slots), (memory._generations, slots), (memory._free, free), (runtime.scopes[0], roots), (stats, counters)):
+                table.fromfile(file, count)
+
+            runtime.symbols = {name: MemoryAddress(*x) for name,x in json.loads(file.read(symbols)).items()}
+            memory._arena = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_COPY, offset = arenaOffset)
+
+        memory._end,memory._garbage,memory._size,memory._length = end,garbage,size,length
+
+        types = len(MEMORY_TYPES)
+        memory._typeCounts,memory._typeBytes,memory._typePeakCounts,memory._typePeakBytes = (stats[i * types:(i + 1) * types].tolist() for i in range(4))
+        for name,value in zip(_IMAGE_STATS, stats[4 * types:]):
+            setattr(memory, name, value)
+
+        return runtime
+
+    def stats(self) -> dict:
+        """
+        Returns `Memory.stats`, with the garbage collector's counters (pauses in seconds) under "gc"
+        """
+        stats = self.memory.stats()
+        gc = self.gcStats
+        stats["gc"] = {
+            "threshold": self.gcThreshold,
+            "collections": gc.collections,
+            "valuesFreed": gc.valuesFreed,
+            "bytesFreed": gc.bytesFreed,
+            "lastPause": gc.lastPause,
+            "maxPause": gc.maxPause,
+            "totalPause": gc.totalPause,
+        }
+
+        return stats
+
+    def close(self) -> None:
+        self.memory.close()
+
+class MemoryMonitor:
+    __slots__ = ("runtime", "stream", "interval", "_start", "_time", "_allocations", "_allocatedBytes", "_stop", "_thread")
+
+    def __init__(self, runtime: Runtime, stream: TextIO = None, interval: float = 1.0) -> None:
+        """
+        Samples the statistics of a runtime over time (see `sample`); given a `stream`, `start` writes a sample to
+        it every `interval` seconds, as a line of JSON, until `stop`
+        """
+        self.runtime: Runtime = runtime
+        self.stream: TextIO = stream
+        self.interval: float = interval
+        self._start: float = time.perf_counter()
+        self._time: float = self._start
+        self._allocations: int = runtime.memory._allocations
+        self._allocatedBytes: int = runtime.memory._allocatedBytes
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread = None
+
+    def sample(self) -> dict:
+        """
+        Returns `Runtime.stats`, with the seconds since the monitor was created ("time") and the values and bytes
+        allocated per second since the previous sample ("allocationRate")
+        """
+        now = time.perf_counter()
+        stats = self.runtime.stats()
+        elapsed = now - self._time
+
+        stats["time"] = now - self._start
+        stats["allocationRate"] = {
+            "values": (stats["allocations"] - self._allocations) / elapsed if elapsed else 0.0,
+            "bytes": (stats["allocatedBytes"] - self._allocatedBytes) / elapsed if elapsed else 0.0,
+        }
+        self._time,self._allocations,self._allocatedBytes = now,stats["allocations"],stats["allocatedBytes"]
+
+        return stats
+
+    def emit(self) -> None:
+        self.stream.write(json.dumps(self.sample()) + "\n")
+        self.stream.flush()
+
+    def start(self) -> None:
+        assert self.stream is not None, "No stream to emit the statistics to"
+
+        self._stop.clear()
+        self._thread = threading.Thread(target = self._run, name = "MemoryMonitor", daemon = True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.emit()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+def formatStats(stats: dict) -> str:
+    """
+    Formats the statistics of `Runtime.stats` (or `MemoryMonitor.sample`) as a report
+    """
+    lines = [
+        f"values      {stats['values']:,} (peak {stats['peakValues']:,}): {stats['liveSlots']:,} live, {stats['clearedSlots']:,} cleared; {stats['freeSlots']:,} free slots",
+        f"bytes       {stats['size']:,} in values (peak {stats['peakSize']:,}); {stats['used']:,} of {stats['capacity']:,} arena bytes used, {stats['garbage']:,} garbage ({stats['fragmentation']:.1%} fragmentation)",
+        f"activity    {stats['allocations']:,} values appended, {stats['allocatedBytes']:,} bytes encoded, {stats['deletions']:,} deleted, {stats['compactions']:,} compactions",
+    ]
+    if "allocationRate" in stats:
+        rate = stats["allocationRate"]
+        lines.append(f"rate        {rate['values']:,.0f} values/s, {rate['bytes']:,.0f} bytes/s since the previous sample ({stats['time']:.2f} s monitored)")
+
+    if "gc" in stats:
+        gc = stats["gc"]
+        average = gc["totalPause"] / gc["collections"] if gc["collections"] else 0.0
+        lines.append(f"gc          {gc['collections']:,} collections (every {gc['threshold']:,} bytes), {gc['valuesFreed']:,} values / {gc['bytesFreed']:,} bytes freed; pauses avg {average * 1000:.2f} ms, max {gc['maxPause'] * 1000:.2f} ms")
+
+    lines.append(f"{'type':<12}{'count':>12}{'bytes':>14}{'peak count':>14}{'peak bytes':>14}")
+    for name,counts in stats["types"].items():
+        lines.append(f"{name:<12}{counts['count']:>12,}{counts['bytes']:>14,}{counts['peakCount']:>14,}{counts['peakBytes']:>14,}")
+
+    return "\n".join(lines)
+
+class RuntimeScope:
+    __slots__ = ("runtime",)
+
+    def __init__(self, runtime: Runtime) -> None:
+        self.runtime: Runtime = runtime
+
+    def __enter__(self) -> Runtime:
+        self.runtime.enterScope()
+        return self.runtime
+
+    def __exit__(self, *_) -> None:
+        self.runtime.exitScope()
 
 
 #################################################################################
@@ -674,7 +1273,8 @@ class Compile:
         else:
             assert False, str(_content)
 
-Compile("""
+if __name__ == "__main__":
+    Compile("""
 DEL::SOL <<|    DEC::VAR >> {$x} >> SCO::LET >> TYP::INT >> { /31:33/ }    |>> DEL::EOL
 """.strip())
 
@@ -1,5 +1,7 @@
 import os
+import re
 import json
+from contextvars import ContextVar
 
 __GLOBALS__ = os.path.join(os.path.dirname(__file__), "Globals.json")
 
@@ -8,34 +10,107 @@ default = {
     "__TAB_BASE__": " ",
     "__ML_COMMENTS__": r"\/\*[\s\S]*?\*\/",
     "__SL_COMMENTS__": r"\/\/.*",
+    "__GC_THRESHOLD__": 1 << 20,
 }
 
-def getGlobals() -> dict:
-    with open(__GLOBALS__, "r") as f:
-        data = json.load(f)
-        assert data
+class Pragmas:
+    def __init__(self, values: dict = None):
+        """
+        In-memory pragma store for a single run;
 
-        return data
+        seeded from `default` and then from the `#PRAGMA` lines of the script. Nothing is read from or written to
+        disk unless `load`/`save` are called explicitly
+        """
+        self._values: dict = default.copy()
+        self._patterns: dict = dict()
 
-def resetGlobal(key: str):
-    assert key in default
+        for key,value in (values or {}).items():
+            self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in default
+
+    def get(self, key: str):
+        if key not in default: return False
+
+        return self._values[key]
+
+    def set(self, key: str, value: int | float | bool | str | list[int | float | bool | str]):
+        if key not in default: return False
+
+        self._values[key] = value
+        self._patterns.pop(key, None)
+
+    def reset(self, key: str = None):
+        if key is None:
+            self._values = default.copy()
+            self._patterns.clear()
+            return
+
+        assert key in default
+
+        self.set(key, default[key])
+
+    def pattern(self, key: str) -> re.Pattern:
+        """
+        Returns the value of `key` compiled as a regular expression; compiled once until the pragma changes
+        """
+        if key not in self._patterns:
+            self._patterns[key] = re.compile(self.get(key))
+
+        return self._patterns[key]
 
-    setGlobal(key, default[key])
+    def copy(self) -> 'Pragmas':
+        return Pragmas(self._values)
+
+    def items(self) -> dict:
+        return self._values.copy()
+
+    def load(self, path: str = __GLOBALS__) -> None:
+        """
+        Explicitly seeds this store from a JSON file (defaults to `Globals.json`)
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        for key,value in data.items():
+            self.set(key, value)
+
+    def save(self, path: str = __GLOBALS__) -> None:
+        """
+        Explicitly persists this store to a JSON file (defaults to `Globals.json`)
+        """
+        with open(path, "w") as f:
+            json.dump(self._values, f)
+
+pragmas: Pragmas = Pragmas()
+""" Fallback pragmas used when no `InterpreterContext` is active """
+
+_active: ContextVar = ContextVar("pragmas", default=pragmas)
+
+def activePragmas() -> Pragmas:
+    """
+    Returns the pragmas of the run active in the current thread/task
+    """
+    return _active.get()
+
+def getGlobals() -> dict:
+    return activePragmas().items()
+
+def resetGlobal(key: str):
+    activePragmas().reset(key)
 
 def resetGlobals():
-    with open(__GLOBALS__, "w") as f:
-        json.dump(default, f)
+    activePragmas().reset()
 
 def getGlobal(key: str):
-    if key not in default: return False
-
-    return getGlobals()[key]
+    return activePragmas().get(key)
 
 def setGlobal(key: str, value: int | float | bool | str | list[int | float | bool | str]):
-    if key not in default: return False
+    return activePragmas().set(key, value)
 
-    _globals = default.copy()
-    _globals[key] = value.real
+def loadGlobals(path: str = __GLOBALS__):
+    activePragmas().load(path)
 
-    with open(__GLOBALS__, "w") as f:
-        json.dump(_globals, f)
\ No newline at end of file
+def saveGlobals(path: str = __GLOBALS__):
+    activePragmas().save(path)
@@ -1,3 +1,5 @@
+__version__ = "0.1.0"
+
 import shutil
 import os
 import subprocess
@@ -5,7 +7,7 @@ import sys
 from enum import Enum
 
 from hs.lib.staticproperty import staticproperty
-from hs.lib.ErrorReferences import ErrorReferences
+from hs.lib.ErrorReferences import ErrorReferences,ScriptError
 
 class Symbols:
     class Types:
@@ -13,20 +15,19 @@ class Symbols:
         Primitive (built-in) types
         """
 
-        from hs.lib.Symbols.Types import Primitive,Number,String,Boolean
+        from hs.lib.Symbols.Types import Primitive,Number,String,Boolean,TRUE,FALSE,SMALL_INTS
+        from hs.lib.Symbols.Array import Array
 
     class Tokens:
         """
         Various tokens
         """
 
-        from hs.lib.Symbols.Tokens import (Token)
-        from hs.lib.Symbols.Keywords import (Keywords,Keyword,ReservedKeywords,MatchKeyword)
-        from hs.lib.Symbols.Variable import Variable
-        from hs.lib.Symbols.Decorator import Decorator
+        from hs.lib.Symbols.Tokens import (Token,LineRange)
+        from hs.lib.Symbols.Keywords import (KeywordTable,ReservedKeywords,BlockKeywords)
 
     class Operators:
-        from hs.lib.Symbols.Operator import (Operator,Classifications)
+        from hs.lib.Symbols.Operator import (Classifications,Precedence,PrefixOperators,RightAssociative,CompoundAssignments)
 
 class System:
     class Standard:
@@ -91,6 +92,20 @@ class System:
                     open(file, "x").close()
 
 from hs.lib.Common import Common
+from hs.lib.Context import InterpreterContext
 
 class ExecutionControl:
-    from hs.lib.ExecutionControl import END_CODE,START_CODE
\ No newline at end of file
+    from hs.lib.ExecutionControl import END_CODE,START_CODE
+
+class Lexer:
+    from hs.lib.Lexer import (Scanner,Lexeme,TOKENS,WORD_KINDS)
+
+from hs.lib.Operands import Operands
+from hs.lib.Parser import Parser
+from hs.lib.Resolver import Resolver
+from hs.lib.Compiler import Compiler,Bytecode,Opcode,SlotDeclaration
+from hs.lib.VM import VirtualMachine
+from hs.lib.Persistent import PersistentMap
+from hs.lib.Transaction import Transactions,Snapshot,TransactionExit
+import hs.lib.Cache as Cache
+import hs.lib.Syntax as Syntax
\ No newline at end of file
@@ -0,0 +1,173 @@
+import os
+import json
+import struct
+import hashlib
+from array import array
+
+from hs.Globals import Pragmas
+from hs.lib.Compiler import Bytecode,SlotDeclaration
+from hs.lib.Symbols.Types import Primitive,Number,String,Boolean
+
+MAGIC: bytes = b"HSC\x02"
+""" Identifies a compiled HamenScript file; the last byte is the version of the file format """
+
+EXTENSION: str = ".hsc"
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+def cache_path(source_path: str) -> str:
+    """
+    Returns the path of the compiled file written next to `source_path` (e.g. "Main.hs" -> "Main.hsc")
+    """
+    return os.path.splitext(source_path)[0] + EXTENSION
+
+def cache_key(source: str, pragmas: Pragmas, version: str) -> bytes:
+    """
+    Hash of everything a compiled program depends on: the source code, the interpreter version and the pragmas in
+    effect before the script's own `#PRAGMA` lines (which are part of the source)
+    """
+    digest = hashlib.sha256()
+    digest.update(version.encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(pragmas.items(), sort_keys = True).encode())
+    digest.update(b"\0")
+    digest.update(source.encode())
+
+    return digest.digest()
+
+def _string(value: str) -> bytes:
+    data = value.encode()
+    return _U32.pack(len(data)) + data
+
+def dumps(bytecode: Bytecode, key: bytes, pragmas: dict) -> bytes:
+    """
+    Serializes `bytecode`, together with the pragma values it was compiled with
+
+    Layout (little-endian): MAGIC, key (32 bytes), pragmas (JSON), code (u32 count + i32 each), names, frame size,
+    declarations (name, u8 flags, u32 slot), constants (a type tag followed by an i64, f64, u8 or UTF-8 payload);
+    strings are u32 length-prefixed
+    """
+    parts = [MAGIC, key, _string(json.dumps(pragmas))]
+
+    code = array("i", bytecode.code)
+    parts.append(_U32.pack(len(code)))
+    parts.append(code.tobytes())
+
+    parts.append(_U32.pack(len(bytecode.names)))
+    parts.extend(_string(x) for x in bytecode.names)
+
+    parts.append(_U32.pack(bytecode.frame_size))
+    parts.append(_U32.pack(len(bytecode.declarations)))
+    for declaration in bytecode.declarations:
+        flags = (declaration.scope == "CONST") | declaration.publish << 1
+        parts.append(_string(declaration.name) + bytes([flags]) + _U32.pack(declaration.slot))
+
+    parts.append(_U32.pack(len(bytecode.constants)))
+    for constant in bytecode.constants:
+        if type(constant) is Number:
+            number = constant.as_number
+            if type(number) is float:
+                parts.append(b"d" + _F64.pack(number))
+            elif -2 ** 63 <= number < 2 ** 63:
+                parts.append(b"q" + _I64.pack(number))
+            else:
+                parts.append(b"n" + _string(str(number)))
+        elif type(constant) is Boolean:
+            parts.append(b"b" + (b"\1" if constant.as_bool else b"\0"))
+        elif type(constant) is String:
+            parts.append(b"s" + _string(constant.value))
+        else:
+            raise TypeError(f"Cannot serialize a constant of type {type(constant).__name__}")
+
+    return b"".join(parts)
+
+def loads(data: bytes, key: bytes) -> tuple[Bytecode, dict] | None:
+    """
+    Reads what `dumps` wrote; returns `None` if `data` is not a compiled file or was compiled for another key
+
+    Raises `ValueError` if `data` is truncated or otherwise malformed
+    """
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):len(MAGIC) + len(key)] != key:
+        return None
+
+    view = memoryview(data)
+    offset = len(MAGIC) + len(key)
+
+    def take(size: int) -> memoryview:
+        # Every read goes through here, so that short data is an error rather than a shorter value
+        nonlocal offset
+        if offset + size > len(view):
+            raise ValueError("Truncated compiled file")
+
+        offset += size
+        return view[offset - size:offset]
+
+    def u32() -> int:
+        return _U32.unpack(take(4))[0]
+
+    def string() -> str:
+        return str(take(u32()), "utf-8")
+
+    pragmas = json.loads(string())
+
+    code = array("i")
+    code.frombytes(take(u32() * code.itemsize))
+
+    names = [string() for _ in range(u32())]
+
+    frame_size = u32()
+    declarations: list[SlotDeclaration] = []
+    for _ in range(u32()):
+        name = string()
+        flags = take(1)[0]
+        declarations.append(SlotDeclaration(name, "CONST" if flags & 1 else "LET", u32(), bool(flags & 2)))
+
+    constants: list[Primitive] = []
+    for _ in range(u32()):
+        tag = take(1).tobytes()
+        if tag == b"q":
+            constants.append(Number.of(_I64.unpack(take(8))[0]))
+        elif tag == b"d":
+            constants.append(Number.of(_F64.unpack(take(8))[0]))
+        elif tag == b"n":
+            constants.append(Number.of(int(string())))
+        elif tag == b"b":
+            constants.append(Boolean.of(take(1)[0] == 1))
+        elif tag == b"s":
+            constants.append(String.of(string()))
+        else:
+            return None
+
+    if offset != len(view):
+        raise ValueError("Trailing data in compiled file")
+
+    return Bytecode(code.tolist(), constants, names, declarations, frame_size),pragmas
+
+def read(path: str, key: bytes) -> tuple[Bytecode, dict] | None:
+    try:
+        with open(path, "rb") as file:
+            return loads(file.read(), key)
+    except (OSError, ValueError, struct.error):
+        return None
+
+def write(path: str, bytecode: Bytecode, key: bytes, pragmas: dict) -> bool:
+    """
+    Writes the compiled file atomically; like `__pycache__`, failing to write (e.g. a read-only directory) is not
+    an error
+    """
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(dumps(bytecode, key, pragmas))
+
+        os.replace(temporary, path)
+        return True
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+        return False
@@ -1,16 +1,28 @@
 from hs.lib.Symbols.Types import (Primitive)
+from hs.lib.Persistent import PersistentMap
 
 class Common:
     class GlobalEntry:
-        def __init__(self, key: str, value: str, type: any, scope: str = "LET", *, strict: bool = False, onChange: str or callable = None):
+        def __init__(self, key: str, value: Primitive, type: any = None, scope: str = "LET", *, strict: bool = False, onChange: str or callable = None):
+            """
+            A declared variable
+
+            Attributes:
+                value (Primitive): The typed value; primitives are never modified once created, so reads hand out this
+                    object directly.
+                type (type[Primitive]): Type of `value`.
+                version (int): Transaction the entry was copied in (see `Transactions.writable`); 0 outside of
+                    transactions.
+            """
             self.key = key
-            self.value = value
-            self.type: Primitive = type
+            self.value: Primitive = value
+            self.type: type[Primitive] = type if type is not None else value.__class__
             self.scope = scope
             self.onChange = []
 
             """ Raise an error if re-assigned to a type not matching `self.type` """
             self.strict: bool = strict
+            self.version: int = 0
 
             assert scope in ["LET", "CONST"], f"Invalid scope: \"{scope}\""
 
@@ -21,6 +33,22 @@ class Common:
 
             self.onChange.append(onChange)
 
+        def assign(self, value: Primitive) -> None:
+            """
+            Re-assigns the variable and notifies its watchers
+            """
+            self.triggerWatchers(self.value, value)
+            self.value = value
+            self.type = value.__class__
+
+        def copy(self, version: int) -> 'Common.GlobalEntry':
+            entry = Common.GlobalEntry.__new__(Common.GlobalEntry)
+            entry.__dict__.update(self.__dict__)
+            entry.onChange = list(self.onChange)
+            entry.version = version
+
+            return entry
+
         def triggerWatchers(self, oldValue, newValue):
             for watcher in self.onChange:
                 if type(watcher) is str:
@@ -30,7 +58,11 @@ class Common:
 
     class GlobalList:
         def __init__(self):
-            self._globals = dict()
+            """
+            Variables by name, in a `PersistentMap`: taking a `snapshot` of every variable and `restore`-ing it are
+            O(1), whatever the number of variables
+            """
+            self._globals: PersistentMap = PersistentMap()
 
         def __contains__(self, item: str) -> bool:
             return type(item) is str and item in self._globals
@@ -41,18 +73,22 @@ class Common:
         def add_watcher(self, item: str, watcher: str or callable):
             if not self.contains(item): return
 
-            self._globals[item].addWatcher(watcher)
+            current = self._globals.get(item)
+            entry = current.copy(current.version)
+            entry.addWatcher(watcher)
+            self.rebind(item, entry)
 
-        def set(self, item: str, *, key: str = None, value: str = None, type: Primitive = None, scope: str = None, strict: bool = False) -> None:
+        def set(self, item: str, *, key: str = None, value: Primitive = None, type: type[Primitive] = None, scope: str = None, strict: bool = False) -> None:
             if not isinstance(item, str) or not self.contains(item):
-                self._globals[item] = Common.GlobalEntry(key, value, type, scope)
+                self._globals = self._globals.set(item, Common.GlobalEntry(key, value, type, scope))
                 return
 
-            entry = self._globals[item]
-            entry: Common.GlobalEntry
+            # Changed on a copy: a snapshot (see `Transactions`) may still hold the current entry
+            current = self._globals.get(item)
+            entry = current.copy(current.version)
 
             if key: entry.key = key
-            if value:
+            if value is not None:
                 old,new = entry.value,value
                 entry.triggerWatchers(old, new)
                 entry.value = new
@@ -60,7 +96,19 @@ class Common:
             if scope: entry.scope = scope
             if strict: entry.strict = strict
 
+            self.rebind(item, entry)
+
         def get(self, item: str) -> 'Common.GlobalEntry':
-            if item not in self._globals: return None
+            return self._globals.get(item)
+
+        def rebind(self, item: str, entry: 'Common.GlobalEntry') -> None:
+            """
+            Replaces the entry of a declared variable (leaving the old one, and any snapshot holding it, unchanged)
+            """
+            self._globals = self._globals.set(item, entry)
+
+        def snapshot(self) -> PersistentMap:
+            return self._globals
 
-            return self._globals[item]
\ No newline at end of file
+        def restore(self, snapshot: PersistentMap) -> None:
+            self._globals = snapshot
@@ -0,0 +1,332 @@
+from enum import IntEnum
+
+import hs.lib.Syntax as Syntax
+from hs.lib.Operands import Operands
+from hs.lib.Symbols.Types import Primitive
+
+class Opcode(IntEnum):
+    """
+    Instructions of the virtual machine; every instruction is followed by exactly one argument (0 if unused)
+    """
+
+    # Binary operators come first so that the machine can test them with a single comparison
+    BINARY_ADD = 0
+    BINARY_SUBTRACT = 1
+    BINARY_MULTIPLY = 2
+    BINARY_DIVIDE = 3
+    BINARY_MODULO = 4
+    BINARY_POWER = 5
+    COMPARE_EQUAL = 6
+    COMPARE_NOT_EQUAL = 7
+    COMPARE_STRICT_EQUAL = 8
+    COMPARE_STRICT_NOT_EQUAL = 9
+    COMPARE_LESS = 10
+    COMPARE_LESS_EQUAL = 11
+    COMPARE_GREATER = 12
+    COMPARE_GREATER_EQUAL = 13
+
+    LOAD_CONST = 20             # Push `constants[arg]`
+    LOAD_LOCAL = 21             # Push the value of the variable in frame slot `arg`
+    LOAD_NAME = 22              # Push the value of the unresolved variable `names[arg]`
+    STORE_LOCAL = 23            # Pop a value and assign it to the variable in frame slot `arg`
+    STORE_NAME = 24             # Pop a value and assign it to the unresolved variable `names[arg]`
+    DECLARE = 25                # Pop a value and declare `declarations[arg]`
+    DROP_SLOTS = 26             # Clear every frame slot from `arg` on; emitted when a block exits
+    UNARY_NOT = 27
+    UNARY_NEGATIVE = 28
+    UNARY_POSITIVE = 29
+    POP_TOP = 30
+    JUMP = 31                   # Continue at instruction `arg`
+    JUMP_IF_FALSE = 32          # Pop a value; continue at `arg` if it is falsy
+    JUMP_IF_FALSE_OR_POP = 33   # Continue at `arg` (keeping the value) if it is falsy, otherwise pop it
+    JUMP_IF_TRUE_OR_POP = 34    # Continue at `arg` (keeping the value) if it is truthy, otherwise pop it
+    SETUP_TRY = 35              # Errors until the matching POP_TRY continue at `arg`
+    POP_TRY = 36
+    BUILD_ARRAY = 37            # Pop `arg` values and push an `Array` of them
+    BEGIN_TRANSACTION = 38      # Take a snapshot of the variables; `arg` is the first frame slot of the transaction
+    END_TRANSACTION = 39        # End the innermost transaction, keeping (`arg` 0) or rolling back (`arg` 1) its changes
+    STDOUT = 40                 # Pop a value and write it to the output stream
+    STDFLUSH = 41
+    RETURN = 50
+
+BinaryOpcodes: dict[str, Opcode] = {
+    "+": Opcode.BINARY_ADD,
+    "-": Opcode.BINARY_SUBTRACT,
+    "*": Opcode.BINARY_MULTIPLY,
+    "/": Opcode.BINARY_DIVIDE,
+    "%": Opcode.BINARY_MODULO,
+    "**": Opcode.BINARY_POWER,
+    "==": Opcode.COMPARE_EQUAL,
+    "!=": Opcode.COMPARE_NOT_EQUAL,
+    "===": Opcode.COMPARE_STRICT_EQUAL,
+    "!==": Opcode.COMPARE_STRICT_NOT_EQUAL,
+    "<": Opcode.COMPARE_LESS,
+    "<=": Opcode.COMPARE_LESS_EQUAL,
+    ">": Opcode.COMPARE_GREATER,
+    ">=": Opcode.COMPARE_GREATER_EQUAL,
+}
+
+BinaryFunctions: list[callable] = [Operands.Binary[operator] for operator,_ in sorted(BinaryOpcodes.items(), key = lambda x : x[1])]
+""" Implementation of each binary opcode, indexed by opcode """
+
+UnaryOpcodes: dict[str, Opcode] = {
+    "!": Opcode.UNARY_NOT,
+    "-": Opcode.UNARY_NEGATIVE,
+    "+": Opcode.UNARY_POSITIVE,
+}
+
+class SlotDeclaration:
+    __slots__ = ("name", "scope", "slot", "publish")
+
+    def __init__(self, name: str, scope: str, slot: int, publish: bool):
+        """
+        A variable declared by the DECLARE instruction
+
+        Attributes:
+            scope (str): "LET" or "CONST".
+            slot (int): Frame slot of the variable.
+            publish (bool): Declared by the program itself rather than by a block; also added to
+                `InterpreterContext.globals`.
+        """
+        self.name: str = name
+        self.scope: str = scope
+        self.slot: int = slot
+        self.publish: bool = publish
+
+class Bytecode:
+    __slots__ = ("code", "constants", "names", "declarations", "frame_size")
+
+    def __init__(self, code: list[int] = None, constants: list[Primitive] = None, names: list[str] = None, declarations: list[SlotDeclaration] = None, frame_size: int = 0):
+        """
+        A compiled program
+
+        Attributes:
+            code (list[int]): Flat opcode array; `code[i]` is an `Opcode` and `code[i + 1]` its argument.
+            constants (list[Primitive]): Values loaded by LOAD_CONST.
+            names (list[str]): Names of the unresolved variables used by LOAD_NAME and STORE_NAME.
+            declarations (list[SlotDeclaration]): Variables declared by DECLARE.
+            frame_size (int): Number of variable slots of the frame the program runs in.
+        """
+        self.code: list[int] = code if code is not None else []
+        self.constants: list[Primitive] = constants if constants is not None else []
+        self.names: list[str] = names if names is not None else []
+        self.declarations: list[SlotDeclaration] = declarations if declarations is not None else []
+        self.frame_size: int = frame_size
+
+    def disassemble(self) -> str:
+        lines = []
+        for i in range(0, len(self.code), 2):
+            opcode,argument = Opcode(self.code[i]),self.code[i + 1]
+            detail = ""
+            if opcode is Opcode.LOAD_CONST:
+                detail = f"({self.constants[argument].toString()!r})"
+            elif opcode in (Opcode.LOAD_NAME, Opcode.STORE_NAME):
+                detail = f"({self.names[argument]})"
+            elif opcode is Opcode.DECLARE:
+                declaration = self.declarations[argument]
+                detail = f"({declaration.scope.lower()} {declaration.name} -> slot {declaration.slot})"
+
+            lines.append(f"{i:>6}  {opcode.name:<26}{argument:<6}{detail}")
+
+        return "\n".join(lines)
+
+class Compiler:
+    def __init__(self):
+        """
+        Compiles a parsed (and resolved, see `Resolver`) program into `Bytecode` for the virtual machine
+        """
+        self.bytecode: Bytecode = Bytecode()
+        self._names: dict[str, int] = dict()
+        self._constants: dict[tuple[type, str], int] = dict()
+        self._transactions: list[tuple[int, list[int]]] = [] # (first slot, `commit`/`rollback` jumps) of every open transaction
+
+        self.handlers: dict = {
+            Syntax.Declaration: self.compile_declaration,
+            Syntax.Assignment: self.compile_assignment,
+            Syntax.Stdout: self.compile_stdout,
+            Syntax.Stdflush: lambda statement : self.emit(Opcode.STDFLUSH),
+            Syntax.If: self.compile_if,
+            Syntax.While: self.compile_while,
+            Syntax.Try: self.compile_try,
+            Syntax.Transaction: self.compile_transaction,
+            Syntax.EndTransaction: self.compile_end_transaction,
+            Syntax.FunctionDeclaration: lambda statement : None, # Functions cannot be called yet
+            Syntax.ExpressionStatement: self.compile_expression_statement,
+            Syntax.Pass: lambda statement : None,
+            Syntax.Literal: self.compile_literal,
+            Syntax.Name: self.compile_name,
+            Syntax.Unary: self.compile_unary,
+            Syntax.Binary: self.compile_binary,
+            Syntax.Logical: self.compile_logical,
+            Syntax.Conditional: self.compile_conditional,
+            Syntax.ArrayLiteral: self.compile_array,
+        }
+
+    def compile(self, program: Syntax.Program) -> Bytecode:
+        self.bytecode.frame_size = program.frame_size
+        for statement in program.statements:
+            self.compile_node(statement)
+
+        self.emit(Opcode.RETURN)
+
+        return self.bytecode
+
+    def emit(self, opcode: Opcode, argument: int = 0) -> int:
+        """
+        Appends an instruction and returns its position
+        """
+        code = self.bytecode.code
+        code.append(int(opcode))
+        code.append(argument)
+
+        return len(code) - 2
+
+    def patch(self, instruction: int, target: int = None) -> None:
+        """
+        Points the jump at `instruction` to `target` (by default, the next instruction to be emitted)
+        """
+        self.bytecode.code[instruction + 1] = len(self.bytecode.code) if target is None else target
+
+    def name(self, name: str) -> int:
+        index = self._names.get(name)
+        if index is None:
+            index = self._names[name] = len(self.bytecode.names)
+            self.bytecode.names.append(name)
+
+        return index
+
+    def constant(self, value: Primitive) -> int:
+        """
+        Index of `value` in the constant pool; equal literals (by type and text, so `1` and `1.0` stay apart) share
+        one entry and one object, wherever they appear in the program
+        """
+        key = (type(value), value.value)
+        index = self._constants.get(key)
+        if index is None:
+            index = self._constants[key] = len(self.bytecode.constants)
+            self.bytecode.constants.append(value)
+
+        return index
+
+    def compile_node(self, node: Syntax.Node) -> None:
+        self.handlers[type(node)](node)
+
+    def compile_block(self, block: Syntax.Block) -> None:
+        for statement in block.statements:
+            self.compile_node(statement)
+
+        if block.slot_count:
+            self.emit(Opcode.DROP_SLOTS, block.first_slot)
+
+    def compile_declaration(self, statement: Syntax.Declaration) -> None:
+        self.compile_node(statement.value)
+        self.bytecode.declarations.append(SlotDeclaration(statement.name, statement.scope, statement.slot, statement.depth == 0))
+        self.emit(Opcode.DECLARE, len(self.bytecode.declarations) - 1)
+
+    def compile_assignment(self, statement: Syntax.Assignment) -> None:
+        self.compile_node(statement.value)
+        if statement.slot is None:
+            self.emit(Opcode.STORE_NAME, self.name(statement.name))
+        else:
+            self.emit(Opcode.STORE_LOCAL, statement.slot)
+
+    def compile_name(self, expression: Syntax.Name) -> None:
+        if expression.slot is None:
+            self.emit(Opcode.LOAD_NAME, self.name(expression.name))
+        else:
+            self.emit(Opcode.LOAD_LOCAL, expression.slot)
+
+    def compile_stdout(self, statement: Syntax.Stdout) -> None:
+        self.compile_node(statement.value)
+        self.emit(Opcode.STDOUT)
+
+    def compile_if(self, statement: Syntax.If) -> None:
+        ends = []
+        for condition,block in statement.branches:
+            self.compile_node(condition)
+            skip = self.emit(Opcode.JUMP_IF_FALSE)
+            self.compile_block(block)
+            ends.append(self.emit(Opcode.JUMP))
+            self.patch(skip)
+
+        if statement.otherwise:
+            self.compile_block(statement.otherwise)
+
+        for end in ends:
+            self.patch(end)
+
+    def compile_while(self, statement: Syntax.While) -> None:
+        start = len(self.bytecode.code)
+        self.compile_node(statement.condition)
+        end = self.emit(Opcode.JUMP_IF_FALSE)
+        self.compile_block(statement.body)
+        self.emit(Opcode.JUMP, start)
+        self.patch(end)
+
+    def compile_try(self, statement: Syntax.Try) -> None:
+        setup = self.emit(Opcode.SETUP_TRY)
+        self.compile_block(statement.body)
+        self.emit(Opcode.POP_TRY)
+        end = self.emit(Opcode.JUMP)
+        self.patch(setup)
+
+        # The body was left half-way; drop whatever it (or the blocks inside it) declared
+        self.emit(Opcode.DROP_SLOTS, statement.body.first_slot)
+        if statement.handler:
+            self.compile_block(statement.handler)
+
+        self.patch(end)
+
+    def compile_transaction(self, statement: Syntax.Transaction) -> None:
+        first_slot = statement.body.first_slot
+        self.emit(Opcode.BEGIN_TRANSACTION, first_slot)
+        self._transactions.append((first_slot, []))
+        self.compile_block(statement.body)
+        _,exits = self._transactions.pop()
+        self.emit(Opcode.END_TRANSACTION, 0)
+
+        for exit in exits:
+            self.patch(exit)
+
+    def compile_end_transaction(self, statement: Syntax.EndTransaction) -> None:
+        first_slot,exits = self._transactions[-1]
+        self.emit(Opcode.DROP_SLOTS, first_slot)
+        self.emit(Opcode.END_TRANSACTION, int(statement.rollback))
+        exits.append(self.emit(Opcode.JUMP))
+
+    def compile_expression_statement(self, statement: Syntax.ExpressionStatement) -> None:
+        self.compile_node(statement.expression)
+        self.emit(Opcode.POP_TOP)
+
+    def compile_literal(self, expression: Syntax.Literal) -> None:
+        self.emit(Opcode.LOAD_CONST, self.constant(expression.value))
+
+    def compile_unary(self, expression: Syntax.Unary) -> None:
+        self.compile_node(expression.operand)
+        self.emit(UnaryOpcodes[expression.operator])
+
+    def compile_binary(self, expression: Syntax.Binary) -> None:
+        self.compile_node(expression.left)
+        self.compile_node(expression.right)
+        self.emit(BinaryOpcodes[expression.operator])
+
+    def compile_logical(self, expression: Syntax.Logical) -> None:
+        self.compile_node(expression.left)
+        end = self.emit(Opcode.JUMP_IF_TRUE_OR_POP if expression.operator == "||" else Opcode.JUMP_IF_FALSE_OR_POP)
+        self.compile_node(expression.right)
+        self.patch(end)
+
+    def compile_array(self, expression: Syntax.ArrayLiteral) -> None:
+        for element in expression.elements:
+            self.compile_node(element)
+
+        self.emit(Opcode.BUILD_ARRAY, len(expression.elements))
+
+    def compile_conditional(self, expression: Syntax.Conditional) -> None:
+        self.compile_node(expression.condition)
+        otherwise = self.emit(Opcode.JUMP_IF_FALSE)
+        self.compile_node(expression.consequent)
+        end = self.emit(Opcode.JUMP)
+        self.patch(otherwise)
+        self.compile_node(expression.alternative)
+        self.patch(end)
@@ -0,0 +1,56 @@
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TextIO
+
+import hs.Globals as Globals
+from hs.Globals import Pragmas
+from hs.lib.Common import Common
+from dhs import Runtime, Memory
+
+_current: ContextVar = ContextVar("context", default=None)
+
+class InterpreterContext:
+    def __init__(self, *, pragmas: Pragmas = None, globals: Common.GlobalList = None, stdout: TextIO = None, name: str = "Main.hs"):
+        """
+        State owned by a single HamenScript run;
+
+        every run gets its own pragmas, variables, output stream and runtime memory so that several scripts can
+        be interpreted concurrently (threads or processes) within one host without sharing anything
+
+        Attributes:
+            pragmas (Pragmas): Pragmas of this run; seeded from the defaults and the `#PRAGMA` lines.
+            globals (Common.GlobalList): Variables declared by the script.
+            stdout (TextIO): Stream written to by `stdout`/`stdflush`; defaults to `sys.stdout`.
+            runtime (Runtime): Runtime (and memory) of this run.
+            name (str): Name of the script; used as the output prefix.
+        """
+        self.pragmas: Pragmas = pragmas if pragmas is not None else Pragmas()
+        self.globals: Common.GlobalList = globals if globals is not None else Common.GlobalList()
+        self.stdout: TextIO = stdout if stdout is not None else sys.stdout
+        self.runtime: Runtime = Runtime(self.pragmas)
+        self.name: str = name
+
+    @property
+    def memory(self) -> Memory:
+        return self.runtime.memory
+
+    @staticmethod
+    def current() -> 'InterpreterContext':
+        """
+        Returns the context active in the current thread/task (or `None`)
+        """
+        return _current.get()
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this context (and its pragmas) the active one for the current thread/task
+        """
+        context_token = _current.set(self)
+        pragmas_token = Globals._active.set(self.pragmas)
+        try:
+            yield self
+        finally:
+            Globals._active.reset(pragmas_token)
+            _current.reset(context_token)
@@ -9,4 +9,25 @@ ErrorReferences = {
     "x0008": ["VariableNameDeclarationError", lambda variable_name : f"Unauthorized attempt to declare a variable, {variable_name}; the provided name or type is invalid"],
     "x0009": ["ReferenceError", lambda variable_name : f"Attempted resolution of a non-existent token or symbol; the variable named {variable_name} has not been declared within the local or global scope"],
     "x0010": ["MisplacedCatchError", lambda : f"The usage of the `try`/`catch` statement is invalid; it is impermissible to employ a `catch` clause without an antecedent `try` block defined for error handling"],
-}
\ No newline at end of file
+}
+
+class ScriptError(Exception):
+    def __init__(self, message: str = "", error_type: str = "", *, reference: str = None, **kwargs):
+        """
+        Error raised by the parser or the interpreter; mirrors the arguments of `raise_error`
+
+        Attributes:
+            reference (str): Key of `ErrorReferences` (e.g. "x0009"), if any.
+            kwargs (dict): Arguments of the reference's message.
+        """
+        self.message: str = message
+        self.error_type: str = error_type
+        self.reference: str = reference
+        self.kwargs: dict = kwargs
+
+        super().__init__(ErrorReferences[reference][1](**kwargs) if reference else message)
+
+    @property
+    def status(self) -> str:
+        """ Value of `Interpret.status` when this error is caught in a safe environment """
+        return self.reference or self.error_type
\ No newline at end of file
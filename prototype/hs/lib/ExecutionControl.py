@@ -1,11 +1,15 @@
-from hs.Globals import resetGlobals
+import sys
+
+from hs.lib.Context import InterpreterContext
 
 def END_CODE(code: int = None) -> None:
-    resetGlobals()
+    context = InterpreterContext.current()
+    if context: context.stdout.flush()
 
     exit("\n\n--- HAMENSCRIPT END" + (f"( {code} )" if code else "") + " ---")
 
 def START_CODE(flags: str = None) -> None:
-    resetGlobals()
+    context = InterpreterContext.current()
+    stream = context.stdout if context else sys.stdout
 
-    print(f"--- HAMENSCRIPT START " + (f"~ {flags.upper()}" if flags else "") + " ---\n")
\ No newline at end of file
+    stream.write(f"--- HAMENSCRIPT START " + (f"~ {flags.upper()}" if flags else "") + " ---\n\n")
\ No newline at end of file
@@ -0,0 +1,126 @@
+import re
+from typing import Iterator
+
+from hs.lib.Symbols.Tokens import LineRange
+from hs.lib.Symbols.Operator import Classifications
+from hs.lib.Symbols.Keywords import ReservedKeywords
+from hs.lib.Symbols.Types import String,Number,Boolean
+
+class Lexeme:
+    __slots__ = ("kind", "text", "offset", "range")
+
+    def __init__(self, kind: str, text: str, offset: int, range: LineRange):
+        """
+        Raw piece of source code produced by `Scanner`
+
+        Attributes:
+            kind (str): One of "string", "number", "boolean", "keyword", "decorator", "variable", "operator",
+                "group", "terminator", "newline", "invalid_word" or "invalid".
+            text (str): The matched source text.
+            offset (int): Index of the first character in the source code.
+            range (LineRange): Line and columns of the lexeme.
+        """
+        self.kind = kind
+        self.text = text
+        self.offset = offset
+        self.range = range
+
+    def __repr__(self) -> str:
+        return f"Lexeme({self.kind}, {self.text!r}, {self.range})"
+
+WORD_PATTERNS: list[str] = [
+    r"(?P<decorator>@[a-zA-Z_]\w*)",
+    r"(?P<name>[a-zA-Z_]\w*)",
+    # The lookahead and backreference keep the number whole, so `1.5x` is not read as `1` followed by `.5x`
+    r"(?P<number>(?=(?P<digits>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?))(?P=digits)(?!\w))",
+    r"(?P<invalid_word>@?\w+)",
+]
+""" Named groups matching every kind of bare word; part of the scanner's alternation """
+
+WORD_KINDS: dict[str, str] = {
+    **{x: "keyword" for x in ReservedKeywords},
+    "true": "boolean",
+    "false": "boolean",
+}
+""" Kind of each reserved name; any other name is a "variable" """
+
+SPELLINGS: dict[str, str] = {x: x for x in WORD_KINDS}
+""" One shared string per reserved name, so lexemes (and what is built from them) hold no copy per occurrence """
+
+TOKENS: dict[str, callable] = {
+    "string": String.new,
+    "number": Number.new,
+    "boolean": Boolean.new,
+}
+""" Primitive constructor of each literal lexeme kind """
+
+def _operator_pattern() -> str:
+    operators = {"?", ":", ","}
+    for classification in Classifications:
+        if classification is not Classifications.GroupOperators:
+            operators.update(classification.value)
+
+    # Longest operators first so that e.g. "**=" is never read as "**" and "="
+    return "|".join(re.escape(x) for x in sorted(operators, key = len, reverse = True))
+
+class Scanner:
+    _cache: dict = dict()
+
+    def __init__(self, ml_comments: str, sl_comments: str):
+        """
+        Single-pass, linear-time scanner for HamenScript source code
+
+        Every character is visited by exactly one match of one compiled alternation; use `Scanner.get` to reuse
+        a scanner for the same comment pragmas
+        """
+        self.pattern: re.Pattern = re.compile("|".join([
+            rf"(?P<comment>{ml_comments}|{sl_comments})",
+            r"(?P<newline>\n)",
+            r"(?P<whitespace>[ \t\r\f\v]+)",
+            r"(?P<string>`[^\n`\\]*(?:\\.[^\n`\\]*)*`)", # Runs of plain characters are matched in one step
+            *WORD_PATTERNS,
+            rf"(?P<operator>{_operator_pattern()})",
+            r"(?P<group>[()\[\]{}])",
+            r"(?P<terminator>;)",
+            r"(?P<invalid>.)",
+        ]))
+
+    @staticmethod
+    def get(ml_comments: str, sl_comments: str) -> 'Scanner':
+        key = (ml_comments, sl_comments)
+        if key not in Scanner._cache:
+            Scanner._cache[key] = Scanner(ml_comments, sl_comments)
+
+        return Scanner._cache[key]
+
+    def scan(self, code: str) -> Iterator[Lexeme]:
+        """
+        Yields the lexemes of `code`; whitespace and comments are skipped
+        """
+        line_number = 1
+        line_start = 0
+        for match in self.pattern.finditer(code):
+            kind = match.lastgroup
+            start = match.start()
+
+            if kind == "whitespace":
+                continue
+
+            text = match.group()
+            if kind == "name":
+                kind = WORD_KINDS.get(text, "variable")
+                if kind != "variable":
+                    text = SPELLINGS[text]
+            elif kind == "comment":
+                newlines = text.count("\n")
+                if newlines:
+                    line_number += newlines
+                    line_start = start + text.rindex("\n") + 1
+
+                continue
+
+            yield Lexeme(kind, text, start, LineRange(line_number, start - line_start + 1, match.end() - line_start + 1))
+
+            if kind == "newline":
+                line_number += 1
+                line_start = start + 1
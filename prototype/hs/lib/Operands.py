@@ -0,0 +1,262 @@
+from math import isfinite
+
+from hs.lib.ErrorReferences import ScriptError
+from hs.lib.Symbols.Types import Primitive,Number,String,Boolean,_new,SMALL_INTS,SMALL_INT_MIN,SMALL_INT_MAX
+from hs.lib.Symbols.Array import Array
+
+def _numbers(operator: str, a: Primitive, b: Primitive = None) -> None:
+    if type(a) is not Number or (b is not None and type(b) is not Number):
+        types = " and ".join(x.string_identifier for x in (a, b) if x is not None)
+        raise ScriptError(f"Unsupported operand type(s) for `{operator}`: {types}", "TypeError")
+
+def _not_finite() -> ScriptError:
+    return ScriptError("Numeric result is not a finite real number", "ArithmeticError")
+
+def _number(value: int | float) -> Number:
+    """
+    Wraps the result of an arithmetic operation; integers are always finite, so only floats (and the complex
+    results of e.g. `(-8) ** 0.5`) are checked. Operations mixing an integer too large for a float with a float
+    raise `OverflowError` before getting here; the operators turn it into the same error. Small integers are shared
+    (see `Number.of`)
+    """
+    if type(value) is int:
+        if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            return SMALL_INTS[value - SMALL_INT_MIN]
+    elif type(value) is not float or not isfinite(value):
+        raise _not_finite()
+
+    number = _new(Number)
+    number.real = value
+
+    return number
+
+def _elementwise(operator: str, a: Primitive, b: Primitive) -> Primitive:
+    """
+    Operators on anything but two numbers: arrays are computed element by element (see `Array.operate`), anything
+    else is a type error
+    """
+    if type(a) is Array or type(b) is Array:
+        return Array.operate(operator, a, b)
+
+    _numbers(operator, a, b)
+
+def _ordered(a: Primitive, b: Primitive) -> bool:
+    return type(a) is type(b) and (type(a) is Number or type(a) is String)
+
+def _compare(operator: str, a: Primitive, b: Primitive) -> Array:
+    if type(a) is Array or type(b) is Array:
+        return Array.operate(operator, a, b)
+
+    raise ScriptError(f"Cannot compare {a.string_identifier} and {b.string_identifier} with `{operator}`", "TypeError")
+
+class Operands:
+    """
+    Implementation of every operator on primitive values; `&&`, `||` and `? :` short-circuit and are evaluated by
+    the interpreter instead
+    """
+
+    def XADD(a: Primitive, b: Primitive) -> Primitive:
+        """
+        `+` operator; adds numbers (and arrays of numbers, element by element) and concatenates anything else
+        """
+        if type(a) is Number and type(b) is Number:
+            try:
+                return _number(a.real + b.real)
+            except OverflowError:
+                raise _not_finite()
+
+        if (type(a) is Array and type(b) in (Array, Number)) or (type(b) is Array and type(a) is Number):
+            return Array.operate("+", a, b)
+
+        return String.concat(a, b)
+
+    def XSUBTRACT(a: Primitive, b: Primitive) -> Number:
+        """
+        `-` operator
+        """
+        if type(a) is not Number or type(b) is not Number:
+            return _elementwise("-", a, b)
+
+        try:
+            return _number(a.real - b.real)
+        except OverflowError:
+            raise _not_finite()
+
+    def XMULTIPLY(a: Primitive, b: Primitive) -> Number:
+        """
+        `*` operator
+        """
+        if type(a) is not Number or type(b) is not Number:
+            return _elementwise("*", a, b)
+
+        try:
+            return _number(a.real * b.real)
+        except OverflowError:
+            raise _not_finite()
+
+    def XDIVIDE(a: Primitive, b: Primitive) -> Number:
+        """
+        `/` operator; always a float, like in Python
+        """
+        if type(a) is not Number or type(b) is not Number:
+            return _elementwise("/", a, b)
+
+        if b.real == 0:
+            raise ScriptError("Division by zero", "ZeroDivisionError")
+
+        try:
+            return _number(a.real / b.real)
+        except OverflowError:
+            raise _not_finite()
+
+    def XMODULO(a: Primitive, b: Primitive) -> Number:
+        """
+        `%` operator; the result has the sign of the divisor, like in Python
+        """
+        if type(a) is not Number or type(b) is not Number:
+            return _elementwise("%", a, b)
+
+        if b.real == 0:
+            raise ScriptError("Modulo by zero", "ZeroDivisionError")
+
+        try:
+            return _number(a.real % b.real)
+        except OverflowError:
+            raise _not_finite()
+
+    def XPOWER(a: Primitive, b: Primitive) -> Number:
+        """
+        `**` operator
+        """
+        if type(a) is not Number or type(b) is not Number:
+            return _elementwise("**", a, b)
+
+        try:
+            return _number(a.real ** b.real)
+        except ZeroDivisionError:
+            raise ScriptError("Zero cannot be raised to a negative power", "ZeroDivisionError")
+        except OverflowError:
+            raise _not_finite()
+
+    def XEQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `==` operator; values of different types are equal if they read the same (e.g. `1` and 1)
+        """
+        if type(a) is Array or type(b) is Array:
+            return Array.operate("==", a, b)
+
+        return Boolean.of(a.real == b.real or a.toString() == b.toString())
+
+    def XNOT_EQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `!=` operator
+        """
+        if type(a) is Array or type(b) is Array:
+            return Array.operate("!=", a, b)
+
+        return Boolean.of(not Operands.XEQUAL(a, b).as_bool)
+
+    def XSTRICT_EQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `===` operator; values of different types are never equal
+        """
+        if type(a) is Array or type(b) is Array:
+            return Array.operate("===", a, b)
+
+        return Boolean.of(type(a) is type(b) and a.real == b.real)
+
+    def XSTRICT_NOT_EQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `!==` operator
+        """
+        if type(a) is Array or type(b) is Array:
+            return Array.operate("!==", a, b)
+
+        return Boolean.of(not Operands.XSTRICT_EQUAL(a, b).as_bool)
+
+    def XLESS(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `<` operator
+        """
+        if _ordered(a, b):
+            return Boolean.of(a.real < b.real)
+
+        return _compare("<", a, b)
+
+    def XLESS_EQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `<=` operator
+        """
+        if _ordered(a, b):
+            return Boolean.of(a.real <= b.real)
+
+        return _compare("<=", a, b)
+
+    def XGREATER(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `>` operator
+        """
+        if _ordered(a, b):
+            return Boolean.of(a.real > b.real)
+
+        return _compare(">", a, b)
+
+    def XGREATER_EQUAL(a: Primitive, b: Primitive) -> Boolean:
+        """
+        `>=` operator
+        """
+        if _ordered(a, b):
+            return Boolean.of(a.real >= b.real)
+
+        return _compare(">=", a, b)
+
+    def XNOT(a: Primitive) -> Boolean:
+        """
+        Prefix `!` operator
+        """
+        return Boolean.of(not a.boolean())
+
+    def XNEGATE(a: Primitive) -> Number:
+        """
+        Prefix `-` operator
+        """
+        if type(a) is Array:
+            return Array.negate(a)
+
+        _numbers("-", a)
+        return _number(-a.real)
+
+    def XPLUS(a: Primitive) -> Number:
+        """
+        Prefix `+` operator
+        """
+        if type(a) is Array and a.dtype != "bool":
+            return a
+
+        _numbers("+", a)
+        return a
+
+    Binary: dict[str, callable] = {
+        "+": XADD,
+        "-": XSUBTRACT,
+        "*": XMULTIPLY,
+        "/": XDIVIDE,
+        "%": XMODULO,
+        "**": XPOWER,
+        "==": XEQUAL,
+        "!=": XNOT_EQUAL,
+        "===": XSTRICT_EQUAL,
+        "!==": XSTRICT_NOT_EQUAL,
+        "<": XLESS,
+        "<=": XLESS_EQUAL,
+        ">": XGREATER,
+        ">=": XGREATER_EQUAL,
+    }
+    """ Infix operator -> implementation """
+
+    Unary: dict[str, callable] = {
+        "!": XNOT,
+        "-": XNEGATE,
+        "+": XPLUS,
+    }
+    """ Prefix operator -> implementation """
@@ -0,0 +1,443 @@
+from typing import Iterable
+
+import hs.lib.Syntax as Syntax
+from hs.lib.Lexer import Lexeme,TOKENS
+from hs.lib.Symbols.Types import Primitive,Number
+from hs.lib.ErrorReferences import ScriptError
+from hs.lib.Symbols.Keywords import BlockKeywords
+from hs.lib.Symbols.Operator import Classifications,Precedence,PrefixOperators,RightAssociative,CompoundAssignments
+from hs.lib.Operands import Operands
+
+DECLARATION_SCOPES: dict[str, str] = {"let": "LET", "const": "CONST"}
+""" Scope of the variables each declaration keyword declares """
+
+FOLD_POWER_BITS: int = 4096
+""" Largest estimated size, in bits, of an integer power folded at parse time """
+
+class Parser:
+    def __init__(self, lexemes: Iterable[Lexeme], *, fold_constants: bool = True):
+        """
+        Recursive-descent parser turning the lexemes of a program into an abstract syntax tree in one pass
+
+        Statements end at a `;`, at a `}` closing their block, or at a line break after which the statement
+        cannot continue; expressions are parsed by precedence climbing (see `Operator.Precedence`)
+
+        Attributes:
+            fold_constants (bool): Evaluate operations on literals while parsing.
+            literals (dict[tuple[str, str], Primitive]): Value of every literal parsed so far, by kind and text;
+                repeated literals share one (immutable) value.
+            transactions (int): Number of `transaction` blocks enclosing the statement being parsed.
+        """
+        self.fold_constants: bool = fold_constants
+        self.literals: dict[tuple[str, str], Primitive] = dict()
+        self.transactions: int = 0
+        self.lexemes: list[Lexeme] = []
+        self.breaks: list[bool] = [] # Whether a line break precedes the lexeme at the same index
+        self.index: int = 0
+
+        line_break = False
+        for lexeme in lexemes:
+            if lexeme.kind == "newline":
+                line_break = True
+                continue
+
+            self.lexemes.append(lexeme)
+            self.breaks.append(line_break)
+            line_break = False
+
+    def peek(self, offset: int = 0) -> Lexeme:
+        index = self.index + offset
+        return self.lexemes[index] if index < len(self.lexemes) else None
+
+    def next(self) -> Lexeme:
+        lexeme = self.peek()
+        if lexeme is None:
+            self.error("Unexpected end of code")
+
+        self.index += 1
+        return lexeme
+
+    def check(self, text: str, offset: int = 0) -> bool:
+        lexeme = self.peek(offset)
+        return lexeme is not None and lexeme.kind != "string" and lexeme.text == text
+
+    def expect(self, text: str) -> Lexeme:
+        if not self.check(text):
+            lexeme = self.peek()
+            self.error(f"Expected `{text}` but found " + (f"`{lexeme.text}`" if lexeme else "the end of the code"), lexeme)
+
+        return self.next()
+
+    def error(self, message: str, lexeme: Lexeme = None, error_type: str = "SyntaxError"):
+        lexeme = lexeme or self.peek() or (self.lexemes[-1] if self.lexemes else None)
+        raise ScriptError(message + (f" (line {lexeme.range.line_number}, column {lexeme.range.column_start})" if lexeme else ""), error_type)
+
+    def parse_program(self) -> Syntax.Program:
+        statements = self.parse_statements()
+        if self.peek() is not None:
+            self.error(f"Unexpected `{self.peek().text}`")
+
+        return Syntax.Program(statements)
+
+    def parse_block(self) -> Syntax.Block:
+        start = self.expect("{")
+        statements = self.parse_statements()
+        self.expect("}")
+
+        return Syntax.Block(statements, start.range)
+
+    def parse_statements(self) -> list[Syntax.Node]:
+        statements = []
+        while self.peek() is not None and not self.check("}"):
+            statement = self.parse_statement()
+            if statement is not None:
+                statements.append(statement)
+
+        return statements
+
+    def end_statement(self) -> None:
+        if self.check(";"):
+            self.next()
+        elif self.peek() is not None and not self.check("}") and not self.breaks[self.index]:
+            self.error(f"Expected `;` but found `{self.peek().text}`")
+
+    def end_block_statement(self) -> None:
+        if self.check(";"):
+            self.next()
+
+    def parse_statement(self) -> Syntax.Node:
+        lexeme = self.peek()
+
+        if self.check(";"):
+            self.next()
+            return None
+
+        if lexeme.kind == "decorator":
+            return self.parse_decorated()
+
+        if lexeme.kind == "keyword":
+            keyword = lexeme.text
+            if keyword in DECLARATION_SCOPES:
+                return self.parse_declaration()
+            elif keyword == "stdout":
+                return self.parse_stdout()
+            elif keyword == "stdflush":
+                self.next()
+                self.end_statement()
+                return Syntax.Stdflush(lexeme.range)
+            elif keyword == "if":
+                return self.parse_if()
+            elif keyword == "while":
+                return self.parse_while()
+            elif keyword == "try":
+                return self.parse_try()
+            elif keyword == "function":
+                return self.parse_function([])
+            elif keyword in ("transaction", "atomic"):
+                return self.parse_transaction()
+            elif keyword in ("commit", "rollback"):
+                return self.parse_end_transaction()
+            elif keyword in ("elif", "else"):
+                self.error(f"`{keyword}` statements cannot be independent to a condition tree; ensure you have an `if` statement", lexeme, "ControlFlowError")
+            elif keyword == "catch":
+                raise ScriptError(reference = "x0010")
+            elif keyword in BlockKeywords:
+                self.error(f"`{keyword}` blocks are not supported yet", lexeme)
+
+        if self.check("..."):
+            self.next()
+            self.end_statement()
+            return Syntax.Pass(lexeme.range)
+
+        operator = self.peek(1)
+        if lexeme.kind == "variable" and operator is not None and operator.kind == "operator" and operator.text in Classifications.AssignmentOperators.value:
+            return self.parse_assignment()
+
+        if lexeme.text in ("++", "--") and lexeme.kind == "operator" and operator is not None and operator.kind == "variable":
+            return self.parse_increment()
+
+        expression = self.parse_expression()
+        self.end_statement()
+
+        return Syntax.ExpressionStatement(expression, lexeme.range)
+
+    def parse_declaration(self) -> Syntax.Declaration:
+        declare = self.next()
+        variable = self.peek()
+
+        if variable is None or self.peek(1) is None or self.peek(2) is None or self.check(";", 1) or self.check(";", 2):
+            self.error("Not enough terms", declare)
+        if variable.kind == "keyword":
+            raise ScriptError(reference = "x0003", kwd = variable.text)
+        elif variable.kind != "variable":
+            raise ScriptError(reference = "x0008", variable_name = variable.text)
+
+        self.next()
+        if not self.check("="):
+            raise ScriptError(reference = "x0001")
+
+        self.next()
+        value = self.parse_expression()
+        self.end_statement()
+
+        return Syntax.Declaration(DECLARATION_SCOPES[declare.text], variable.text, value, declare.range)
+
+    def parse_assignment(self) -> Syntax.Assignment:
+        """
+        `name = value`, `name op= value`, `name++` or `name--`; compound assignments are parsed as
+        `name = name op value`
+        """
+        variable = self.next()
+        operator = self.next()
+
+        if operator.text in ("++", "--"):
+            value = Syntax.Literal(Number.new("1"), operator.range)
+        else:
+            value = self.parse_expression()
+
+        if operator.text in CompoundAssignments:
+            value = self.binary(CompoundAssignments[operator.text], Syntax.Name(variable.text, variable.range), value, operator)
+        elif operator.text != "=":
+            raise ScriptError(reference = "x0001")
+
+        self.end_statement()
+
+        return Syntax.Assignment(variable.text, operator.text, value, variable.range)
+
+    def parse_increment(self) -> Syntax.Assignment:
+        """
+        `++name` or `--name`
+        """
+        operator = self.next()
+        variable = self.next()
+        value = self.binary(CompoundAssignments[operator.text], Syntax.Name(variable.text, variable.range), Syntax.Literal(Number.new("1"), operator.range), operator)
+        self.end_statement()
+
+        return Syntax.Assignment(variable.text, operator.text, value, variable.range)
+
+    def parse_stdout(self) -> Syntax.Stdout:
+        keyword = self.next()
+        if self.peek() is None or self.check(";") or self.check("}"):
+            raise ScriptError(reference = "x0004")
+
+        value = self.parse_expression()
+        if not (self.peek() is None or self.check(";") or self.check("}") or self.breaks[self.index]):
+            raise ScriptError(reference = "x0004")
+
+        self.end_statement()
+
+        return Syntax.Stdout(value, keyword.range)
+
+    def parse_condition(self) -> Syntax.Node:
+        self.expect("(")
+        condition = self.parse_expression()
+        self.expect(")")
+
+        return condition
+
+    def parse_if(self) -> Syntax.If:
+        keyword = self.next()
+        branches = [(self.parse_condition(), self.parse_block())]
+        otherwise = None
+
+        while self.check("elif"):
+            self.next()
+            branches.append((self.parse_condition(), self.parse_block()))
+
+        if self.check("else"):
+            self.next()
+            otherwise = self.parse_block()
+
+        self.end_block_statement()
+
+        return Syntax.If(branches, otherwise, keyword.range)
+
+    def parse_while(self) -> Syntax.While:
+        keyword = self.next()
+        condition = self.parse_condition()
+        body = self.parse_block()
+        self.end_block_statement()
+
+        return Syntax.While(condition, body, keyword.range)
+
+    def parse_try(self) -> Syntax.Try:
+        keyword = self.next()
+        body = self.parse_block()
+        handler = None
+
+        if self.check("catch"):
+            self.next()
+            handler = self.parse_block()
+
+        self.end_block_statement()
+
+        return Syntax.Try(body, handler, keyword.range)
+
+    def parse_transaction(self) -> Syntax.Transaction:
+        keyword = self.next()
+        self.transactions += 1
+        body = self.parse_block()
+        self.transactions -= 1
+        self.end_block_statement()
+
+        return Syntax.Transaction(body, keyword.range)
+
+    def parse_end_transaction(self) -> Syntax.EndTransaction:
+        keyword = self.next()
+        if not self.transactions:
+            self.error(f"`{keyword.text}` statements must be inside a `transaction` block", keyword, "ControlFlowError")
+
+        self.end_statement()
+
+        return Syntax.EndTransaction(keyword.text == "rollback", keyword.range)
+
+    def parse_decorated(self) -> Syntax.FunctionDeclaration:
+        decorators = []
+        while self.peek() is not None and self.peek().kind == "decorator":
+            decorators.append(self.next().text[1:])
+
+        if not self.check("function"):
+            self.error("Decorators must precede a function declaration", error_type = "DecoratorError")
+
+        return self.parse_function(decorators)
+
+    def parse_function(self, decorators: list[str]) -> Syntax.FunctionDeclaration:
+        keyword = self.next()
+        name = self.next()
+        if name.kind != "variable":
+            raise ScriptError(reference = "x0008", variable_name = name.text)
+
+        # Parameters are kept as written until functions can be called
+        self.expect("(")
+        parameters = []
+        depth = 1
+        while True:
+            lexeme = self.next()
+            if lexeme.kind == "group":
+                depth += 1 if lexeme.text in "([{" else -1
+                if depth == 0:
+                    break
+
+            parameters.append(lexeme.text)
+
+        body = self.parse_block()
+        self.end_block_statement()
+
+        return Syntax.FunctionDeclaration(name.text, " ".join(parameters), body, decorators, keyword.range)
+
+    def parse_expression(self, precedence: int = 0) -> Syntax.Node:
+        """
+        Parses the longest expression whose operators bind tighter than `precedence`
+        """
+        left = self.parse_prefix()
+
+        while True:
+            lexeme = self.peek()
+            if lexeme is None or lexeme.kind != "operator":
+                return left
+
+            binding = Precedence.get(lexeme.text)
+            if binding is None or binding <= precedence:
+                return left
+
+            self.next()
+            right_precedence = binding - 1 if lexeme.text in RightAssociative else binding
+
+            if lexeme.text == "?":
+                consequent = self.parse_expression()
+                self.expect(":")
+                left = self.conditional(left, consequent, self.parse_expression(right_precedence), lexeme)
+            elif lexeme.text in ("&&", "||"):
+                left = self.logical(lexeme.text, left, self.parse_expression(right_precedence), lexeme)
+            else:
+                left = self.binary(lexeme.text, left, self.parse_expression(right_precedence), lexeme)
+
+    def parse_prefix(self) -> Syntax.Node:
+        lexeme = self.peek()
+        if lexeme is not None and lexeme.kind == "operator" and lexeme.text in PrefixOperators:
+            self.next()
+            operand = self.parse_expression(PrefixOperators[lexeme.text])
+
+            return self.fold(Syntax.Unary(lexeme.text, operand, Operands.Unary[lexeme.text], lexeme.range), operand)
+
+        return self.parse_primary()
+
+    def parse_primary(self) -> Syntax.Node:
+        lexeme = self.peek()
+        if lexeme is None:
+            self.error("Expected a value but found the end of the code")
+
+        kind = lexeme.kind
+        if kind in ("string", "number", "boolean"):
+            self.next()
+            key = (kind, lexeme.text)
+            value = self.literals.get(key)
+            if value is None:
+                value = self.literals[key] = TOKENS[kind](lexeme.text)
+
+            return Syntax.Literal(value, lexeme.range)
+
+        elif kind == "variable":
+            self.next()
+            return Syntax.Name(lexeme.text, lexeme.range)
+
+        elif self.check("("):
+            self.next()
+            expression = self.parse_expression()
+            self.expect(")")
+            return expression
+
+        elif self.check("["):
+            self.next()
+            elements = []
+            while not self.check("]"):
+                if elements:
+                    self.expect(",")
+
+                elements.append(self.parse_expression())
+
+            self.expect("]")
+            return Syntax.ArrayLiteral(elements, lexeme.range)
+
+        elif kind == "keyword":
+            raise ScriptError(reference = "x0003", kwd = lexeme.text)
+
+        elif kind == "invalid_word":
+            raise ScriptError(reference = "x0008", variable_name = lexeme.text)
+
+        self.error(f"Invalid token: \"{lexeme.text}\"", lexeme)
+
+    def binary(self, operator: str, left: Syntax.Node, right: Syntax.Node, lexeme: Lexeme) -> Syntax.Node:
+        return self.fold(Syntax.Binary(operator, left, right, Operands.Binary[operator], lexeme.range), left, right)
+
+    def logical(self, operator: str, left: Syntax.Node, right: Syntax.Node, lexeme: Lexeme) -> Syntax.Node:
+        if self.fold_constants and type(left) is Syntax.Literal:
+            # `true || x` is `true` and `true && x` is `x`, whatever `x` is
+            return left if left.value.boolean() == (operator == "||") else right
+
+        return Syntax.Logical(operator, left, right, lexeme.range)
+
+    def conditional(self, condition: Syntax.Node, consequent: Syntax.Node, alternative: Syntax.Node, lexeme: Lexeme) -> Syntax.Node:
+        if self.fold_constants and type(condition) is Syntax.Literal:
+            return consequent if condition.value.boolean() else alternative
+
+        return Syntax.Conditional(condition, consequent, alternative, lexeme.range)
+
+    def fold(self, node: Syntax.Unary | Syntax.Binary, *operands: Syntax.Node) -> Syntax.Node:
+        """
+        Replaces an operation on literals by its result; operations that fail (e.g. `1 / 0`) are kept so that
+        the error is raised only if the code is reached
+        """
+        if not self.fold_constants or any(type(x) is not Syntax.Literal for x in operands):
+            return node
+
+        # `10 ** 10 ** 9` would take minutes to compute, so huge powers are only computed if they are reached
+        if type(node) is Syntax.Binary and node.operator == "**":
+            base, exponent = (getattr(x.value, "real", None) for x in operands)
+            if type(base) is int and type(exponent) is int and exponent * base.bit_length() > FOLD_POWER_BITS:
+                return node
+
+        try:
+            return Syntax.Literal(node.function(*(x.value for x in operands)), node.range)
+        except ScriptError:
+            return node
@@ -0,0 +1,193 @@
+_BITS: int = 5
+_MASK: int = (1 << _BITS) - 1
+_HASH_BITS: int = 64
+""" Python hashes of strings and numbers fit in 64 bits; keys whose hashes are equal share a `_CollisionNode` """
+
+_NODE = object()
+""" Placed instead of a key in `_BitmapNode.array` when the next item is a child node rather than a value """
+
+class _BitmapNode:
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap: int, array: tuple):
+        """
+        Trie node of up to 32 items, one per 5-bit slice of the key's hash; `bitmap` tells which slices are present
+        and `array` holds them in order, as `key, value` pairs (or `_NODE, child` pairs)
+        """
+        self.bitmap: int = bitmap
+        self.array: tuple = array
+
+    def get(self, shift: int, hash: int, key, default):
+        node = self
+        while type(node) is _BitmapNode:
+            bit = 1 << ((hash >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return default
+
+            index = 2 * (node.bitmap & (bit - 1)).bit_count()
+            item = node.array[index]
+            if item is not _NODE:
+                return node.array[index + 1] if item is key or item == key else default
+
+            node = node.array[index + 1]
+            shift += _BITS
+
+        return node.get(shift, hash, key, default)
+
+    def set(self, shift: int, hash: int, key, value) -> tuple['_BitmapNode', bool]:
+        """
+        Returns the node with `key` set to `value`, and whether the key was added; only the nodes on the path to
+        the key are copied, every other node is shared with this one
+        """
+        bit = 1 << ((hash >> shift) & _MASK)
+        index = 2 * (self.bitmap & (bit - 1)).bit_count()
+        array = self.array
+
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, array[:index] + (key, value) + array[index:]),True
+
+        item,current = array[index],array[index + 1]
+        if item is _NODE:
+            child,added = current.set(shift + _BITS, hash, key, value)
+            if child is current:
+                return self,False
+
+            key = _NODE
+        elif item is key or item == key:
+            if current is value:
+                return self,False
+
+            child,added,key = value,False,item
+        else:
+            child,added,key = _pair(shift + _BITS, item, current, hash, key, value),True,_NODE
+
+        return _BitmapNode(self.bitmap, array[:index] + (key, child) + array[index + 2:]),added
+
+    def items(self):
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is _NODE:
+                yield from array[i + 1].items()
+            else:
+                yield array[i],array[i + 1]
+
+class _CollisionNode:
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, hash: int, pairs: tuple):
+        """
+        Leaf holding the keys whose hashes are all equal to `hash`, as a flat tuple of `key, value` pairs
+        """
+        self.hash: int = hash
+        self.pairs: tuple = pairs
+
+    def get(self, shift: int, hash: int, key, default):
+        pairs = self.pairs
+        for i in range(0, len(pairs), 2):
+            if pairs[i] == key:
+                return pairs[i + 1]
+
+        return default
+
+    def set(self, shift: int, hash: int, key, value) -> tuple['_BitmapNode | _CollisionNode', bool]:
+        if hash != self.hash:
+            # Another hash reached this leaf; push it down under a node that tells them apart
+            node = _BitmapNode(1 << ((self.hash >> shift) & _MASK), (_NODE, self))
+            return node.set(shift, hash, key, value)
+
+        pairs = self.pairs
+        for i in range(0, len(pairs), 2):
+            if pairs[i] == key:
+                if pairs[i + 1] is value:
+                    return self,False
+
+                return _CollisionNode(hash, pairs[:i + 1] + (value,) + pairs[i + 2:]),False
+
+        return _CollisionNode(hash, pairs + (key, value)),True
+
+    def items(self):
+        pairs = self.pairs
+        for i in range(0, len(pairs), 2):
+            yield pairs[i],pairs[i + 1]
+
+def _pair(shift: int, key1, value1, hash2: int, key2, value2) -> _BitmapNode | _CollisionNode:
+    """
+    Node holding two different keys that fell in the same slot of the node above
+    """
+    hash1 = _hash(key1)
+    if hash1 == hash2 or shift >= _HASH_BITS:
+        return _CollisionNode(hash1, (key1, value1, key2, value2))
+
+    node,_ = _BitmapNode(0, ()).set(shift, hash1, key1, value1)
+    node,_ = node.set(shift, hash2, key2, value2)
+
+    return node
+
+def _hash(key) -> int:
+    return hash(key) & 0xFFFFFFFFFFFFFFFF
+
+_EMPTY: _BitmapNode = _BitmapNode(0, ())
+
+class PersistentMap:
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: dict = None):
+        """
+        Immutable hash-array-mapped trie; `set` returns a new map that shares every node but those on the path to
+        the key, so keeping an old version (a snapshot) costs nothing and writes cost O(log32 n)
+
+        Attributes:
+            _root (_BitmapNode): Root of the trie.
+            _size (int): Number of keys.
+        """
+        self._root: _BitmapNode = _EMPTY
+        self._size: int = 0
+
+        for key,value in (items or {}).items():
+            self._root,added = self._root.set(0, _hash(key), key, value)
+            self._size += added
+
+    def get(self, key, default = None):
+        # `_BitmapNode.get`, inlined; reading a variable by name goes through here
+        hash = _hash(key)
+        node = self._root
+        shift = 0
+        while type(node) is _BitmapNode:
+            bitmap = node.bitmap
+            bit = 1 << ((hash >> shift) & _MASK)
+            if not bitmap & bit:
+                return default
+
+            index = 2 * (bitmap & (bit - 1)).bit_count()
+            array = node.array
+            item = array[index]
+            if item is not _NODE:
+                return array[index + 1] if item is key or item == key else default
+
+            node = array[index + 1]
+            shift += _BITS
+
+        return node.get(shift, hash, key, default)
+
+    def set(self, key, value) -> 'PersistentMap':
+        root,added = self._root.set(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+
+        result = PersistentMap.__new__(PersistentMap)
+        result._root = root
+        result._size = self._size + added
+
+        return result
+
+    def __contains__(self, key) -> bool:
+        return self._root.get(0, _hash(key), key, _NODE) is not _NODE
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return (key for key,_ in self._root.items())
+
+    def items(self):
+        return self._root.items()
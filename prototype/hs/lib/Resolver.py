@@ -0,0 +1,102 @@
+import hs.lib.Syntax as Syntax
+from hs.lib.ErrorReferences import ScriptError
+
+class Resolver:
+    def __init__(self):
+        """
+        Resolves every variable of a parsed program to a slot of a single, fixed-size frame
+
+        Blocks are lexical scopes: a block's variables take the next free slots while the block is being resolved,
+        and the slots are handed out again once it ends, so the frame only needs as many slots as the deepest chain
+        of nested declarations. Names that no enclosing block declares are left unresolved (`slot = None`) and are
+        looked up by name at runtime.
+        """
+        self.scopes: list[dict[str, int]] = []
+        self.next_slot: int = 0
+        self.frame_size: int = 0
+
+        self.handlers: dict = {
+            Syntax.Declaration: self.resolve_declaration,
+            Syntax.Assignment: self.resolve_assignment,
+            Syntax.Stdout: lambda node : self.resolve(node.value),
+            Syntax.Stdflush: lambda node : None,
+            Syntax.If: self.resolve_if,
+            Syntax.While: self.resolve_while,
+            Syntax.Try: self.resolve_try,
+            Syntax.Transaction: lambda node : self.resolve_block(node.body),
+            Syntax.EndTransaction: lambda node : None,
+            Syntax.FunctionDeclaration: lambda node : None, # Functions cannot be called yet
+            Syntax.ExpressionStatement: lambda node : self.resolve(node.expression),
+            Syntax.Pass: lambda node : None,
+            Syntax.Literal: lambda node : None,
+            Syntax.Name: self.resolve_name,
+            Syntax.Unary: lambda node : self.resolve(node.operand),
+            Syntax.Binary: lambda node : (self.resolve(node.left), self.resolve(node.right)),
+            Syntax.Logical: lambda node : (self.resolve(node.left), self.resolve(node.right)),
+            Syntax.Conditional: lambda node : (self.resolve(node.condition), self.resolve(node.consequent), self.resolve(node.alternative)),
+            Syntax.ArrayLiteral: lambda node : [self.resolve(x) for x in node.elements],
+        }
+
+    def resolve_program(self, program: Syntax.Program) -> Syntax.Program:
+        self.resolve_block(program)
+        program.frame_size = self.frame_size
+
+        return program
+
+    def resolve(self, node: Syntax.Node) -> None:
+        self.handlers[type(node)](node)
+
+    def resolve_block(self, block: Syntax.Block) -> None:
+        block.first_slot = self.next_slot
+        self.scopes.append(dict())
+
+        for statement in block.statements:
+            self.resolve(statement)
+
+        block.slot_count = len(self.scopes.pop())
+        self.next_slot = block.first_slot
+
+    def lookup(self, name: str) -> int:
+        for scope in reversed(self.scopes):
+            slot = scope.get(name)
+            if slot is not None:
+                return slot
+
+        return None
+
+    def resolve_declaration(self, node: Syntax.Declaration) -> None:
+        # The value is resolved first; `let x = x;` refers to an outer `x`
+        self.resolve(node.value)
+
+        scope = self.scopes[-1]
+        if node.name in scope:
+            raise ScriptError(reference = "x0002")
+
+        node.depth = len(self.scopes) - 1
+        node.slot = scope[node.name] = self.next_slot
+        self.next_slot += 1
+        self.frame_size = max(self.frame_size, self.next_slot)
+
+    def resolve_assignment(self, node: Syntax.Assignment) -> None:
+        self.resolve(node.value)
+        node.slot = self.lookup(node.name)
+
+    def resolve_name(self, node: Syntax.Name) -> None:
+        node.slot = self.lookup(node.name)
+
+    def resolve_if(self, node: Syntax.If) -> None:
+        for condition,block in node.branches:
+            self.resolve(condition)
+            self.resolve_block(block)
+
+        if node.otherwise:
+            self.resolve_block(node.otherwise)
+
+    def resolve_while(self, node: Syntax.While) -> None:
+        self.resolve(node.condition)
+        self.resolve_block(node.body)
+
+    def resolve_try(self, node: Syntax.Try) -> None:
+        self.resolve_block(node.body)
+        if node.handler:
+            self.resolve_block(node.handler)
@@ -0,0 +1,280 @@
+import math
+import operator
+from array import array
+
+from hs.lib.ErrorReferences import ScriptError
+from hs.lib.Symbols.Types import Primitive,Number,Boolean
+
+_numpy = None
+""" The `numpy` module once `backend()` has imported it, or `False` if it is not installed """
+
+def backend():
+    """
+    Returns the `numpy` module, imported on first use (it would double the start-up time of every script otherwise),
+    or `None` if it is not installed; arrays are then stored in `array.array` and computed element by element
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+
+    return _numpy or None
+
+TYPECODES: dict[str, str] = {"int64": "q", "float64": "d", "bool": "b"}
+""" `array.array` typecode of every element type, used without NumPy """
+
+ARITHMETIC: dict[str, tuple[str, callable]] = {
+    "+": ("add", operator.add),
+    "-": ("subtract", operator.sub),
+    "*": ("multiply", operator.mul),
+    "/": ("true_divide", operator.truediv),
+    "%": ("remainder", operator.mod),
+    "**": ("power", operator.pow),
+}
+""" Arithmetic operator -> (NumPy ufunc, Python function) """
+
+COMPARISON: dict[str, tuple[str, callable]] = {
+    "==": ("equal", operator.eq),
+    "!=": ("not_equal", operator.ne),
+    "<": ("less", operator.lt),
+    "<=": ("less_equal", operator.le),
+    ">": ("greater", operator.gt),
+    ">=": ("greater_equal", operator.ge),
+}
+""" Comparison operator -> (NumPy ufunc, Python function); `===` and `!==` also compare numbers and booleans """
+
+def _dtype(values: list) -> str:
+    if all(type(x) is bool for x in values):
+        return "bool" if values else "float64"
+
+    return "int64" if all(type(x) is int for x in values) else "float64"
+
+class Array(Primitive):
+    __slots__ = ("dtype",)
+
+    string_identifier: str = "array"
+
+    prototype: dict[str, callable] = {
+        **Primitive.prototype,
+        "sum": lambda self : self.sum(),
+        "min": lambda self : self.min(),
+        "max": lambda self : self.max(),
+        "mean": lambda self : self.mean(),
+    }
+
+    def __init__(self, values: list[int | float | bool] = None, dtype: str = None):
+        """
+        Fixed-type array of numbers or booleans; operators apply to every element at once (see `Array.operate`)
+
+        Attributes:
+            real: The elements, in a `numpy.ndarray` or, without NumPy, an `array.array`.
+            dtype (str): "int64", "float64" or "bool".
+        """
+        values = list(values or [])
+        self.dtype: str = dtype or _dtype(values)
+
+        numpy = backend()
+        try:
+            if numpy:
+                self.real = numpy.array(values, dtype = self.dtype)
+            else:
+                self.real = array(TYPECODES[self.dtype], values)
+        except (OverflowError, TypeError, ValueError):
+            raise ScriptError(f"Array elements do not fit in {self.dtype}", "TypeError")
+
+    def __getattr__(self, name: str):
+        # Only called for unset slots; the text of an array is only built if it is read
+        if name == "value":
+            self.value = self.toString()
+            return self.value
+
+        raise AttributeError(f"'Array' object has no attribute '{name}'")
+
+    def tolist(self) -> list[int | float | bool]:
+        values = self.real.tolist()
+        if self.dtype == "bool" and type(self.real) is array:
+            return [bool(x) for x in values]
+
+        return values
+
+    def toString(self) -> str:
+        return "[" + ", ".join(map(str, self.tolist())) + "]"
+
+    def boolean(self) -> bool:
+        return len(self.real) != 0
+
+    @staticmethod
+    def of(values, dtype: str) -> 'Array':
+        """
+        Wraps an `numpy.ndarray` or `array.array` of `dtype` elements without copying it
+        """
+        instance = Array.__new__(Array)
+        instance.real = values
+        instance.dtype = dtype
+
+        return instance
+
+    @staticmethod
+    def from_primitives(values: list[Primitive]) -> 'Array':
+        """
+        Array of the values of an array literal; every element must be a number or a boolean
+        """
+        for x in values:
+            if type(x) is not Number and type(x) is not Boolean:
+                raise ScriptError(f"Array elements must be numbers or booleans, not {x.string_identifier}", "TypeError")
+
+        return Array([x.real for x in values])
+
+    def sum(self) -> Number:
+        if backend():
+            return _finite(self.real.sum().item())
+
+        return _finite(sum(self.real) if self.dtype != "float64" else float(sum(self.real)))
+
+    def min(self) -> Primitive:
+        self._nonempty("min")
+        return self._scalar(self.real.min().item() if backend() else min(self.real))
+
+    def max(self) -> Primitive:
+        self._nonempty("max")
+        return self._scalar(self.real.max().item() if backend() else max(self.real))
+
+    def mean(self) -> Number:
+        self._nonempty("mean")
+        if backend():
+            return _finite(self.real.mean().item())
+
+        return _finite(sum(self.real) / len(self.real))
+
+    def _nonempty(self, method: str) -> None:
+        if not len(self.real):
+            raise ScriptError(f"`{method}` of an empty array", "ValueError")
+
+    def _scalar(self, value: int | float | bool) -> Primitive:
+        return Boolean.of(bool(value)) if self.dtype == "bool" else Number.of(value)
+
+    @staticmethod
+    def operate(operator: str, a: Primitive, b: Primitive) -> 'Array':
+        """
+        Applies a binary arithmetic or comparison operator to every element of `a` and/or `b`, one of which is an
+        array; the other is an array of the same length or a number (a boolean for `==`, `!=`, `===` and `!==`)
+
+        Arithmetic follows the scalar operators: `/` always gives floats, dividing by zero and non-finite results
+        are errors. With NumPy, `int64` results wrap around like the machine type instead of growing
+        """
+        numpy = backend()
+        left,right,left_type,right_type = a.real,b.real,_element_type(a),_element_type(b)
+
+        if left_type is None or right_type is None:
+            raise ScriptError(f"Unsupported operand type(s) for `{operator}`: {a.string_identifier} and {b.string_identifier}", "TypeError")
+
+        if type(a) is Array and type(b) is Array and len(a.real) != len(b.real):
+            raise ScriptError(f"Arrays of different lengths ({len(a.real)} and {len(b.real)}) for `{operator}`", "ValueError")
+
+        if operator in ("===", "!=="):
+            # Like for scalars, integers and floats are both numbers; only numbers and booleans differ
+            if (left_type == "bool") != (right_type == "bool"):
+                return _filled(a if type(a) is Array else b, operator == "!==")
+
+            operator = operator[:-1]
+
+        if operator in COMPARISON:
+            if operator not in ("==", "!=") and "bool" in (left_type, right_type):
+                raise ScriptError(f"Cannot compare {a.string_identifier} and {b.string_identifier} with `{operator}`", "TypeError")
+
+            ufunc,function = COMPARISON[operator]
+            try:
+                if numpy:
+                    return Array.of(getattr(numpy, ufunc)(left, right), "bool")
+
+                return Array.of(array("b", _elementwise(function, left, right)), "bool")
+            except OverflowError: # A number outside of the range of int64
+                raise ScriptError(f"Cannot compare {a.string_identifier} and {b.string_identifier} with `{operator}`", "TypeError")
+
+        if "bool" in (left_type, right_type):
+            raise ScriptError(f"Unsupported operand type(s) for `{operator}`: {a.string_identifier} and {b.string_identifier}", "TypeError")
+
+        if operator in ("/", "%") and not _all(numpy, right):
+            raise ScriptError("Division by zero" if operator == "/" else "Modulo by zero", "ZeroDivisionError")
+
+        dtype = "float64" if operator == "/" or "float64" in (left_type, right_type) else "int64"
+        if operator == "**" and dtype == "int64" and not _all(numpy, right, negative = False):
+            dtype = "float64" # Like `2 ** -1`, negative integer powers are fractions
+
+        ufunc,function = ARITHMETIC[operator]
+        try:
+            if numpy:
+                with numpy.errstate(all = "ignore"):
+                    result = getattr(numpy, ufunc)(left, right, dtype = dtype)
+
+                if dtype == "float64" and not numpy.isfinite(result).all():
+                    raise OverflowError()
+
+                return Array.of(result, dtype)
+
+            values = _elementwise(function, left, right)
+            if dtype == "float64":
+                values = [float(x) for x in values]
+                if not all(map(math.isfinite, values)):
+                    raise OverflowError()
+
+            return Array.of(array(TYPECODES[dtype], values), dtype)
+        except (OverflowError, TypeError): # Also complex results, e.g. of `(-8) ** 0.5` without NumPy
+            raise ScriptError("Numeric result is not a finite real number", "ArithmeticError")
+
+    @staticmethod
+    def negate(a: 'Array') -> 'Array':
+        if a.dtype == "bool":
+            raise ScriptError("Unsupported operand type(s) for `-`: array of booleans", "TypeError")
+
+        if backend():
+            return Array.of(-a.real, a.dtype)
+
+        return Array.of(array(a.real.typecode, [-x for x in a.real]), a.dtype)
+
+def _finite(value: int | float) -> Number:
+    if type(value) is float and not math.isfinite(value):
+        raise ScriptError("Numeric result is not a finite real number", "ArithmeticError")
+
+    return Number.of(value)
+
+def _element_type(value: Primitive) -> str:
+    """
+    The element type `value` takes part in an operation as; `None` if it cannot take part
+    """
+    if type(value) is Array:
+        return value.dtype
+    elif type(value) is Number:
+        return "int64" if type(value.real) is int else "float64"
+    elif type(value) is Boolean:
+        return "bool"
+
+    return None
+
+def _elementwise(function: callable, left, right) -> list:
+    if type(left) is not array:
+        return [function(left, y) for y in right]
+    elif type(right) is not array:
+        return [function(x, right) for x in left]
+
+    return [function(x, y) for x,y in zip(left, right)]
+
+def _all(numpy, values, *, negative: bool = True) -> bool:
+    """
+    Whether every value is nonzero (or, with `negative = False`, not negative)
+    """
+    if numpy:
+        return bool(numpy.all(values != 0) if negative else numpy.all(values >= 0))
+
+    values = values if type(values) is array else [values]
+    return all(x != 0 for x in values) if negative else all(x >= 0 for x in values)
+
+def _filled(shape: Array, value: bool) -> Array:
+    numpy = backend()
+    if numpy:
+        return Array.of(numpy.full(len(shape.real), value), "bool")
+
+    return Array.of(array("b", [value]) * len(shape.real), "bool")
@@ -1,26 +1,5 @@
 from enum import Enum
 
-from hs.lib.staticproperty import staticproperty
-from hs.lib.Symbols.Tokens import Token
-
-class Operator(Token):
-    def __init__(self, operator: str = None):
-        self.operator: str = operator
-        self.classification: str = Classifications.match(operator)
-
-        # Define this as each primitive type has the `self.value` property
-        self.value: str = operator
-
-    def boolean(self) -> bool:
-        return self.operator == "+"
-
-    @staticproperty
-    def string_identifier(self) -> str:
-        return "operator"
-
-    def __str__(self) -> str:
-        return self.operator
-
 class Classifications(Enum):
     GroupOperators = ["(", ")", "[", "]", "{", "}"]
     AssignmentOperators = ["=", "+=", "-=", "*=", "/=", "%=", "**=", "++", "--"]
@@ -44,4 +23,24 @@ class Classifications(Enum):
         elif operator in classifications.SpecialOperators.value:
             return "SPECIAL"
 
-        return None
\ No newline at end of file
+        return None
+
+Precedence: dict[str, int] = {
+    "?": 1,
+    "||": 2,
+    "&&": 3,
+    "==": 4, "!=": 4, "===": 4, "!==": 4,
+    "<": 5, "<=": 5, ">": 5, ">=": 5,
+    "+": 6, "-": 6,
+    "*": 7, "/": 7, "%": 7,
+    "**": 9,
+}
+""" Binding power of every infix operator; higher binds tighter """
+
+PrefixOperators: dict[str, int] = {"!": 8, "-": 8, "+": 8}
+""" Binding power of every prefix operator; `-2 ** 2` is `-(2 ** 2)` """
+
+RightAssociative: frozenset[str] = frozenset({"**", "?"})
+
+CompoundAssignments: dict[str, str] = {"+=": "+", "-=": "-", "*=": "*", "/=": "/", "%=": "%", "**=": "**", "++": "+", "--": "-"}
+""" Assignment operator -> arithmetic operator applied to the variable's current value """
@@ -1,6 +1,29 @@
-from hs.lib.staticproperty import staticproperty
+class LineRange:
+    __slots__ = ("line_number", "column_start", "column_end")
+
+    def __init__(self, line_number: int, column_start: int, column_end: int):
+        """
+        Represents a range of line and column numbers in the source code.
+        Used for tracking where a token is found in the source code.
+
+        Args:
+            line_number (int): The line number in the source code.
+            column_start (int): The starting column number.
+            column_end (int): The ending column number.
+        """
+        self.line_number = line_number
+        self.column_start = column_start
+        self.column_end = column_end
+
+    def __str__(self) -> str:
+        return f"{self.line_number}:{self.column_start}"
 
 class Token:
+    __slots__ = ()
+
+    range: LineRange = None
+    """ Where this token was found in the source code; set by the lexer """
+
     def __init__(self):
         """
         Represents a generic token in the source code.
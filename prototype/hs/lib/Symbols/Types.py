@@ -1,32 +1,32 @@
 import re
 
-from hs.lib.staticproperty import staticproperty
 from hs.lib.Symbols.Tokens import Token
 from hs.Globals import *
 
 class Primitive(Token):
+    __slots__ = ("value", "real")
+
+    prototype: dict[str, callable] = {
+        "toString": lambda self : self.toString(),
+    }
+    """ Methods accessible in the language, by name; shared by every instance of the type and called with the instance """
+
+    is_constant: bool = False
+    """ Indicates whether the value is constant and cannot be changed """
+
+    string_identifier: str = "primitive"
+
     def __init__(self):
         """
         Represents a primitive value token in the source code.
 
         Attributes:
             value (str): The string representation of the primitive value.
-            prototype (dict): A dictionary of methods accessible in the language.
-            constant (bool): Indicates whether the value is constant and cannot be changed.
+            real: The machine value (`str`, `int`/`float` or `bool`).
         """
         self.value: str = ""
-
-        self.prototype: dict = {
-            "toString": lambda: self.toString()
-        }
-
-        self.is_constant = False
         self.real = None
 
-    @staticproperty
-    def string_identifier(self) -> str:
-        return "primitive"
-
     def toString(self) -> str:
         """
         Converts the primitive value to a string representation.
@@ -72,74 +72,139 @@ class Primitive(Token):
         pass  # Implementation would depend on the specific primitive type
 
 class String(Primitive):
+    __slots__ = ("_pieces", "_count")
+
+    string_identifier: str = "string"
+
+    match_regex: re.Pattern = re.compile(r"(`[^\n`\\]*(?:\\.[^\n`\\]*)*`)")
+
+    block_regex: re.Pattern = re.compile(r"^(```).*(```)$")
+    """ A string delimited by triple backticks """
+
     def __init__(self, value: str = ""):
         """
         Represents a string primitive type.
+
+        The result of a concatenation (see `String.concat`) is a rope: its `value` and `real` are only joined
+        together, once, when they are first read.
         """
         super().__init__()
 
+        self._pieces: list[str] = None
         self.value = String.parse_escape_sequences(value)
         self.real = self.value
 
+    def __getattr__(self, name: str):
+        # Only called for unset slots, i.e. the `value` and `real` of a rope that was never read
+        if (name == "value" or name == "real") and self._pieces is not None:
+            pieces = self._pieces
+            self.value = self.real = "".join(pieces if len(pieces) == self._count else pieces[:self._count])
+
+            return self.value
+
+        raise AttributeError(f"'String' object has no attribute '{name}'")
+
     def boolean(self) -> bool:
         return len(self.real) != 0
 
     @staticmethod
     def parse_escape_sequences(string: str) -> str:
-        new_string = ""
-        skip = False
-        for i,char in enumerate(string):
-            if skip:
-                skip = False
-                continue
-
-            if char == "\\" and string[i-1] != "\\":
-                match string[i+1]:
-                    case "n":
-                        new_string += "\n"
-                    case "t":
-                        new_string += getGlobal("__TAB_SIZE__") * getGlobal("__TAB_BASE__")
-                    case _:
-                        new_string += char
-                        continue
-
-                skip = True
-                continue
-
-            new_string += char
-        return new_string
-
-    @staticproperty
-    def string_identifier(self) -> str:
-        return "string"
+        """
+        Decodes the escape sequences of a string literal's contents (see `EscapeSequences`)
+
+        The string is split on `\\\\` first; no other escape can then overlap, so every piece is decoded with
+        plain `str.replace` calls and the pieces are joined back with single backslashes. `\\t` expands to the
+        `__TAB_SIZE__` and `__TAB_BASE__` pragmas; unknown escapes are kept as written
+        """
+        if "\\" not in string:
+            return string
+
+        tab = getGlobal("__TAB_SIZE__") * getGlobal("__TAB_BASE__") if "\\t" in string else None
+
+        def decode(piece: str) -> str:
+            if "\\" not in piece:
+                return piece
+
+            for sequence,replacement in EscapeSequences.items():
+                piece = piece.replace(sequence, replacement)
+
+            if tab is not None:
+                piece = piece.replace("\\t", tab)
+
+            if "\\u" in piece:
+                piece = UNICODE_ESCAPE.sub(lambda match : chr(int(match.group(1), 16)), piece)
+
+            return piece
+
+        return "\\".join([decode(x) for x in string.split("\\\\")])
 
     def toString(self) -> str:
         return f"{self.value}"
 
-    @staticproperty
-    def match_regex(self) -> str:
-        return r"(`(?:(?:\\.|(?:[^\n`\\]))*)`)"
-
     @staticmethod
     def test(value: str) -> bool:
-        return True if re.findall(String.match_regex, value) else False
+        return String.match_regex.search(value) is not None
 
     @staticmethod
     def new(value: str) -> 'String':
         # assert String.test(value)
-        if re.findall(r"^(```).*(```)$", value):
+        if String.block_regex.search(value):
             value = value[3:-3]
         elif value.startswith("`") and value.endswith("`"):
             value = value[1:-1]
 
-        value = String.parse_escape_sequences(value)
+        return String.of(String.parse_escape_sequences(value))
+
+    @staticmethod
+    def concat(left: Primitive, right: Primitive) -> 'String':
+        """
+        `left + right` as a rope, without copying the text of `left`
+
+        Ropes share one append-only list of pieces and each knows how many of its first pieces it spans. Appending
+        to the rope that spans the whole list (e.g. `s = s + x` in a loop) adds a piece in place; any other rope
+        copies its pieces first, so a value that was already built never changes
+        """
+        pieces = left._pieces if type(left) is String else None
+        if pieces is None:
+            pieces = [left.toString()]
+        elif len(pieces) != left._count:
+            pieces = pieces[:left._count]
+
+        pieces.append(right.toString())
+
+        string = String.__new__(String)
+        string._pieces = pieces
+        string._count = len(pieces)
 
+        return string
+
+    @staticmethod
+    def of(value: str) -> 'String':
+        """
+        Wraps an already-decoded string (e.g. the result of a concatenation) without parsing it again
+        """
         string = String()
         string.value = value
+        string.real = value
 
         return string
 
+EscapeSequences: dict[str, str] = {
+    "\\n": "\n",
+    "\\r": "\r",
+    "\\`": "`",
+}
+""" Escape sequence -> the character it stands for; `\\\\`, `\\t` and `\\uXXXX` are decoded by `String.parse_escape_sequences` """
+
+UNICODE_ESCAPE: re.Pattern = re.compile(r"\\u([0-9a-fA-F]{4})")
+
 class Boolean(Primitive):
+    __slots__ = ("as_bool",)
+
+    string_identifier: str = "boolean"
+
+    boolean_regex: re.Pattern = re.compile(r"^(false|true)$")
+
     def __init__(self):
         """
         Represents a boolean primitive type.
@@ -149,79 +214,122 @@ class Boolean(Primitive):
         self.as_bool: bool = False
         self.real = self.as_bool
 
-    @staticproperty
-    def string_identifier(self) -> str:
-        return "boolean"
-    
     def toString(self) -> str:
         return str(self.as_bool)
 
     def boolean(self) -> bool:
         return self.as_bool
 
-    @staticproperty
-    def boolean_regex(self) -> str:
-        return r"^(false|true)$"
-
     @staticmethod
     def test(value: str) -> bool:
-        return True if re.findall(Boolean.boolean_regex, value) else False
+        return Boolean.boolean_regex.search(value) is not None
 
     @staticmethod
     def new(value: str) -> 'Boolean':
         assert Boolean.test(value)
 
+        return TRUE if value == "true" else FALSE
+
+    @staticmethod
+    def of(value: bool) -> 'Boolean':
+        """
+        The shared instance of a machine boolean (e.g. the result of a comparison)
+        """
+        return TRUE if value else FALSE
+
+    @staticmethod
+    def _create(value: bool) -> 'Boolean':
         boolean = Boolean()
-        boolean.value = value
-        boolean.as_bool = True if value == "bool" else False
-        boolean.real = boolean.as_bool
+        boolean.value = "true" if value else "false"
+        boolean.as_bool = value
+        boolean.real = value
 
         return boolean
 
+TRUE: Boolean = Boolean._create(True)
+FALSE: Boolean = Boolean._create(False)
+""" The only two booleans; primitives are immutable, so every `true` and every comparison result shares them """
+
 class Number(Primitive):
-    def __init__(self):
+    __slots__ = ()
+
+    string_identifier: str = "number"
+
+    number_regex: re.Pattern = re.compile(r"^((\-)?(\d*)(\.?)(\d*)((e|E)(\-|\+)?(\d*)(\.?)(\d+))?)$")
+
+    def __init__(self, value: int | float = 0.0):
         """
         Represents a number primitive type.
+
+        Only the machine value (`real`, an `int` or a `float`) is stored; `value`, the text of the number, is
+        derived from it the first time it is read, unless the number was read from source code (see `Number.new`)
         """
-        super().__init__()
-        self.value: str = ""
-        self.as_number: float = 0.0
-        self.real = self.as_number
+        self.real: int | float = value
 
-    @staticproperty
-    def string_identifier(self) -> str:
-        return "number"
+    def __getattr__(self, name: str):
+        # Only called for unset slots, i.e. the `value` of a number that was computed rather than read from source
+        if name == "value":
+            self.value = str(self.real)
+            return self.value
+
+        raise AttributeError(f"'Number' object has no attribute '{name}'")
+
+    @property
+    def as_number(self) -> int | float:
+        """
+        The machine value; same as `real`
+        """
+        return self.real
 
     def boolean(self) -> bool:
-        return self.as_number == 0
+        return self.real != 0
     
     def toString(self) -> str:
-        return str(self.as_number)
-
-    @staticproperty
-    def number_regex(self) -> str:
-        return r"^((\-)?(\d*)(\.?)(\d*)((e|E)(\-|\+)?(\d*)(\.?)(\d+))?)$"
+        return str(self.real)
 
     @staticmethod
     def test(value: str) -> bool:
-        return True if re.findall(Number.number_regex, value) else False
+        return Number.number_regex.search(value) is not None
 
     @staticmethod
     def new(value: str) -> 'Number':
-        assert Number.test(value)
+        real = parse_number(value)
+        assert real is not False
+
+        if type(real) is int and SMALL_INT_MIN <= real <= SMALL_INT_MAX and value == str(real):
+            return SMALL_INTS[real - SMALL_INT_MIN]
 
-        number = Number()
+        number = Number(real)
         number.value = value
-        number.as_number = parse_number(value)
-        number.real = number.as_number
 
         return number
 
+    @staticmethod
+    def of(value: int | float) -> 'Number':
+        """
+        Wraps a machine number (e.g. the result of an arithmetic operation); small integers are shared
+        """
+        if type(value) is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            return SMALL_INTS[value - SMALL_INT_MIN]
+
+        number = _new(Number)
+        number.real = value
+
+        return number
+
+_new = object.__new__
+""" Creates an instance without running `__init__`; used on hot paths that set every slot themselves """
+
+SMALL_INT_MIN: int = -5
+SMALL_INT_MAX: int = 256
+SMALL_INTS: tuple[Number, ...] = tuple(Number(x) for x in range(SMALL_INT_MIN, SMALL_INT_MAX + 1))
+""" Shared instances of the integers from `SMALL_INT_MIN` to `SMALL_INT_MAX` (counters, indices, flags) """
+
 def parse_number(number: str) -> int | float:
-    if not re.findall(Number.number_regex, number):
+    if not Number.number_regex.search(number):
         return False
 
-    if "e" in number:
+    if "e" in number or "E" in number:
         return float(number)
     elif "." in number:
         return float(number)
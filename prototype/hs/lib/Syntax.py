@@ -0,0 +1,280 @@
+from hs.lib.Symbols.Tokens import LineRange
+from hs.lib.Symbols.Types import Primitive
+
+class Node:
+    __slots__ = ("range",)
+
+    def __init__(self, range: LineRange = None):
+        """
+        Base node of the abstract syntax tree
+
+        Attributes:
+            range (LineRange): Where the node starts in the source code.
+        """
+        self.range: LineRange = range
+
+    def __repr__(self) -> str:
+        slots = [x for cls in reversed(type(self).__mro__) for x in getattr(cls, "__slots__", ()) if x != "range"]
+        fields = ", ".join(f"{x}={getattr(self, x)!r}" for x in slots)
+        return f"{type(self).__name__}({fields})"
+
+#################################################################################
+###                                                                           ###
+###                              [ Statements: ]                              ###
+###                                                                           ###
+#################################################################################
+
+class Block(Node):
+    __slots__ = ("statements", "first_slot", "slot_count")
+
+    def __init__(self, statements: list[Node], range: LineRange = None):
+        """
+        A `{ ... }` block (or a whole program); its statements are parsed once, together with the block
+
+        Attributes:
+            first_slot (int): First frame slot of the variables declared directly in this block (set by `Resolver`).
+            slot_count (int): Number of variables declared directly in this block; their slots are cleared when the
+                block exits.
+        """
+        super().__init__(range)
+        self.statements: list[Node] = statements
+        self.first_slot: int = 0
+        self.slot_count: int = 0
+
+class Program(Block):
+    __slots__ = ("frame_size",)
+
+    def __init__(self, statements: list[Node], range: LineRange = None):
+        """
+        Attributes:
+            frame_size (int): Number of frame slots needed to run the program (set by `Resolver`).
+        """
+        super().__init__(statements, range)
+        self.frame_size: int = 0
+
+class Declaration(Node):
+    __slots__ = ("scope", "name", "value", "depth", "slot")
+
+    def __init__(self, scope: str, name: str, value: Node, range: LineRange = None):
+        """
+        `let name = value;` or `const name = value;`
+
+        Attributes:
+            scope (str): "LET" or "CONST".
+            depth (int): Block nesting depth of the declaration; 0 for the program's own variables, which are also
+                published to `InterpreterContext.globals` (set by `Resolver`).
+            slot (int): Frame slot holding the variable (set by `Resolver`).
+        """
+        super().__init__(range)
+        self.scope: str = scope
+        self.name: str = name
+        self.value: Node = value
+        self.depth: int = 0
+        self.slot: int = None
+
+class Assignment(Node):
+    __slots__ = ("name", "operator", "value", "slot")
+
+    def __init__(self, name: str, operator: str, value: Node, range: LineRange = None):
+        """
+        `name = value;`
+
+        Attributes:
+            slot (int): Frame slot of the variable; `None` if no enclosing block declares it (set by `Resolver`).
+        """
+        super().__init__(range)
+        self.name: str = name
+        self.operator: str = operator
+        self.value: Node = value
+        self.slot: int = None
+
+class Stdout(Node):
+    __slots__ = ("value",)
+
+    def __init__(self, value: Node, range: LineRange = None):
+        """
+        `stdout value;`
+        """
+        super().__init__(range)
+        self.value: Node = value
+
+class Stdflush(Node):
+    """ `stdflush;` """
+    __slots__ = ()
+
+class If(Node):
+    __slots__ = ("branches", "otherwise")
+
+    def __init__(self, branches: list[tuple[Node, Block]], otherwise: Block = None, range: LineRange = None):
+        """
+        `if (...) { ... } elif (...) { ... } else { ... }`
+
+        Attributes:
+            branches (list[tuple[Node, Block]]): The condition and block of the `if` and of every `elif`.
+            otherwise (Block): The `else` block, if any.
+        """
+        super().__init__(range)
+        self.branches: list[tuple[Node, Block]] = branches
+        self.otherwise: Block = otherwise
+
+class While(Node):
+    __slots__ = ("condition", "body")
+
+    def __init__(self, condition: Node, body: Block, range: LineRange = None):
+        """
+        `while (...) { ... }`
+        """
+        super().__init__(range)
+        self.condition: Node = condition
+        self.body: Block = body
+
+class Try(Node):
+    __slots__ = ("body", "handler")
+
+    def __init__(self, body: Block, handler: Block, range: LineRange = None):
+        """
+        `try { ... } catch { ... }`; `handler` runs if `body` raises an error
+        """
+        super().__init__(range)
+        self.body: Block = body
+        self.handler: Block = handler
+
+class Transaction(Node):
+    __slots__ = ("body",)
+
+    def __init__(self, body: Block, range: LineRange = None):
+        """
+        `transaction { ... }` (or `atomic { ... }`); changes to variables made by `body` are rolled back by
+        `rollback;` or by an error leaving the block, and kept otherwise
+        """
+        super().__init__(range)
+        self.body: Block = body
+
+class EndTransaction(Node):
+    __slots__ = ("rollback",)
+
+    def __init__(self, rollback: bool, range: LineRange = None):
+        """
+        `commit;` or `rollback;`; ends the innermost transaction, keeping or undoing its changes
+        """
+        super().__init__(range)
+        self.rollback: bool = rollback
+
+class FunctionDeclaration(Node):
+    __slots__ = ("name", "parameters", "body", "decorators")
+
+    def __init__(self, name: str, parameters: str, body: Block, decorators: list[str] = None, range: LineRange = None):
+        """
+        `function name(parameters) { ... }`; functions are declared but cannot be called yet
+
+        Attributes:
+            parameters (str): The raw parameter list.
+            decorators (list[str]): Names of the decorators preceding the declaration.
+        """
+        super().__init__(range)
+        self.name: str = name
+        self.parameters: str = parameters
+        self.body: Block = body
+        self.decorators: list[str] = decorators or []
+
+class ExpressionStatement(Node):
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: Node, range: LineRange = None):
+        super().__init__(range)
+        self.expression: Node = expression
+
+class Pass(Node):
+    """ `...`; a placeholder statement that does nothing """
+    __slots__ = ()
+
+#################################################################################
+###                                                                           ###
+###                             [ Expressions: ]                              ###
+###                                                                           ###
+#################################################################################
+
+class Literal(Node):
+    __slots__ = ("value",)
+
+    def __init__(self, value: Primitive, range: LineRange = None):
+        super().__init__(range)
+        self.value: Primitive = value
+
+class Name(Node):
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, range: LineRange = None):
+        """
+        Attributes:
+            slot (int): Frame slot of the variable; `None` if no enclosing block declares it (set by `Resolver`).
+        """
+        super().__init__(range)
+        self.name: str = name
+        self.slot: int = None
+
+class Unary(Node):
+    __slots__ = ("operator", "operand", "function")
+
+    def __init__(self, operator: str, operand: Node, function: callable, range: LineRange = None):
+        """
+        `!operand`, `-operand` or `+operand`
+
+        Attributes:
+            function (callable): Implementation of the operator (see `Operands.Unary`); resolved once when parsing.
+        """
+        super().__init__(range)
+        self.operator: str = operator
+        self.operand: Node = operand
+        self.function: callable = function
+
+class Binary(Node):
+    __slots__ = ("operator", "left", "right", "function")
+
+    def __init__(self, operator: str, left: Node, right: Node, function: callable, range: LineRange = None):
+        """
+        `left operator right` for arithmetic and comparison operators
+
+        Attributes:
+            function (callable): Implementation of the operator (see `Operands.Binary`); resolved once when parsing.
+        """
+        super().__init__(range)
+        self.operator: str = operator
+        self.left: Node = left
+        self.right: Node = right
+        self.function: callable = function
+
+class Logical(Node):
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, operator: str, left: Node, right: Node, range: LineRange = None):
+        """
+        `left && right` or `left || right`; evaluates to the operand that decides the result, and only evaluates
+        `right` if needed
+        """
+        super().__init__(range)
+        self.operator: str = operator
+        self.left: Node = left
+        self.right: Node = right
+
+class ArrayLiteral(Node):
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: list[Node], range: LineRange = None):
+        """
+        `[element, ...]`; evaluates to an `Array`
+        """
+        super().__init__(range)
+        self.elements: list[Node] = elements
+
+class Conditional(Node):
+    __slots__ = ("condition", "consequent", "alternative")
+
+    def __init__(self, condition: Node, consequent: Node, alternative: Node, range: LineRange = None):
+        """
+        `condition ? consequent : alternative`
+        """
+        super().__init__(range)
+        self.condition: Node = condition
+        self.consequent: Node = consequent
+        self.alternative: Node = alternative
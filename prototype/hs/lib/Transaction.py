@@ -0,0 +1,115 @@
+from hs.lib.Common import Common
+from hs.lib.Persistent import PersistentMap
+
+class Snapshot:
+    __slots__ = ("globals", "replaced", "first_slot", "tries", "epoch")
+
+    def __init__(self, globals: PersistentMap, first_slot: int, tries: int, epoch: int):
+        """
+        The variables as they were when a transaction began
+
+        Attributes:
+            globals (PersistentMap): The variables by name; the map itself, shared rather than copied.
+            replaced (list[tuple[int, GlobalEntry]]): Frame slot and former entry of every variable the
+                transaction replaced (see `Transactions.writable`); a rollback puts them back.
+            first_slot (int): First frame slot of the transaction's block; slots from there on are declared
+                inside the transaction.
+            tries (int): Number of `try` blocks active in the virtual machine when the transaction began.
+            epoch (int): Version given to the entries copied during the transaction.
+        """
+        self.globals: PersistentMap = globals
+        self.replaced: list[tuple[int, Common.GlobalEntry]] = []
+        self.first_slot: int = first_slot
+        self.tries: int = tries
+        self.epoch: int = epoch
+
+class TransactionExit(Exception):
+    def __init__(self, rollback: bool):
+        """
+        Raised by `commit;` and `rollback;` in the tree-walking interpreter; ends the innermost transaction
+        """
+        super().__init__()
+        self.rollback: bool = rollback
+
+class Transactions:
+    __slots__ = ("globals", "open", "epoch", "_epochs")
+
+    def __init__(self, globals: Common.GlobalList):
+        """
+        Transactions (`transaction { ... }`) open in a run, innermost last
+
+        Outside of transactions, variables are changed in place. Inside one, the first assignment to a variable
+        replaces its entry by a copy (see `writable`), so the entries a snapshot refers to never change: beginning
+        a transaction and rolling it back are O(1) in the number of variables, and a commit simply keeps the
+        current state
+
+        Attributes:
+            epoch (int): Epoch of the innermost open transaction; 0 if none is open.
+        """
+        self.globals: Common.GlobalList = globals
+        self.open: list[Snapshot] = []
+        self.epoch: int = 0
+        self._epochs: int = 0
+
+    def begin(self, first_slot: int, tries: int = 0) -> None:
+        self._epochs += 1
+        self.epoch = self._epochs
+        self.open.append(Snapshot(self.globals.snapshot(), first_slot, tries, self.epoch))
+
+    def commit(self) -> Snapshot:
+        snapshot = self.open.pop()
+        if self.open:
+            # Rolling back the enclosing transaction also undoes this one
+            outer = self.open[-1]
+            outer.replaced.extend(x for x in snapshot.replaced if x[0] < outer.first_slot)
+
+        self.epoch = self.open[-1].epoch if self.open else 0
+
+        return snapshot
+
+    def rollback(self, frame: list[Common.GlobalEntry]) -> Snapshot:
+        snapshot = self.open.pop()
+        for slot,entry in reversed(snapshot.replaced):
+            frame[slot] = entry
+
+        self.globals.restore(snapshot.globals)
+        self.epoch = self.open[-1].epoch if self.open else 0
+
+        return snapshot
+
+    def unwind(self, depth: int, frame: list[Common.GlobalEntry]) -> None:
+        """
+        Rolls back every transaction opened after the first `depth` ones (e.g. when an error leaves them)
+        """
+        while len(self.open) > depth:
+            self.rollback(frame)
+
+    def writable(self, frame: list[Common.GlobalEntry], slot: int) -> Common.GlobalEntry:
+        """
+        The entry of the variable in frame slot `slot`, copied first if the innermost transaction's snapshot may
+        refer to it; only called while a transaction is open
+        """
+        entry = frame[slot]
+        snapshot = self.open[-1]
+        if entry.version == self.epoch or slot >= snapshot.first_slot:
+            return entry
+
+        copy = frame[slot] = entry.copy(self.epoch)
+        snapshot.replaced.append((slot, entry))
+        if self.globals.get(entry.key) is entry: # Declared by the program; also published by name
+            self.globals.rebind(entry.key, copy)
+
+        return copy
+
+    def writable_global(self, name: str) -> Common.GlobalEntry:
+        """
+        Same as `writable`, for a variable only known by name
+        """
+        entry = self.globals.get(name)
+        if entry.version == self.epoch:
+            return entry
+
+        copy = entry.copy(self.epoch)
+        self.globals.rebind(name, copy)
+
+        return copy
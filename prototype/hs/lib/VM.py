@@ -0,0 +1,196 @@
+from hs.lib.Compiler import Opcode,Bytecode,BinaryFunctions,SlotDeclaration
+from hs.lib.Common import Common
+from hs.lib.Context import InterpreterContext
+from hs.lib.ErrorReferences import ScriptError
+from hs.lib.Operands import Operands
+from hs.lib.Symbols.Types import Primitive
+from hs.lib.Symbols.Array import Array
+from hs.lib.Transaction import Transactions
+
+# Plain integers; comparing against `Opcode` members would go through `IntEnum.__eq__` on every instruction
+LOAD_CONST = int(Opcode.LOAD_CONST)
+LOAD_LOCAL = int(Opcode.LOAD_LOCAL)
+LOAD_NAME = int(Opcode.LOAD_NAME)
+STORE_LOCAL = int(Opcode.STORE_LOCAL)
+STORE_NAME = int(Opcode.STORE_NAME)
+DECLARE = int(Opcode.DECLARE)
+DROP_SLOTS = int(Opcode.DROP_SLOTS)
+UNARY_NOT = int(Opcode.UNARY_NOT)
+UNARY_NEGATIVE = int(Opcode.UNARY_NEGATIVE)
+UNARY_POSITIVE = int(Opcode.UNARY_POSITIVE)
+POP_TOP = int(Opcode.POP_TOP)
+JUMP = int(Opcode.JUMP)
+JUMP_IF_FALSE = int(Opcode.JUMP_IF_FALSE)
+JUMP_IF_FALSE_OR_POP = int(Opcode.JUMP_IF_FALSE_OR_POP)
+JUMP_IF_TRUE_OR_POP = int(Opcode.JUMP_IF_TRUE_OR_POP)
+SETUP_TRY = int(Opcode.SETUP_TRY)
+POP_TRY = int(Opcode.POP_TRY)
+BUILD_ARRAY = int(Opcode.BUILD_ARRAY)
+BEGIN_TRANSACTION = int(Opcode.BEGIN_TRANSACTION)
+END_TRANSACTION = int(Opcode.END_TRANSACTION)
+STDOUT = int(Opcode.STDOUT)
+STDFLUSH = int(Opcode.STDFLUSH)
+RETURN = int(Opcode.RETURN)
+BINARY_LAST = int(max(Opcode.BINARY_ADD, Opcode.COMPARE_GREATER_EQUAL))
+
+class VirtualMachine:
+    def __init__(self, context: InterpreterContext):
+        """
+        Stack machine running `Bytecode` against the variables and output stream of `context`
+
+        Attributes:
+            frame (list[GlobalEntry]): Variables of the running program, by slot (see `Resolver`).
+            transactions (Transactions): Open `transaction` blocks.
+        """
+        self.context: InterpreterContext = context
+        self.frame: list[Common.GlobalEntry] = []
+        self.transactions: Transactions = Transactions(context.globals)
+
+    def run(self, bytecode: Bytecode) -> None:
+        code = bytecode.code
+        constants = bytecode.constants
+        names = bytecode.names
+        declarations = bytecode.declarations
+        frame = self.frame = [None] * bytecode.frame_size
+        empty = [None] * bytecode.frame_size
+        binary = BinaryFunctions
+        stack: list[Primitive] = []
+        push = stack.append
+        pop = stack.pop
+        tries: list[tuple[int, int, int]] = [] # (handler, stack depth, open transactions) of every active `try`
+        transactions = self.transactions
+        pc = 0
+
+        while True:
+            try:
+                while True:
+                    opcode = code[pc]
+                    argument = code[pc + 1]
+                    pc += 2
+
+                    if opcode == LOAD_LOCAL:
+                        push(frame[argument].value)
+                    elif opcode == LOAD_CONST:
+                        push(constants[argument])
+                    elif opcode <= BINARY_LAST:
+                        right = pop()
+                        stack[-1] = binary[opcode](stack[-1], right)
+                    elif opcode == STORE_LOCAL:
+                        self.store_local(argument, pop())
+                    elif opcode == JUMP_IF_FALSE:
+                        if not pop().boolean():
+                            pc = argument
+                    elif opcode == JUMP:
+                        pc = argument
+                    elif opcode == STDOUT:
+                        self.stdout(pop())
+                    elif opcode == DECLARE:
+                        self.declare(declarations[argument], pop())
+                    elif opcode == DROP_SLOTS:
+                        frame[argument:] = empty[argument:]
+                    elif opcode == LOAD_NAME:
+                        push(self.load(names[argument]))
+                    elif opcode == STORE_NAME:
+                        self.store(names[argument], pop())
+                    elif opcode == JUMP_IF_FALSE_OR_POP:
+                        if not stack[-1].boolean():
+                            pc = argument
+                        else:
+                            pop()
+                    elif opcode == JUMP_IF_TRUE_OR_POP:
+                        if stack[-1].boolean():
+                            pc = argument
+                        else:
+                            pop()
+                    elif opcode == UNARY_NOT:
+                        stack[-1] = Operands.XNOT(stack[-1])
+                    elif opcode == UNARY_NEGATIVE:
+                        stack[-1] = Operands.XNEGATE(stack[-1])
+                    elif opcode == UNARY_POSITIVE:
+                        stack[-1] = Operands.XPLUS(stack[-1])
+                    elif opcode == POP_TOP:
+                        pop()
+                    elif opcode == SETUP_TRY:
+                        tries.append((argument, len(stack), len(transactions.open)))
+                    elif opcode == POP_TRY:
+                        tries.pop()
+                    elif opcode == BUILD_ARRAY:
+                        elements = stack[len(stack) - argument:]
+                        del stack[len(stack) - argument:]
+                        push(Array.from_primitives(elements))
+                    elif opcode == BEGIN_TRANSACTION:
+                        transactions.begin(argument, len(tries))
+                    elif opcode == END_TRANSACTION:
+                        snapshot = transactions.rollback(frame) if argument else transactions.commit()
+                        del tries[snapshot.tries:] # Left by `commit;` or `rollback;`
+                    elif opcode == STDFLUSH:
+                        self.context.stdout.flush()
+                    elif opcode == RETURN:
+                        return
+                    else:
+                        raise ValueError(f"Unknown opcode: {opcode}")
+
+            except ScriptError:
+                if not tries:
+                    transactions.unwind(0, frame)
+                    raise
+
+                pc,depth,opened = tries.pop()
+                del stack[depth:]
+                transactions.unwind(opened, frame)
+
+    def load(self, name: str) -> Primitive:
+        entry = self.context.globals.get(name)
+        if not entry:
+            raise ScriptError(reference = "x0009", variable_name = name)
+
+        return entry.value
+
+    def declare(self, declaration: SlotDeclaration, value: Primitive) -> None:
+        if not declaration.publish:
+            self.frame[declaration.slot] = Common.GlobalEntry(declaration.name, value, type(value), declaration.scope)
+            return
+
+        globals = self.context.globals
+        if globals.contains(declaration.name):
+            raise ScriptError(reference = "x0002")
+
+        globals.set(declaration.name, key = declaration.name, value = value, type = type(value), scope = declaration.scope)
+        self.frame[declaration.slot] = globals.get(declaration.name)
+
+    def store_local(self, slot: int, value: Primitive) -> None:
+        entry = self.frame[slot]
+        self.check_store(entry, value)
+        if self.transactions.epoch:
+            entry = self.transactions.writable(self.frame, slot)
+
+        entry.assign(value)
+
+    def check_store(self, entry: Common.GlobalEntry, value: Primitive) -> None:
+        if entry.scope == "CONST":
+            raise ScriptError(reference = "x0006", variable_name = entry.key)
+
+        if entry.strict and not isinstance(value, entry.type):
+            raise ScriptError(
+                reference = "x0007",
+                variable_name = entry.key,
+                variable_type = value.string_identifier,
+                target_type = entry.type.string_identifier
+            )
+
+    def store(self, name: str, value: Primitive) -> None:
+        entry = self.context.globals.get(name)
+        if entry is None:
+            raise ScriptError(reference = "x0005", variable_name = name)
+
+        self.check_store(entry, value)
+        if self.transactions.epoch:
+            entry = self.transactions.writable_global(name)
+
+        entry.assign(value)
+
+    def stdout(self, value: Primitive) -> None:
+        value = value.toString()
+        self.context.stdout.write(f"{self.context.name} >> " + value)
+        if value.endswith("\n"):
+            self.context.stdout.flush()
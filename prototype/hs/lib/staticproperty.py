@@ -17,4 +17,6 @@ class staticproperty(property):
     """
 
     def __get__(self, cls, owner):
-        return classmethod(self.fget).__get__(None, owner)()
\ No newline at end of file
+        # The getter receives the class, like a `classmethod`; it is called directly rather than through a new
+        # `classmethod` object on every access. Values that never change should be plain class attributes instead
+        return self.fget(owner)
\ No newline at end of file